@@ -1,16 +1,59 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.api.security import security
 from app.depends import AsyncSession, provider
-from app.domain.services.bookings import BookingParams, booking_service
+from app.domain.services.bookings import (
+    BookingCursor,
+    BookingParams,
+    BookingScope,
+    BulkBookingItem,
+    booking_service,
+)
+from app.domain.services.bookings.booking import DEFAULT_PAGE_SIZE
 from app.infrastructure.database import Booking, Customer, Resource, User
 
-from .schema import BookingCreate, BookingResponse
+from .export import router as export_router
+from .recurring import router as recurring_router
+from .schema import (
+    BookingBulkCreate,
+    BookingBulkItemResult,
+    BookingBulkResponse,
+    BookingCreate,
+    BookingListResponse,
+    BookingResponse,
+)
 
 router = APIRouter(tags=["Bookings"], prefix="/bookings")
+router.include_router(export_router)
+router.include_router(recurring_router)
+
+MAX_PAGE_SIZE = 100
+
+
+class BookingListQueryParams:
+    """Query params for bookings list; grouped to satisfy linting argument limit."""
+
+    def __init__(
+        self,
+        scope: Annotated[
+            BookingScope,
+            Query(description="upcoming - not finished yet, past - finished"),
+        ] = BookingScope.UPCOMING,
+        cursor: Annotated[
+            str | None,
+            Query(description="next_cursor or prev_cursor from previous page"),
+        ] = None,
+        limit: Annotated[
+            int,
+            Query(ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+        ] = DEFAULT_PAGE_SIZE,
+    ):
+        self.scope = scope
+        self.cursor = cursor
+        self.limit = limit
 
 
 @router.post(
@@ -86,23 +129,84 @@ async def create_booking(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=BookingBulkResponse,
+    summary="Create many bookings",
+    description="Create a batch of bookings in one transaction. Items are "
+    "checked against each other and existing bookings; the response reports "
+    "the result of every item",
+    responses={
+        200: {"description": "Per-item results"},
+        403: {"description": "Customer not found"},
+    },
+)
+async def create_bookings_bulk(
+    data: BookingBulkCreate,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Create many bookings, rejecting invalid or conflicting items."""
+    # Verify customer exists
+    customer = await Customer.get(id=data.customer_id, session=session)
+    if not customer:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Customer not found",
+        )
+
+    results = await booking_service.create_bookings_bulk(
+        user_id=current_user.id,
+        customer_id=data.customer_id,
+        items=[
+            BulkBookingItem(
+                resource_id=item.resource_id,
+                start_time=item.start_time,
+                end_time=item.end_time,
+            )
+            for item in data.items
+        ],
+        source="api_bulk",
+        session=session,
+    )
+
+    return BookingBulkResponse(
+        created=sum(result.booking is not None for result in results),
+        results=[
+            BookingBulkItemResult(
+                index=result.index,
+                booking=BookingResponse(
+                    **result.booking.to_dict(),
+                    resource_name=result.resource_name,
+                )
+                if result.booking
+                else None,
+                error=result.error,
+            )
+            for result in results
+        ],
+    )
+
+
 @router.get(
     "/",
-    response_model=list[BookingResponse],
+    response_model=BookingListResponse,
     summary="Get user's bookings",
-    description="Get all bookings for the current user within a customer",
+    description="Get a page of bookings for the current user within a customer. "
+    "Use next_cursor/prev_cursor from the response to move between pages",
     responses={
-        200: {"description": "List of bookings"},
-        400: {"description": "Missing required customer_id parameter"},
+        200: {"description": "Page of bookings"},
+        400: {"description": "Invalid cursor"},
         403: {"description": "Customer not found"},
     },
 )
 async def list_user_bookings(
     customer_id: UUID,
+    params: Annotated[BookingListQueryParams, Depends()],
     current_user: Annotated[User, Depends(security.get_current_user)],
-    session: Annotated[AsyncSession, Depends(provider.get_session)],
+    session: Annotated[AsyncSession, Depends(provider.get_read_session)],
 ):
-    """Get all bookings for the current user."""
+    """Get a page of bookings for the current user."""
     # Verify customer exists
     customer = await Customer.get(id=customer_id, session=session)
     if not customer:
@@ -111,25 +215,28 @@ async def list_user_bookings(
             detail="Customer not found",
         )
 
-    # Get all bookings for user in this customer
-    bookings = await booking_service.get_user_bookings(
+    try:
+        cursor = BookingCursor.decode(params.cursor) if params.cursor else None
+    except ValueError as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(err),
+        ) from err
+
+    page = await booking_service.get_user_bookings_page(
         user_id=current_user.id,
         customer_id=customer_id,
+        scope=params.scope,
+        cursor=cursor,
+        limit=params.limit,
         session=session,
     )
 
-    # Enrich with resource names
-    result = []
-    for booking in bookings:
-        resource = await Resource.get(id=booking.resource_id, session=session)
-        result.append(
-            BookingResponse(
-                **booking.to_dict(),
-                resource_name=resource.name if resource else None,
-            ),
-        )
-
-    return result
+    return BookingListResponse(
+        bookings=[BookingResponse.model_validate(booking) for booking in page.items],
+        next_cursor=page.next_cursor.encode() if page.next_cursor else None,
+        prev_cursor=page.prev_cursor.encode() if page.prev_cursor else None,
+    )
 
 
 @router.delete(
@@ -0,0 +1,181 @@
+"""
+GET /api/bookings/export - stream bookings of a customer as NDJSON or CSV.
+
+Rows are read from the database with a server-side cursor and serialized in
+chunks, so memory usage does not grow with the size of the export.
+"""
+
+from collections.abc import AsyncIterator, Callable
+import csv
+from datetime import datetime
+from enum import StrEnum
+import io
+import json
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+import sqlalchemy as sa
+
+from app.api.security import security
+from app.depends import AsyncSession, provider
+from app.domain.services.bookings import BookingExportFilters, booking_service
+from app.domain.services.resource import resource_service
+from app.infrastructure.database import User
+
+router = APIRouter()
+
+# Rows serialized into one chunk of the response body
+EXPORT_CHUNK_ROWS = 500
+EXPORT_COLUMNS = (
+    "id",
+    "resource_id",
+    "resource_name",
+    "user_id",
+    "start_time",
+    "end_time",
+    "created_at",
+)
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+class BookingExportQueryParams:
+    """Query params for export; grouped to satisfy linting argument limit."""
+
+    def __init__(
+        self,
+        customer_id: Annotated[UUID, Query(description="Customer to export")],
+        export_format: Annotated[
+            ExportFormat,
+            Query(alias="format", description="ndjson or csv"),
+        ] = ExportFormat.NDJSON,
+        start: Annotated[
+            datetime | None,
+            Query(description="Only bookings ending after this time"),
+        ] = None,
+        end: Annotated[
+            datetime | None,
+            Query(description="Only bookings starting before this time"),
+        ] = None,
+        resource_id: Annotated[
+            int | None,
+            Query(description="Only bookings of this resource"),
+        ] = None,
+    ):
+        self.customer_id = customer_id
+        self.export_format = export_format
+        self.start = start
+        self.end = end
+        self.resource_id = resource_id
+
+
+def _to_primitive(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _ndjson_chunk(rows: list[sa.Row]) -> str:
+    return "".join(
+        json.dumps(
+            dict(zip(EXPORT_COLUMNS, map(_to_primitive, row), strict=True)),
+            ensure_ascii=False,
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+def _csv_chunk(rows: list[sa.Row]) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(map(_to_primitive, row) for row in rows)
+    return buffer.getvalue()
+
+
+async def _serialize(
+    rows: AsyncIterator[sa.Row],
+    export_format: ExportFormat,
+) -> AsyncIterator[str]:
+    serialize: Callable[[list[sa.Row]], str]
+    if export_format == ExportFormat.CSV:
+        serialize = _csv_chunk
+        yield ",".join(EXPORT_COLUMNS) + "\r\n"
+    else:
+        serialize = _ndjson_chunk
+
+    chunk: list[sa.Row] = []
+    async for row in rows:
+        chunk.append(row)
+        if len(chunk) >= EXPORT_CHUNK_ROWS:
+            yield serialize(chunk)
+            chunk = []
+    if chunk:
+        yield serialize(chunk)
+
+
+@router.get(
+    "/export",
+    summary="Export customer bookings",
+    description="Stream all bookings of a customer as NDJSON or CSV. "
+    "Available only to customer owners and admins",
+    responses={
+        200: {"description": "Streamed bookings"},
+        400: {"description": "Invalid time range"},
+        403: {"description": "Available only to administrators"},
+    },
+    response_class=StreamingResponse,
+)
+async def export_bookings(
+    params: Annotated[BookingExportQueryParams, Depends()],
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_read_session)],
+):
+    if not await resource_service.is_admin_or_owner(
+        user_id=current_user.id,
+        customer_id=params.customer_id,
+        session=session,
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Available only to administrators",
+        )
+
+    if any(dt is not None and dt.tzinfo is None for dt in (params.start, params.end)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start and end must be timezone-aware datetimes",
+        )
+    if params.start and params.end and params.end <= params.start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="End time must be after start time",
+        )
+
+    rows = booking_service.iter_customer_bookings(
+        filters=BookingExportFilters(
+            customer_id=params.customer_id,
+            start=params.start,
+            end=params.end,
+            resource_id=params.resource_id,
+        ),
+    )
+    filename = f"bookings_{params.customer_id}.{params.export_format}"
+    return StreamingResponse(
+        _serialize(rows, params.export_format),
+        media_type=MEDIA_TYPES[params.export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,107 @@
+"""
+POST /api/bookings/recurring - create a repeating booking from an RRULE.
+DELETE /api/bookings/recurring/{series_id} - cancel the series.
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api.security import security
+from app.depends import AsyncSession, provider
+from app.domain.services.bookings import (
+    RecurringBookingParams,
+    recurring_booking_service,
+)
+from app.infrastructure.database import Customer, User
+
+from .schema import RecurringBookingCreate, RecurringBookingResponse
+
+router = APIRouter(prefix="/recurring")
+
+
+@router.post(
+    "/",
+    response_model=RecurringBookingResponse,
+    summary="Create a recurring booking",
+    description="Create a booking repeating by an RRULE (FREQ=DAILY|WEEKLY, "
+    "INTERVAL, BYDAY, COUNT or UNTIL). start_time/end_time are the first "
+    "occurrence",
+    responses={
+        200: {"description": "Recurring booking created"},
+        400: {"description": "Invalid rule or resource not available"},
+        403: {"description": "Customer not found"},
+    },
+)
+async def create_recurring_booking(
+    data: RecurringBookingCreate,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Create a recurring booking with conflict detection for every occurrence."""
+    # Verify customer exists
+    customer = await Customer.get(id=data.customer_id, session=session)
+    if not customer:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Customer not found",
+        )
+
+    try:
+        series = await recurring_booking_service.create_recurring_booking(
+            params=RecurringBookingParams(
+                user_id=current_user.id,
+                customer_id=data.customer_id,
+                resource_id=data.resource_id,
+                start_time=data.start_time,
+                end_time=data.end_time,
+                rule=data.rule,
+                timezone=data.timezone,
+            ),
+            session=session,
+        )
+    except (KeyError, ValueError) as err:
+        # ZoneInfo raises a KeyError subclass for unknown zones
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid rule or timezone: {err}",
+        ) from err
+
+    if not series:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Resource is not available for some of the occurrences",
+        )
+
+    return RecurringBookingResponse(
+        **series.to_dict(),
+        end_time=series.dtstart + series.duration,
+    )
+
+
+@router.delete(
+    "/{series_id}",
+    summary="Cancel a recurring booking",
+    description="Delete the series and its future occurrences",
+    responses={
+        200: {"description": "Recurring booking cancelled"},
+        403: {"description": "Recurring booking not found or not yours"},
+    },
+)
+async def cancel_recurring_booking(
+    series_id: int,
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_session)],
+):
+    """Cancel a recurring booking."""
+    success = await recurring_booking_service.cancel_recurring_booking(
+        series_id=series_id,
+        user_id=current_user.id,
+        session=session,
+    )
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Recurring booking not found or does not belong to you",
+        )
+    return {"message": "Recurring booking cancelled successfully"}
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from app.domain.services.bookings.booking import MAX_BULK_BOOKINGS
+
 
 class BookingCreate(BaseModel):
     """Schema for creating a new booking."""
@@ -16,6 +18,29 @@ class BookingCreate(BaseModel):
     end_time: datetime = Field(..., description="Booking end time (ISO format)")
 
 
+class BookingBulkItem(BaseModel):
+    """Schema for one booking of a bulk request."""
+
+    resource_id: int = Field(..., description="ID of the resource to book")
+    start_time: datetime = Field(..., description="Booking start time (ISO format)")
+    end_time: datetime = Field(..., description="Booking end time (ISO format)")
+
+
+class BookingBulkCreate(BaseModel):
+    """Schema for creating many bookings at once."""
+
+    customer_id: UUID = Field(
+        ...,
+        description="ID of the customer who owns the resources",
+    )
+    items: list[BookingBulkItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_BOOKINGS,
+        description="Bookings to create; earlier items win conflicts",
+    )
+
+
 class BookingResponse(BaseModel):
     """Schema for booking response."""
 
@@ -34,3 +59,59 @@ class BookingListResponse(BaseModel):
     """Schema for booking list response."""
 
     bookings: list[BookingResponse]
+    next_cursor: str | None = Field(
+        None,
+        description="Pass as cursor to get the next page",
+    )
+    prev_cursor: str | None = Field(
+        None,
+        description="Pass as cursor to get the previous page",
+    )
+
+
+class BookingBulkItemResult(BaseModel):
+    """Schema for the result of one bulk item."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    booking: BookingResponse | None = None
+    error: str | None = Field(
+        None,
+        description="Rejection reason: invalid_time_range, naive_datetime, "
+        "in_past, too_far, resource_not_found or conflict",
+    )
+
+
+class BookingBulkResponse(BaseModel):
+    """Schema for bulk booking response."""
+
+    created: int
+    results: list[BookingBulkItemResult]
+
+
+class RecurringBookingCreate(BookingCreate):
+    """Schema for creating a recurring booking; times are the first occurrence."""
+
+    rule: str = Field(
+        ...,
+        max_length=255,
+        description="RRULE, e.g. FREQ=WEEKLY;BYDAY=MO,WE;COUNT=20",
+    )
+    timezone: str = Field(
+        "UTC",
+        max_length=64,
+        description="IANA timezone keeping the local time of occurrences",
+    )
+
+
+class RecurringBookingResponse(BaseModel):
+    """Schema for recurring booking response."""
+
+    id: int
+    user_id: UUID
+    resource_id: int
+    dtstart: datetime
+    end_time: datetime
+    rule: str
+    timezone: str
+    ends_at: datetime | None
+    created_at: datetime
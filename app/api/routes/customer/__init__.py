@@ -30,8 +30,9 @@ router = APIRouter(tags=["Customer"], prefix="/customers")
 async def get_customer(
     customer_id: uuid.UUID,
     current_user: Annotated[User, Depends(security.get_current_user)],  # noqa: ARG001
+    session: Annotated[AsyncSession, Depends(provider.get_read_session)],
 ):
-    customer = await Customer.get(id=customer_id)
+    customer = await Customer.get(id=customer_id, session=session)
     if customer:
         return CustomerModel.model_validate(customer, from_attributes=True)
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
@@ -77,7 +78,7 @@ async def create_customer(
 async def get_customer_admin(
     customer_id: uuid.UUID,
     current_user: Annotated[User, Depends(security.get_current_user)],
-    session: Annotated[AsyncSession, Depends(provider.get_session)],
+    session: Annotated[AsyncSession, Depends(provider.get_read_session)],
 ):
     admin_ids = await customer_service.get_admins_by_customer(
         current_user=current_user,
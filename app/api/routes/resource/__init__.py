@@ -5,6 +5,7 @@ Structure:
 - create.py  - POST   /api/resources       - create a resource
 - read.py    - GET    /api/resources       - list resources (admin only)
                GET    /api/resources/{id}  - get resource details
+- stats.py   - GET    /api/resources/{id}/stats - booking statistics
 - update.py  - PATCH  /api/resources/{id}  - partial update
 - delete.py  - DELETE /api/resources/{id}  - delete resource
 """
@@ -15,6 +16,7 @@ from .create import router as create_router
 from .delete import router as delete_router
 from .free_slots import router as free_slots_router
 from .read import router as read_router
+from .stats import router as stats_router
 from .update import router as update_router
 
 router = APIRouter(prefix="/resources", tags=["Resource"])
@@ -23,5 +25,6 @@ router = APIRouter(prefix="/resources", tags=["Resource"])
 router.include_router(create_router)
 router.include_router(read_router)
 router.include_router(free_slots_router)
+router.include_router(stats_router)
 router.include_router(update_router)
 router.include_router(delete_router)
@@ -34,6 +34,7 @@ async def create_resource(
         current_user=current_user,
         name=data.name,
         customer_id=data.customer_id,
+        capacity=data.capacity,
         session=session,
     )
 
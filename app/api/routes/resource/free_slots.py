@@ -72,7 +72,7 @@ async def get_free_slots(
     resource_id: int,
     params: Annotated[FreeSlotsQueryParams, Depends()],
     current_user: Annotated[User, Depends(security.get_current_user)],
-    session: Annotated[AsyncSession, Depends(provider.get_session)],
+    session: Annotated[AsyncSession, Depends(provider.get_read_session)],
 ):
     if params.date is not None:
         if params.start is not None or params.end is not None:
@@ -109,4 +109,11 @@ async def get_free_slots(
             detail="Resource not found or access denied",
         )
 
-    return [FreeSlotResponse(start_time=s, end_time=e) for (s, e) in slots]
+    return [
+        FreeSlotResponse(
+            start_time=slot.start,
+            end_time=slot.end,
+            remaining=slot.remaining,
+        )
+        for slot in slots
+    ]
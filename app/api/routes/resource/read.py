@@ -25,7 +25,7 @@ router = APIRouter()
 )
 async def list_resources(
     current_user: Annotated[User, Depends(security.get_current_user)],
-    session: Annotated[AsyncSession, Depends(provider.get_session)],
+    session: Annotated[AsyncSession, Depends(provider.get_read_session)],
     customer_id: UUID | None = None,
     skip: int = 0,
     limit: int = 100,
@@ -52,7 +52,7 @@ async def list_resources(
 async def read_resource(
     resource_id: int,
     current_user: Annotated[User, Depends(security.get_current_user)],
-    session: Annotated[AsyncSession, Depends(provider.get_session)],
+    session: Annotated[AsyncSession, Depends(provider.get_read_session)],
 ):
     """Get information about a specific resource by ID.
 
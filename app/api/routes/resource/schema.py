@@ -19,12 +19,18 @@ class ResourceCreate(BaseModel):
         max_length=255,
         description="Resource name",
     )
+    capacity: int = Field(
+        1,
+        ge=1,
+        description="Bookings allowed to overlap, e.g. desks in a zone",
+    )
 
 
 class ResourceUpdate(BaseModel):
     """Schema for partial resource update (PATCH /api/resources/{id})."""
 
     name: str | None = Field(None, min_length=1, max_length=255)
+    capacity: int | None = Field(None, ge=1)
 
 
 class ResourceResponse(BaseModel):
@@ -33,6 +39,7 @@ class ResourceResponse(BaseModel):
     id: int
     customer_id: uuid.UUID
     name: str
+    capacity: int
     created_at: datetime
 
     class Config:
@@ -44,3 +51,24 @@ class FreeSlotResponse(BaseModel):
 
     start_time: datetime = Field(..., description="Slot start time (ISO format)")
     end_time: datetime = Field(..., description="Slot end time (ISO format)")
+    remaining: int = Field(..., description="Seats left for the whole slot")
+
+
+class ResourceStatsResponse(BaseModel):
+    """Booking statistics of a resource over a period."""
+
+    resource_id: int
+    start: datetime
+    end: datetime
+    bookings: int = Field(..., description="Bookings overlapping the period")
+    users: int = Field(..., description="Distinct users who booked")
+    booked_seconds: float = Field(..., description="Booked time within the period")
+    utilization: float = Field(
+        ...,
+        description="Share of the period booked times capacity, 0..1",
+    )
+    avg_duration_seconds: float | None = None
+    avg_lead_time_seconds: float | None = Field(
+        None,
+        description="Average time between booking creation and start",
+    )
@@ -0,0 +1,89 @@
+"""
+GET /api/resources/{resource_id}/stats - booking statistics for resource.
+
+Defaults to the last 30 days. Per-resource numbers live here rather than in
+Prometheus labels, which are aggregated per customer.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.api.security import security
+from app.depends import AsyncSession, provider
+from app.domain.services.resource import resource_service
+from app.infrastructure.database.models.users import User  # noqa: TC001
+
+from .schema import ResourceStatsResponse
+
+router = APIRouter()
+
+DEFAULT_STATS_PERIOD = timedelta(days=30)
+
+
+class StatsQueryParams:
+    """Query params for resource stats; grouped to satisfy linting argument limit."""
+
+    def __init__(
+        self,
+        start: Annotated[
+            datetime | None,
+            Query(description="Period start (ISO datetime with timezone)"),
+        ] = None,
+        end: Annotated[
+            datetime | None,
+            Query(description="Period end (ISO datetime with timezone), default now"),
+        ] = None,
+    ):
+        self.start = start
+        self.end = end
+
+
+@router.get(
+    "/{resource_id}/stats",
+    response_model=ResourceStatsResponse,
+    summary="Get booking statistics for resource",
+)
+async def get_resource_stats(
+    resource_id: int,
+    params: Annotated[StatsQueryParams, Depends()],
+    current_user: Annotated[User, Depends(security.get_current_user)],
+    session: Annotated[AsyncSession, Depends(provider.get_read_session)],
+):
+    end = params.end or datetime.now(timezone.utc)
+    start = params.start or end - DEFAULT_STATS_PERIOD
+
+    try:
+        stats = await resource_service.get_resource_stats(
+            resource_id=resource_id,
+            current_user=current_user,
+            start=start,
+            end=end,
+            session=session,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    if stats is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resource not found or access denied",
+        )
+
+    return ResourceStatsResponse(
+        resource_id=resource_id,
+        start=stats.start,
+        end=stats.end,
+        bookings=stats.bookings,
+        users=stats.users,
+        booked_seconds=stats.booked_seconds,
+        utilization=stats.utilization,
+        avg_duration_seconds=stats.avg_duration_seconds,
+        avg_lead_time_seconds=stats.avg_lead_time_seconds,
+    )
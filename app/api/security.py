@@ -5,7 +5,7 @@ import uuid
 from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from app.depends import provider
+from app.context import set_current_user
 from app.infrastructure.database.models.users import User
 
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -36,7 +36,7 @@ class SecurityService:
             request=request,
             credentials=credentials,
         )
-        provider.set_current_user(user=user)
+        set_current_user(user)
         return user
 
     async def _get_current_user(
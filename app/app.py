@@ -11,6 +11,8 @@ from app.schedulers.scheduler import NotificationScheduler
 from .api import routes
 from .bot import bot_manager
 from .domain.services import user_service
+from .infrastructure.cache import cache_backend
+from .metrics import mark_worker_dead
 from .middlewares import LoggingMiddleware
 
 logging.basicConfig(
@@ -60,6 +62,7 @@ def get_application() -> FastAPI:
         responses=config.server.server_responces,
         swagger_ui_parameters=config.server.swagger_ui_parameters,
         on_startup=[
+            cache_backend.start,
             bot_manager.run_all,
             user_service.create_test_user,
             scheduler.start,
@@ -67,10 +70,12 @@ def get_application() -> FastAPI:
         on_shutdown=[
             bot_manager.stop_all,
             scheduler.stop,
+            cache_backend.stop,
+            mark_worker_dead,
         ],
     )
 
-    application.middleware("http")(LoggingMiddleware())
+    application.add_middleware(LoggingMiddleware)
     for route in routes:
         application.include_router(route, prefix="/api")
 
@@ -0,0 +1,9 @@
+from .data import BookingCallback, BookingPageCallback, NavCallback
+from .router import CallbackRouter
+
+__all__ = [
+    "BookingCallback",
+    "BookingPageCallback",
+    "CallbackRouter",
+    "NavCallback",
+]
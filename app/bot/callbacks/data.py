@@ -0,0 +1,27 @@
+"""Typed callback data factories for inline keyboards.
+
+Every factory has an ``action`` field right after the prefix, so packed data
+looks like ``<prefix>:<action>[:<args>]`` and can be routed by ``CallbackRouter``.
+"""
+
+from aiogram.filters.callback_data import CallbackData
+
+
+class NavCallback(CallbackData, prefix="nav"):
+    """Navigation between bot screens (``nav:main``)."""
+
+    action: str
+
+
+class BookingCallback(CallbackData, prefix="booking"):
+    """Booking screens (``booking:show:42``, ``booking:list:``)."""
+
+    action: str
+    id: int | None = None
+
+
+class BookingPageCallback(CallbackData, prefix="bookings"):
+    """Bookings list pages (``bookings:page:n1767225600000000_42``)."""
+
+    action: str
+    cursor: str
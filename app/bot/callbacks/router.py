@@ -0,0 +1,83 @@
+"""Router that dispatches callback queries through a prefix trie."""
+
+from collections.abc import Callable
+from typing import Any
+
+from aiogram import Router
+from aiogram.dispatcher.event.handler import CallableObject
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import CallbackQuery
+
+CALLBACK_SEPARATOR = ":"
+
+
+class CallbackRouter(Router):
+    """Router with O(1) callback dispatch by ``prefix`` and ``action``.
+
+    Instead of registering one lambda filter per handler (which aiogram checks
+    one by one for every callback), handlers are stored in a two-level trie
+    ``prefix -> action -> handler``. The callback data is unpacked once into
+    the typed factory and passed to the handler as ``callback_data``.
+    """
+
+    def __init__(self, *, name: str | None = None) -> None:
+        super().__init__(name=name)
+        self._trie: dict[
+            str,
+            tuple[type[CallbackData], dict[str, CallableObject]],
+        ] = {}
+        self.callback_query.register(self._dispatch, self._resolve)
+
+    def action(
+        self,
+        factory: type[CallbackData],
+        action: str,
+    ) -> Callable[[Callable], Callable]:
+        """Register a callback query handler for ``factory`` with ``action``."""
+        prefix = factory.__prefix__
+        if factory.__separator__ != CALLBACK_SEPARATOR:
+            msg = f"{factory.__name__} must use {CALLBACK_SEPARATOR!r} separator"
+            raise ValueError(msg)
+
+        node_factory, actions = self._trie.setdefault(prefix, (factory, {}))
+        if node_factory is not factory:
+            msg = f"Prefix {prefix!r} is already bound to {node_factory.__name__}"
+            raise ValueError(msg)
+        if action in actions:
+            msg = f"Handler for {prefix}:{action} is already registered"
+            raise ValueError(msg)
+
+        def decorator(callback: Callable) -> Callable:
+            actions[action] = CallableObject(callback=callback)
+            return callback
+
+        return decorator
+
+    async def _resolve(self, callback: CallbackQuery) -> dict[str, Any] | bool:
+        data = callback.data
+        if not data:
+            return False
+
+        prefix, _, rest = data.partition(CALLBACK_SEPARATOR)
+        node = self._trie.get(prefix)
+        if node is None:
+            return False
+
+        factory, actions = node
+        target = actions.get(rest.partition(CALLBACK_SEPARATOR)[0])
+        if target is None:
+            return False
+
+        try:
+            callback_data = factory.unpack(data)
+        except (TypeError, ValueError):
+            return False
+        return {"callback_data": callback_data, "callback_target": target}
+
+    async def _dispatch(
+        self,
+        callback: CallbackQuery,
+        callback_target: CallableObject,
+        **kwargs: Any,
+    ) -> Any:
+        return await callback_target.call(callback, **kwargs)
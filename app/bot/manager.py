@@ -10,6 +10,7 @@ from app.infrastructure.database import BotConfig
 from app.log import log
 
 from .middlewares import register_middleware
+from .session import bot_session, create_bot
 
 
 class BotManager:
@@ -19,6 +20,8 @@ class BotManager:
         self.runners: set[int] = set()
         self.dispatchers: dict[uuid.UUID, Dispatcher] = {}
         self.storages: dict[uuid.UUID, RedisStorage | MemoryStorage] = {}
+        # customer (bot owner) id -> bot id, filled when a bot starts
+        self.customer_bots: dict[uuid.UUID, int] = {}
         self._starting_bots: set[int] = set()
 
     def create_storage(self, bot_id: int):
@@ -56,7 +59,17 @@ class BotManager:
         self.dispatchers[bot_id] = dp
         return dp
 
-    async def start_bot(self, bot_id: int, bot_token: str | None = None):
+    def get_customer_bot(self, customer_id: uuid.UUID) -> Bot | None:
+        """Running bot of a customer; a dict lookup, never hits the DB."""
+        bot_id = self.customer_bots.get(customer_id)
+        return self.bots.get(bot_id) if bot_id is not None else None
+
+    async def start_bot(
+        self,
+        bot_id: int,
+        bot_token: str | None = None,
+        customer_id: uuid.UUID | None = None,
+    ):
         if bot_id in self._starting_bots:
             return
         if bot_id in self.runners:
@@ -69,11 +82,12 @@ class BotManager:
                 if bot_token is None:
                     bot_config = await BotConfig.get(id=bot_id)
                     bot_token = bot_config.token
+                    customer_id = bot_config.owner_id
 
-                bot: Bot = Bot(
-                    token=bot_token,
-                )
+                bot: Bot = create_bot(bot_token)
                 self.bots[bot_id] = bot
+            if customer_id is not None:
+                self.customer_bots[customer_id] = bot_id
 
             dp = self.get_dispatcher(bot_id)
             await self.run_bot(bot_id=bot_id, bot=bot, dp=dp)
@@ -124,11 +138,13 @@ class BotManager:
 
     async def remove_bot(self, bot_id: int):
         """Удаление бота"""
-        if bot_id in self.bots:
-            await self.bots[bot_id].session.close()
-            del self.bots[bot_id]
+        # The HTTP session is shared with other bots and stays open
+        self.bots.pop(bot_id, None)
         if bot_id in self.dispatchers:
             del self.dispatchers[bot_id]
+        for customer_id, customer_bot_id in list(self.customer_bots.items()):
+            if customer_bot_id == bot_id:
+                del self.customer_bots[customer_id]
         self.runners.discard(bot_id)
         self._starting_bots.discard(bot_id)
 
@@ -177,13 +193,16 @@ class BotManager:
 
         bot_configs = await BotConfig.get_all()
         for bc in bot_configs:
-            await self.start_bot(bc.id)
+            await self.start_bot(bc.id, bot_token=bc.token, customer_id=bc.owner_id)
 
     async def stop_all(self):
         """Остановка всех ботов из конфига"""
         bot_configs = await BotConfig.get_all()
         for bc in bot_configs:
             await self.stop_bot(bc.id)
+        await self.stop_bot(config.bot.ADMINBOT_ID)
+        # Only now no bot uses the shared connections
+        await bot_session.close_shared()
 
     async def feed_update(self, bot_id: uuid.UUID, update):
         dp = self.get_dispatcher(bot_id)
@@ -201,7 +220,7 @@ class BotManager:
 
     async def check_bot(self, bot_token: str):
         """Проверка валидности токена бота"""
-        test_bot = Bot(token=bot_token)
+        test_bot = create_bot(bot_token)
         me = None
         try:
             me = await test_bot.get_me()
@@ -215,8 +234,6 @@ class BotManager:
             )
         except Exception:  # noqa: BLE001, S110
             pass
-        finally:
-            await test_bot.session.close()
         return me
 
     async def add_bot(
@@ -245,7 +262,11 @@ class BotManager:
             name=bot.first_name,
             owner_id=owner_id,
         )
-        await self.start_bot(bot_config.id)
+        await self.start_bot(
+            bot_config.id,
+            bot_token=bot_token,
+            customer_id=owner_id,
+        )
         return bot_config.id
 
 
@@ -4,6 +4,7 @@ import time
 
 from aiogram import BaseMiddleware, types
 
+from app.context import request_context
 from app.log import log
 
 exclude_tg_user = [
@@ -41,33 +42,38 @@ class LoggingMiddleware(BaseMiddleware):
         except:  # noqa: E722
             _type = "?"
             user = None
-        try:
-            res = await handler(event, data)
-            log(
-                level="INFO",
-                method=f"TG:{_type}",
-                path="logging_middleware",
-                duration=math.ceil((time.time() - start_time) * 1000),
-                user=user.model_dump(exclude=exclude_tg_user, exclude_none=True)
-                if user
-                else None,
-                bot_id=event.bot.id,
-                bot_username=event.bot._me.username,  # noqa: SLF001
-            )
-            return res
-        except Exception as err:  # noqa: BLE001
-            log(
-                level="ERROR",
-                method=f"TG:{_type}",
-                path="logging_middleware",
-                duration=math.ceil((time.time() - start_time) * 1000),
-                user=user.model_dump(
-                    exclude=exclude_tg_user,
-                    exclude_none=True,
+        with request_context() as ctx:
+            try:
+                res = await handler(event, data)
+                log(
+                    level="INFO",
+                    method=f"TG:{_type}",
+                    path="logging_middleware",
+                    duration=math.ceil((time.time() - start_time) * 1000),
+                    request_id=ctx.request_id,
+                    spans=ctx.spans_ms(),
+                    user=user.model_dump(exclude=exclude_tg_user, exclude_none=True)
+                    if user
+                    else None,
+                    bot_id=event.bot.id,
+                    bot_username=event.bot._me.username,  # noqa: SLF001
+                )
+                return res
+            except Exception as err:  # noqa: BLE001
+                log(
+                    level="ERROR",
+                    method=f"TG:{_type}",
+                    path="logging_middleware",
+                    duration=math.ceil((time.time() - start_time) * 1000),
+                    request_id=ctx.request_id,
+                    spans=ctx.spans_ms(),
+                    user=user.model_dump(
+                        exclude=exclude_tg_user,
+                        exclude_none=True,
+                    )
+                    if user
+                    else None,
+                    exception=err,
+                    bot_id=event.bot.id,
+                    bot_username=event.bot._me.username,  # noqa: SLF001
                 )
-                if user
-                else None,
-                exception=err,
-                bot_id=event.bot.id,
-                bot_username=event.bot._me.username,  # noqa: SLF001
-            )
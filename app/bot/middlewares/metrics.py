@@ -5,6 +5,7 @@ from aiogram import BaseMiddleware
 from aiogram.types import CallbackQuery, InlineQuery, Message, Update
 
 from app.metrics.business import (
+    bot_label,
     bot_message_processing_seconds,
     bot_messages_total,
 )
@@ -18,7 +19,7 @@ class MetricsMiddleware(BaseMiddleware):
         data: dict,
     ):
         start_time = time.time()
-        bot_id = str(event.bot.id)
+        bot_id = bot_label(event.bot.id)
         handler_name = self._get_handler_name(handler, data)
 
         if handler_name is None:
@@ -1,31 +1,53 @@
 # ruff: noqa: RUF001, PLR0915
 """Handlers for creating bookings."""
 
+from datetime import datetime, timezone
+import math
+
 from aiogram import Router, types
+from aiogram.filters import StateFilter
 from aiogram.fsm.context import FSMContext
 
+from app.bot.callbacks import BookingCallback, CallbackRouter
 from app.bot.fsm.booking_states import BookingStates
 from app.bot.handler import handler
 from app.bot.keyboards.main_menu import get_main_menu
-from app.domain.services.bookings import BookingParams, booking_service
+from app.config import config
+from app.domain.services.bookings import (
+    BookingParams,
+    BookingRejectReason,
+    booking_service,
+    has_conflict,
+    slot_holds,
+    validate_period,
+)
 from app.domain.services.resource import resource_service
 from app.infrastructure.database import Resource
 from app.infrastructure.database.models.users import User
 
 from .helpers import (
+    confirm_inline,
     format_bookings_list,
     format_dt,
     get_customer_id,
     get_status_emoji,
+    leave_booking,
     main_back_inline,
     parse_period,
     resources_inline,
 )
 
+# Answers to periods that can never be booked, by validate_period reason
+INVALID_PERIOD_TEXTS = {
+    BookingRejectReason.INVALID_TIME_RANGE: "Конец интервала должен быть позже начала.",
+    BookingRejectReason.IN_PAST: "Нельзя забронировать время в прошлом.",
+    BookingRejectReason.TOO_FAR: "Бронировать можно не больше чем на 3 года вперёд.",
+}
+
 
 def get_create_router() -> Router:
     """Create router for booking creation handlers."""
-    router = Router()
+    router = CallbackRouter()
 
     @router.message(lambda m: m.text == "📅 Забронировать")
     @handler
@@ -42,23 +64,22 @@ def get_create_router() -> Router:
                 reply_markup=get_main_menu(),
             )
             return
-        await state.clear()
+        await leave_booking(state, user)
         await message.answer(
             "Выберите ресурс для бронирования:",
             reply_markup=resources_inline(resources),
         )
 
-    @router.callback_query(lambda c: c.data and c.data.startswith("booking:resource:"))
+    @router.action(BookingCallback, "resource")
     @handler
     async def pick_resource(
         callback: types.CallbackQuery,
+        callback_data: BookingCallback,
         state: FSMContext,
     ):
         """Handle resource selection."""
-        _, _, resource_id_str = callback.data.split(":", 2)
-        try:
-            resource_id = int(resource_id_str)
-        except ValueError:
+        resource_id = callback_data.id
+        if resource_id is None:
             await callback.answer("Некорректный ресурс")
             return
 
@@ -69,15 +90,17 @@ def get_create_router() -> Router:
             return
 
         # Get existing bookings for this resource
-        existing_bookings = await booking_service.get_resource_bookings(
+        existing_bookings = await booking_service.get_resource_snapshot(
             resource_id=resource_id,
         )
         bookings_text = format_bookings_list(existing_bookings)
+        seats = f"Мест: {resource.capacity}\n\n" if resource.capacity > 1 else ""
 
-        await state.update_data(resource_id=resource_id)
+        await state.update_data(resource_id=resource_id, capacity=resource.capacity)
         await state.set_state(BookingStates.time)
         await callback.message.edit_text(
             f"Выбран ресурс: *{resource.name}*\n\n"
+            f"{seats}"
             f"{bookings_text}\n\n"
             "Введите дату и время в формате:\n"
             "`26.01.2026 10:00-12:00`\n"
@@ -88,10 +111,11 @@ def get_create_router() -> Router:
         )
         await callback.answer()
 
-    @router.message(BookingStates.time)
+    # A new period typed while confirming replaces the held one
+    @router.message(StateFilter(BookingStates.time, BookingStates.confirm))
     @handler
     async def receive_period(message: types.Message, state: FSMContext, user: User):
-        """Handle time period input and create booking."""
+        """Handle time period input and hold the period until confirmed."""
         data = await state.get_data()
         resource_id = data.get("resource_id")
         if not resource_id:
@@ -110,21 +134,23 @@ def get_create_router() -> Router:
             )
             return
         start_time, end_time = parsed
+        # Checked before the hold, so confirming cannot fail on the period
+        reason = validate_period(start_time, end_time, datetime.now(timezone.utc))
+        if reason is not None:
+            await message.answer(
+                INVALID_PERIOD_TEXTS.get(reason, "Некорректный интервал.")
+                + " Введите другой интервал.",
+            )
+            return
+        capacity = data.get("capacity", 1)
 
-        customer_id = await get_customer_id(message.bot.id)
-
-        # Check availability
-        is_available = await booking_service.check_availability(
+        # Lock-free pre-check against the cached snapshot; create_booking
+        # checks again under lock, so a stale snapshot costs one attempt
+        existing_bookings = await booking_service.get_resource_snapshot(
             resource_id=int(resource_id),
-            start_time=start_time,
-            end_time=end_time,
         )
 
-        if not is_available:
-            # Get existing bookings to show what's already booked
-            existing_bookings = await booking_service.get_resource_bookings(
-                resource_id=int(resource_id),
-            )
+        if has_conflict(existing_bookings, start_time, end_time, capacity):
             bookings_text = format_bookings_list(existing_bookings)
 
             status_emoji = get_status_emoji(False)
@@ -137,32 +163,104 @@ def get_create_router() -> Router:
             )
             return
 
+        # Other users cannot take the seat while this one confirms it; the
+        # held seats are counted on top of the overlapping bookings
+        if not await slot_holds.hold(
+            int(resource_id),
+            user.id,
+            start_time,
+            end_time,
+            capacity,
+            booked=[
+                (booking.start_time, booking.end_time)
+                for booking in existing_bookings
+                if booking.start_time < end_time and booking.end_time > start_time
+            ],
+        ):
+            status_emoji = get_status_emoji(False)
+            await message.answer(
+                f"{status_emoji} *Это время сейчас бронирует другой пользователь*\n\n"
+                f"Интервал: {format_dt(start_time)} – {format_dt(end_time)}\n\n"
+                "Попробуйте другое время или повторите через несколько минут.",
+                parse_mode="Markdown",
+            )
+            return
+
+        await state.update_data(
+            start_time=start_time.isoformat(),
+            end_time=end_time.isoformat(),
+        )
+        await state.set_state(BookingStates.confirm)
+        minutes = math.ceil(config.booking.BOOKING_HOLD_SECONDS / 60)
+        await message.answer(
+            f"Интервал {format_dt(start_time)} – {format_dt(end_time)} "
+            f"закреплён за вами на {minutes} мин.\n"
+            "Подтвердите бронирование.",
+            reply_markup=confirm_inline(),
+        )
+
+    @router.action(BookingCallback, "confirm")
+    @handler
+    async def confirm_booking(
+        callback: types.CallbackQuery,
+        state: FSMContext,
+        user: User,
+    ):
+        """Create the booking for the held period."""
+        data = await state.get_data()
+        if await state.get_state() != BookingStates.confirm:
+            await callback.answer("Начните заново: нажмите «📅 Забронировать».")
+            return
+
         params = BookingParams(
             user_id=user.id,
-            customer_id=customer_id,
-            resource_id=int(resource_id),
-            start_time=start_time,
-            end_time=end_time,
+            customer_id=await get_customer_id(callback.bot.id),
+            resource_id=int(data["resource_id"]),
+            start_time=datetime.fromisoformat(data["start_time"]),
+            end_time=datetime.fromisoformat(data["end_time"]),
         )
         booking = await booking_service.create_booking(params=params)
+        await slot_holds.release(params.resource_id, user.id)
         if not booking:
-            msg = (
+            await state.set_state(BookingStates.time)
+            await callback.message.edit_text(
                 "Не удалось создать бронирование "
                 "(время занято или введены некорректные даты). "
-                "Попробуйте другой интервал."
+                "Введите другой интервал.",
+                reply_markup=main_back_inline(),
             )
-            await message.answer(msg)
+            await callback.answer()
             return
 
         await state.clear()
         status_emoji = get_status_emoji(True)
-        await message.answer(
+        await callback.message.edit_text(
             f"{status_emoji} *Бронирование успешно создано!*\n\n"
             f"- Ресурс: `{params.resource_id}`\n"
             f"- С: {format_dt(params.start_time)}\n"
             f"- По: {format_dt(params.end_time)}",
             parse_mode="Markdown",
-            reply_markup=get_main_menu(),
         )
+        await callback.answer()
+
+    @router.action(BookingCallback, "release")
+    @handler
+    async def release_period(
+        callback: types.CallbackQuery,
+        state: FSMContext,
+        user: User,
+    ):
+        """Release the held period and ask for another one."""
+        resource_id = (await state.get_data()).get("resource_id")
+        if resource_id:
+            await slot_holds.release(int(resource_id), user.id)
+            await state.set_state(BookingStates.time)
+        await callback.message.edit_text(
+            "Время освобождено. Введите другой интервал, например "
+            "`26.01.2026 10:00-12:00`.",
+            parse_mode="Markdown",
+            reply_markup=main_back_inline(),
+        )
+        await callback.answer()
 
     return router
@@ -4,9 +4,15 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
+from aiogram.fsm.context import FSMContext
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
+from app.bot.callbacks import BookingCallback, BookingPageCallback, NavCallback
+from app.bot.fsm.booking_states import BookingStates
+from app.domain.services.bookings import BookingPage, BookingView, slot_holds
+from app.infrastructure.cache import cached
 from app.infrastructure.database import BotConfig, Resource
+from app.infrastructure.database.models.users import User
 
 # Constants for date/time parsing
 MIN_DATE_PARTS = 2
@@ -16,12 +22,23 @@ TIME_FORMAT = "%H:%M"
 MAX_BOOKINGS_LIST = 10
 
 
+# Called for every update; the owner of a bot never changes
+@cached("bot_customer", ttl=3600)
 async def get_customer_id(bot_id: int) -> UUID:
     """Get customer_id from bot_id via BotConfig."""
     bot_cfg = await BotConfig.get(id=bot_id)
     return bot_cfg.owner_id
 
 
+async def leave_booking(state: FSMContext, user: User) -> None:
+    """Release the period held while confirming, then clear the state."""
+    if await state.get_state() == BookingStates.confirm:
+        resource_id = (await state.get_data()).get("resource_id")
+        if resource_id:
+            await slot_holds.release(int(resource_id), user.id)
+    await state.clear()
+
+
 def main_back_inline() -> InlineKeyboardMarkup:
     """Create inline keyboard with back to main menu button."""
     return InlineKeyboardMarkup(
@@ -29,7 +46,33 @@ def main_back_inline() -> InlineKeyboardMarkup:
             [
                 InlineKeyboardButton(
                     text="⬅️ В главное меню",
-                    callback_data="nav:main",
+                    callback_data=NavCallback(action="main").pack(),
+                ),
+            ],
+        ],
+    )
+
+
+def confirm_inline() -> InlineKeyboardMarkup:
+    """Create inline keyboard confirming or releasing a held period."""
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="✅ Подтвердить",
+                    callback_data=BookingCallback(action="confirm").pack(),
+                ),
+            ],
+            [
+                InlineKeyboardButton(
+                    text="❌ Другое время",
+                    callback_data=BookingCallback(action="release").pack(),
+                ),
+            ],
+            [
+                InlineKeyboardButton(
+                    text="⬅️ В главное меню",
+                    callback_data=NavCallback(action="main").pack(),
                 ),
             ],
         ],
@@ -44,12 +87,68 @@ def resources_inline(resources: list[Resource]) -> InlineKeyboardMarkup:
             [
                 InlineKeyboardButton(
                     text=r.name,
-                    callback_data=f"booking:resource:{r.id}",
+                    callback_data=BookingCallback(action="resource", id=r.id).pack(),
                 ),
             ],
         )
     rows.append(
-        [InlineKeyboardButton(text="⬅️ В главное меню", callback_data="nav:main")],
+        [
+            InlineKeyboardButton(
+                text="⬅️ В главное меню",
+                callback_data=NavCallback(action="main").pack(),
+            ),
+        ],
+    )
+    return InlineKeyboardMarkup(inline_keyboard=rows)
+
+
+def bookings_inline(page: BookingPage) -> InlineKeyboardMarkup:
+    """Create inline keyboard with a page of bookings and prev/next buttons."""
+    status_emoji = get_status_emoji(True)
+    rows: list[list[InlineKeyboardButton]] = [
+        [
+            InlineKeyboardButton(
+                text=(
+                    f"{status_emoji} #{b.id} · {b.resource_name} · "
+                    f"{format_dt(b.start_time)}"
+                ),
+                callback_data=BookingCallback(action="show", id=b.id).pack(),
+            ),
+        ]
+        for b in page.items
+    ]
+
+    pager: list[InlineKeyboardButton] = []
+    if page.prev_cursor:
+        pager.append(
+            InlineKeyboardButton(
+                text="◀️",
+                callback_data=BookingPageCallback(
+                    action="page",
+                    cursor=page.prev_cursor.encode(),
+                ).pack(),
+            ),
+        )
+    if page.next_cursor:
+        pager.append(
+            InlineKeyboardButton(
+                text="▶️",
+                callback_data=BookingPageCallback(
+                    action="page",
+                    cursor=page.next_cursor.encode(),
+                ).pack(),
+            ),
+        )
+    if pager:
+        rows.append(pager)
+
+    rows.append(
+        [
+            InlineKeyboardButton(
+                text="⬅️ В главное меню",
+                callback_data=NavCallback(action="main").pack(),
+            ),
+        ],
     )
     return InlineKeyboardMarkup(inline_keyboard=rows)
 
@@ -68,7 +167,7 @@ def format_short_dt(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).strftime("%d.%m %H:%M")
 
 
-def format_bookings_list(bookings: list) -> str:
+def format_bookings_list(bookings: list[BookingView]) -> str:
     """Format list of bookings for display."""
     if not bookings:
         return "Нет забронированных слотов."
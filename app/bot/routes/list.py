@@ -5,108 +5,101 @@ from aiogram import Router, types
 from aiogram.fsm.context import FSMContext
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
+from app.bot.callbacks import (
+    BookingCallback,
+    BookingPageCallback,
+    CallbackRouter,
+    NavCallback,
+)
 from app.bot.handler import handler
 from app.bot.keyboards.main_menu import get_main_menu
-from app.domain.services.bookings import booking_service
-from app.infrastructure.database import Resource
+from app.domain.services.bookings import BookingCursor, booking_service
 from app.infrastructure.database.models.users import User
 
-from .helpers import format_dt, get_customer_id, get_status_emoji, main_back_inline
+from .helpers import (
+    MAX_BOOKINGS_LIST,
+    bookings_inline,
+    format_dt,
+    get_customer_id,
+    get_status_emoji,
+    leave_booking,
+    main_back_inline,
+)
 
 
 def get_list_router() -> Router:
     """Create router for booking list handlers."""
-    router = Router()
+    router = CallbackRouter()
 
     @router.message(lambda m: m.text == "🗓 Мои бронирования")
     @handler
     async def my_bookings(message: types.Message, state: FSMContext, user: User):
         """Show list of user bookings."""
-        await state.clear()
+        await leave_booking(state, user)
         customer_id = await get_customer_id(message.bot.id)
-        bookings = await booking_service.get_user_bookings(
+        page = await booking_service.get_user_bookings_page(
             user_id=user.id,
             customer_id=customer_id,
+            limit=MAX_BOOKINGS_LIST,
         )
-        if not bookings:
+        if not page.items:
             await message.answer(
                 "У вас пока нет бронирований.",
                 reply_markup=get_main_menu(),
             )
             return
 
-        resource_ids = sorted({b.resource_id for b in bookings})
-        resources = await Resource.get_by_id_list(id_list=resource_ids)
-        resource_name_by_id = {r.id: r.name for r in resources}
-
-        rows: list[list[InlineKeyboardButton]] = []
-        for b in bookings:
-            resource_name = resource_name_by_id.get(
-                b.resource_id,
-                f"ресурс {b.resource_id}",
-            )
-            status_emoji = get_status_emoji(True)
-            title = (
-                f"{status_emoji} #{b.id} · {resource_name} · {format_dt(b.start_time)}"
-            )
-            rows.append(
-                [
-                    InlineKeyboardButton(
-                        text=title,
-                        callback_data=f"booking:show:{b.id}",
-                    ),
-                ],
-            )
-        rows.append(
-            [InlineKeyboardButton(text="⬅️ В главное меню", callback_data="nav:main")],
-        )
-
         await message.answer(
             "Ваши бронирования:",
-            reply_markup=InlineKeyboardMarkup(inline_keyboard=rows),
+            reply_markup=bookings_inline(page),
         )
 
-    @router.callback_query(lambda c: c.data and c.data.startswith("booking:show:"))
+    @router.action(BookingCallback, "show")
     @handler
-    async def show_booking(callback: types.CallbackQuery, user: User):
+    async def show_booking(
+        callback: types.CallbackQuery,
+        callback_data: BookingCallback,
+        user: User,
+    ):
         """Show details of a single booking."""
-        _, _, booking_id_str = callback.data.split(":", 2)
-        try:
-            booking_id = int(booking_id_str)
-        except ValueError:
+        booking_id = callback_data.id
+        if booking_id is None:
             await callback.answer("Некорректный ID")
             return
 
         customer_id = await get_customer_id(callback.bot.id)
-        bookings = await booking_service.get_user_bookings(
+        found = await booking_service.get_user_booking(
+            booking_id=booking_id,
             user_id=user.id,
             customer_id=customer_id,
         )
-        booking = next((b for b in bookings if b.id == booking_id), None)
-        if not booking:
+        if not found:
             await callback.answer("Бронирование не найдено")
             return
 
-        resource = await Resource.get(id=booking.resource_id)
+        booking, resource_name = found
         status_emoji = get_status_emoji(True)
         kb = InlineKeyboardMarkup(
             inline_keyboard=[
                 [
                     InlineKeyboardButton(
                         text="❌ Отменить",
-                        callback_data=f"booking:cancel:{booking.id}",
+                        callback_data=BookingCallback(
+                            action="cancel",
+                            id=booking.id,
+                        ).pack(),
                     ),
                 ],
                 [
                     InlineKeyboardButton(
                         text="⬅️ Назад к списку",
-                        callback_data="booking:list",
+                        callback_data=BookingCallback(action="list").pack(),
                     ),
                 ],
                 [
                     InlineKeyboardButton(
                         text="⬅️ В главное меню",
-                        callback_data="nav:main",
+                        callback_data=NavCallback(action="main").pack(),
                     ),
                 ],
             ],
@@ -114,7 +107,7 @@ def get_list_router() -> Router:
         await callback.message.edit_text(
             f"{status_emoji} *Ваше бронирование*\n\n"
             f"- ID: `{booking.id}`\n"
-            f"- Ресурс: {resource.name if resource else booking.resource_id}\n"
+            f"- Ресурс: {resource_name}\n"
             f"- С: {format_dt(booking.start_time)}\n"
             f"- По: {format_dt(booking.end_time)}",
             parse_mode="Markdown",
@@ -122,16 +115,17 @@ def get_list_router() -> Router:
         )
         await callback.answer()
 
-    @router.callback_query(lambda c: c.data == "booking:list")
+    @router.action(BookingCallback, "list")
     @handler
     async def back_to_list(callback: types.CallbackQuery, user: User):
         """Return to bookings list."""
         customer_id = await get_customer_id(callback.bot.id)
-        bookings = await booking_service.get_user_bookings(
+        page = await booking_service.get_user_bookings_page(
             user_id=user.id,
             customer_id=customer_id,
+            limit=MAX_BOOKINGS_LIST,
         )
-        if not bookings:
+        if not page.items:
             await callback.message.edit_text(
                 "У вас пока нет бронирований.",
                 reply_markup=main_back_inline(),
@@ -139,45 +133,53 @@ def get_list_router() -> Router:
             await callback.answer()
             return
 
-        resource_ids = sorted({b.resource_id for b in bookings})
-        resources = await Resource.get_by_id_list(id_list=resource_ids)
-        resource_name_by_id = {r.id: r.name for r in resources}
+        await callback.message.edit_text(
+            "Ваши бронирования:",
+            reply_markup=bookings_inline(page),
+        )
+        await callback.answer()
 
-        rows: list[list[InlineKeyboardButton]] = []
-        for b in bookings:
-            resource_name = resource_name_by_id.get(
-                b.resource_id,
-                f"ресурс {b.resource_id}",
-            )
-            status_emoji = get_status_emoji(True)
-            title = (
-                f"{status_emoji} #{b.id} · {resource_name} · {format_dt(b.start_time)}"
-            )
-            rows.append(
-                [
-                    InlineKeyboardButton(
-                        text=title,
-                        callback_data=f"booking:show:{b.id}",
-                    ),
-                ],
-            )
-        rows.append(
-            [InlineKeyboardButton(text="⬅️ В главное меню", callback_data="nav:main")],
+    @router.action(BookingPageCallback, "page")
+    @handler
+    async def bookings_page(
+        callback: types.CallbackQuery,
+        callback_data: BookingPageCallback,
+        user: User,
+    ):
+        """Show the previous or next page of bookings."""
+        try:
+            cursor = BookingCursor.decode(callback_data.cursor)
+        except ValueError:
+            await callback.answer("Некорректная страница")
+            return
+
+        customer_id = await get_customer_id(callback.bot.id)
+        page = await booking_service.get_user_bookings_page(
+            user_id=user.id,
+            customer_id=customer_id,
+            cursor=cursor,
+            limit=MAX_BOOKINGS_LIST,
         )
+        if not page.items:
+            await callback.answer("Больше бронирований нет")
+            return
+
         await callback.message.edit_text(
             "Ваши бронирования:",
-            reply_markup=InlineKeyboardMarkup(inline_keyboard=rows),
+            reply_markup=bookings_inline(page),
         )
         await callback.answer()
 
-    @router.callback_query(lambda c: c.data and c.data.startswith("booking:cancel:"))
+    @router.action(BookingCallback, "cancel")
     @handler
-    async def cancel_booking(callback: types.CallbackQuery, user: User):
+    async def cancel_booking(
+        callback: types.CallbackQuery,
+        callback_data: BookingCallback,
+        user: User,
+    ):
         """Cancel a booking."""
-        _, _, booking_id_str = callback.data.split(":", 2)
-        try:
-            booking_id = int(booking_id_str)
-        except ValueError:
+        booking_id = callback_data.id
+        if booking_id is None:
             await callback.answer("Некорректный ID")
             return
 
@@ -8,6 +8,9 @@ from aiogram.types import Message
 from app.bot.filters.chat_type import OnlyPrivateChatFilter
 from app.bot.handler import handler
 from app.bot.keyboards.main_menu import get_main_menu, get_settings_keyboard
+from app.infrastructure.database.models.users import User
+
+from .helpers import leave_booking
 
 
 def get_main_menu_router() -> Router:
@@ -27,9 +30,9 @@ def get_main_menu_router() -> Router:
 
     @router.message(lambda m: m.text == "◀️ Назад")
     @handler
-    async def back_button(message: Message, state: FSMContext):
+    async def back_button(message: Message, state: FSMContext, user: User):
         """Handle back button."""
-        await state.clear()
+        await leave_booking(state, user)
         await message.answer(
             "Вы вернулись в главное меню",
             reply_markup=get_main_menu(),
@@ -46,9 +49,9 @@ def get_main_menu_router() -> Router:
 
     @router.message(lambda m: m.text == "⭐️ Оставить отзыв")
     @handler
-    async def start_reviews(message: Message, state: FSMContext):
+    async def start_reviews(message: Message, state: FSMContext, user: User):
         """Handle reviews button."""
-        await state.clear()
+        await leave_booking(state, user)
         await message.answer(
             "Функция отзывов временно недоступна. ",
             reply_markup=get_main_menu(),
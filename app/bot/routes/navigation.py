@@ -5,19 +5,23 @@ import contextlib
 from aiogram import Router, types
 from aiogram.fsm.context import FSMContext
 
+from app.bot.callbacks import CallbackRouter, NavCallback
 from app.bot.handler import handler
 from app.bot.keyboards.main_menu import get_main_menu
+from app.infrastructure.database.models.users import User
+
+from .helpers import leave_booking
 
 
 def get_navigation_router() -> Router:
     """Create router for navigation handlers."""
-    router = Router()
+    router = CallbackRouter()
 
-    @router.callback_query(lambda c: c.data == "nav:main")
+    @router.action(NavCallback, "main")
     @handler
-    async def nav_main(callback: types.CallbackQuery, state: FSMContext):
+    async def nav_main(callback: types.CallbackQuery, state: FSMContext, user: User):
         """Navigate to main menu."""
-        await state.clear()
+        await leave_booking(state, user)
         await callback.message.answer("Главное меню:", reply_markup=get_main_menu())
         with contextlib.suppress(Exception):
             await callback.message.delete()
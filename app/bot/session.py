@@ -0,0 +1,47 @@
+"""
+One HTTP session for all bots of a process.
+
+By default every aiogram Bot gets its own AiohttpSession, i.e. its own
+connection pool, DNS cache and TLS handshakes to api.telegram.org. All bots
+here share ``bot_session`` instead, so idle keep-alive connections opened
+for one bot are reused by the others.
+"""
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
+
+from app.config import config
+
+
+class SharedAiohttpSession(AiohttpSession):
+    """
+    AiohttpSession shared by many bots.
+
+    close() is a no-op, because a bot being removed must not close the
+    connections of the others; close_shared() closes the pool at shutdown.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(limit=config.bot.BOT_HTTP_LIMIT, **kwargs)
+        self._connector_init["keepalive_timeout"] = config.bot.BOT_HTTP_KEEPALIVE
+
+    async def close(self) -> None:
+        pass
+
+    async def close_shared(self) -> None:
+        await super().close()
+
+
+def _api_server() -> TelegramAPIServer:
+    if config.bot.BOT_API_URL:
+        return TelegramAPIServer.from_base(config.bot.BOT_API_URL)
+    return PRODUCTION
+
+
+bot_session = SharedAiohttpSession(api=_api_server())
+
+
+def create_bot(token: str) -> Bot:
+    """Bot using the shared session."""
+    return Bot(token=token, session=bot_session)
@@ -2,8 +2,11 @@ from os import environ as env
 
 from pydantic import BaseModel, Field
 
+from .booking import BookingConfig
 from .bot import BotConfig
+from .cache import CacheConfig
 from .database import DbConfig
+from .metrics import MetricsConfig
 from .server import ServerConfig
 
 
@@ -11,6 +14,9 @@ class Config(BaseModel):
     server: ServerConfig = Field(default_factory=lambda: ServerConfig(**env))
     database: DbConfig = Field(default_factory=lambda: DbConfig(**env))
     bot: BotConfig = Field(default_factory=lambda: BotConfig(**env))
+    metrics: MetricsConfig = Field(default_factory=lambda: MetricsConfig(**env))
+    cache: CacheConfig = Field(default_factory=lambda: CacheConfig(**env))
+    booking: BookingConfig = Field(default_factory=lambda: BookingConfig(**env))
 
 
 config = Config()
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class BookingConfig(BaseModel):
+    # How long a period entered in the bot stays reserved for the user while
+    # they confirm it; other users cannot book it meanwhile
+    BOOKING_HOLD_SECONDS: float = 300.0
@@ -7,6 +7,14 @@ class BotConfig(BaseModel):
     WEBHOOK_ENDPOINT: str = "/tg/{bot_id}"
     USE_REDIS_STORAGE: bool = False
     BOT_REDIS_DSN: str = "redis://localhost:6379/0"
+    # Bot API base URL, e.g. a local stand-in for load tests; None for Telegram
+    BOT_API_URL: str | None = None
+    # Connection pool shared by all bots of a process; 0 means no limit.
+    # A limit must stay above the number of polling bots, since every
+    # getUpdates long poll holds a connection
+    BOT_HTTP_LIMIT: int = 0
+    # Idle keep-alive connections to the Bot API are reused for this long
+    BOT_HTTP_KEEPALIVE: float = 60.0
     TEST_BOT_TOKEN: str | None = None
     TEST_USER_TLG_ID: int | None = None
     CREATE_TEST_USER: bool = False
@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class CacheConfig(BaseModel):
+    # Shared tier and invalidation channel; without it caches are per process
+    CACHE_REDIS_DSN: str | None = None
+    CACHE_KEY_PREFIX: str = "cache"
+    # Slow Redis calls fall back to the loader instead of holding requests
+    CACHE_REDIS_TIMEOUT: float = 0.5
+    CACHE_DEFAULT_TTL: float = 60.0
+    # Entries kept in the in-process LRU tier of each cache
+    CACHE_LOCAL_MAXSIZE: int = 1024
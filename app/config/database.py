@@ -3,12 +3,52 @@ from pydantic import BaseModel
 
 class DbConfig(BaseModel):
     DB_ECHO: bool = False
+    # Statements running at least this long are logged with their caller
+    DB_SLOW_QUERY_MS: int = 500
 
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     POSTGRES_PORT: int = 5432
     POSTGRES_HOST: str = "localhost"
+    # Read replica for read-only service methods; same credentials as the
+    # primary. Setting only POSTGRES_READ_DB points at a second database on
+    # the primary server, which is enough as a local stand-in.
+    POSTGRES_READ_HOST: str | None = None
+    POSTGRES_READ_PORT: int | None = None
+    POSTGRES_READ_DB: str | None = None
+
+    # Connections one server may open, split between its uvicorn workers
+    DB_MAX_CONNECTIONS: int = 45
+    WEB_CONCURRENCY: int = 1
+    # Per-worker pool size and overflow; derived from the budget if unset
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_POOL_TIMEOUT: float = 15.0
+    DB_POOL_RECYCLE: int = 3600
+    # Connections idle longer than this are pinged before use; 0 pings always
+    DB_POOL_PING_IDLE_SECONDS: float = 30.0
+    # Time limit of one inject_session call, including commit
+    DB_OPERATION_TIMEOUT: float = 20.0
+    # Postgres session settings of every connection, in milliseconds
+    DB_STATEMENT_TIMEOUT_MS: int = 15000
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS: int = 60000
+
+    @property
+    def pool_size(self) -> int:
+        if self.DB_POOL_SIZE is not None:
+            return self.DB_POOL_SIZE
+        return max(1, self._worker_connections * 2 // 3)
+
+    @property
+    def max_overflow(self) -> int:
+        if self.DB_MAX_OVERFLOW is not None:
+            return self.DB_MAX_OVERFLOW
+        return max(0, self._worker_connections - self.pool_size)
+
+    @property
+    def _worker_connections(self) -> int:
+        return self.DB_MAX_CONNECTIONS // max(1, self.WEB_CONCURRENCY)
 
     @property
     def database_url(self) -> str:
@@ -16,3 +56,15 @@ class DbConfig(BaseModel):
             f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@"
             f"{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
+
+    @property
+    def read_database_url(self) -> str | None:
+        """URL of the read replica, None when reads go to the primary."""
+        if self.POSTGRES_READ_HOST is None and self.POSTGRES_READ_DB is None:
+            return None
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@"
+            f"{self.POSTGRES_READ_HOST or self.POSTGRES_HOST}:"
+            f"{self.POSTGRES_READ_PORT or self.POSTGRES_PORT}/"
+            f"{self.POSTGRES_READ_DB or self.POSTGRES_DB}"
+        )
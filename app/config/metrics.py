@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+
+class MetricsConfig(BaseModel):
+    # Distinct customer_id / bot_id label values before falling back to "other"
+    METRICS_CUSTOMER_LIMIT: int = 100
+    METRICS_BOT_LIMIT: int = 100
+    # Distinct SQL fingerprints in db_query_duration_seconds
+    METRICS_STATEMENT_LIMIT: int = 500
+    # Comma separated customer ids that always get their own series
+    METRICS_CUSTOMER_ALLOWLIST: str = ""
+
+    @property
+    def customer_allowlist(self) -> list[str]:
+        return [
+            c.strip() for c in self.METRICS_CUSTOMER_ALLOWLIST.split(",") if c.strip()
+        ]
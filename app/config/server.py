@@ -10,6 +10,10 @@ class ServerConfig(BaseModel):
     DEBUG: bool = False
     SWAGGER_ENABLE: bool = True
     EXCEPT_LOG: bool = False
+    # Max bytes of an error response body written to the request log
+    LOG_ERROR_BODY_LIMIT: int = 4096
+    # Share of successful (INFO) request logs that are written, from 0 to 1
+    LOG_INFO_SAMPLE_RATE: float = 1.0
 
     swagger_ui_parameters: dict = {
         "docExpansion": "none",
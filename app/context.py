@@ -0,0 +1,133 @@
+"""
+Request-scoped context kept in a ContextVar.
+
+Every HTTP request and bot update gets its own RequestContext, so concurrent
+requests never see each other's user. Tasks started while handling a request
+copy the context and share the same object.
+
+span() and service_call() wrap every service call, so they are small classes
+rather than @contextmanager generators, which cost about twice as much.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import time
+from typing import Any
+import uuid
+
+
+@dataclass
+class RequestContext:
+    """User, id and timing spans of one request."""
+
+    request_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    started_at: float = field(default_factory=time.perf_counter)
+    user: Any = None
+    # Set once the request writes to the primary; later reads skip the replica
+    db_written: bool = False
+    # span name -> [calls, total seconds]
+    spans: dict[str, list] = field(default_factory=dict)
+
+    def add_span(self, name: str, seconds: float) -> None:
+        span = self.spans.setdefault(name, [0, 0.0])
+        span[0] += 1
+        span[1] += seconds
+
+    def spans_ms(self) -> dict[str, dict] | None:
+        """Spans in a loggable form, None if there are none."""
+        if not self.spans:
+            return None
+        return {
+            name: {"count": count, "ms": round(seconds * 1000, 2)}
+            for name, (count, seconds) in self.spans.items()
+        }
+
+
+_request_context: ContextVar[RequestContext | None] = ContextVar(
+    "request_context",
+    default=None,
+)
+# Qualified name of the innermost service method running (e.g. for SQL logs)
+_service_call: ContextVar[str | None] = ContextVar("service_call", default=None)
+
+
+def get_request_context() -> RequestContext | None:
+    return _request_context.get()
+
+
+@contextmanager
+def request_context(request_id: str | None = None) -> Iterator[RequestContext]:
+    """Run the block with a fresh RequestContext."""
+    ctx = RequestContext(request_id=request_id) if request_id else RequestContext()
+    token = _request_context.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _request_context.reset(token)
+
+
+class _Span:
+    __slots__ = ("ctx", "name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.ctx = _request_context.get()
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc) -> None:
+        if self.ctx is not None:
+            self.ctx.add_span(self.name, time.perf_counter() - self.start)
+
+
+def span(name: str) -> _Span:
+    """Add the time spent in the block to the current request, if any."""
+    return _Span(name)
+
+
+def set_current_user(user) -> None:
+    ctx = _request_context.get()
+    if ctx is not None:
+        ctx.user = user
+
+
+def get_current_user():
+    ctx = _request_context.get()
+    return ctx.user if ctx else None
+
+
+def mark_db_write() -> None:
+    ctx = _request_context.get()
+    if ctx is not None:
+        ctx.db_written = True
+
+
+def db_written() -> bool:
+    """Whether the current request has written to the primary database."""
+    ctx = _request_context.get()
+    return ctx is not None and ctx.db_written
+
+
+class _ServiceCall:
+    __slots__ = ("name", "token")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.token = _service_call.set(self.name)
+
+    def __exit__(self, *exc) -> None:
+        _service_call.reset(self.token)
+
+
+def service_call(name: str) -> _ServiceCall:
+    """Mark the block as running inside the given service method."""
+    return _ServiceCall(name)
+
+
+def get_service_call() -> str | None:
+    return _service_call.get()
@@ -1,34 +1,106 @@
 import asyncio
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import functools
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from app.config import config
+from app.context import db_written, mark_db_write, service_call, span
+from app.infrastructure.pool import (
+    InstrumentedAsyncQueuePool,
+    ReplicaAsyncQueuePool,
+    ping_idle_connections,
+)
+from app.metrics.sql import instrument_engine
+
+
+class PrimarySession(Session):
+    """Session on the primary; remembers that the current request wrote."""
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _after_flush(session, flush_context):  # noqa: ARG001
+    mark_db_write()
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _on_orm_execute(state: ORMExecuteState):
+    if state.is_insert or state.is_update or state.is_delete:
+        mark_db_write()
+
+
+def _create_engine(url: str, poolclass: type) -> AsyncEngine:
+    engine = create_async_engine(
+        url=url,
+        echo=config.database.DB_ECHO,
+        poolclass=poolclass,
+        pool_size=config.database.pool_size,
+        max_overflow=config.database.max_overflow,
+        pool_timeout=config.database.DB_POOL_TIMEOUT,
+        pool_recycle=config.database.DB_POOL_RECYCLE,
+        # Reuse the most recent connections so they rarely need a ping
+        pool_use_lifo=True,
+        # Sent once at connect, so the limits cost nothing per session
+        connect_args={
+            "server_settings": {
+                "statement_timeout": str(config.database.DB_STATEMENT_TIMEOUT_MS),
+                "idle_in_transaction_session_timeout": str(
+                    config.database.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS,
+                ),
+            },
+        },
+    )
+    instrument_engine(engine.sync_engine)
+    ping_idle_connections(
+        engine.sync_engine,
+        config.database.DB_POOL_PING_IDLE_SECONDS,
+    )
+    return engine
 
 
 class Provider:
     def __init__(self):
-        self.engine = create_async_engine(
-            url=config.database.database_url,
-            echo=config.database.DB_ECHO,
-            pool_size=30,
-            max_overflow=15,
-            pool_timeout=15.0,
-            pool_recycle=3600,
-            pool_pre_ping=True,
+        self.engine = _create_engine(
+            config.database.database_url,
+            InstrumentedAsyncQueuePool,
         )
-
         self.session_factory = async_sessionmaker(
             bind=self.engine,
+            sync_session_class=PrimarySession,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
         )
-        self._current_user = None
+
+        # Without a replica reads share the primary engine
+        read_url = config.database.read_database_url
+        self.read_engine = (
+            _create_engine(read_url, ReplicaAsyncQueuePool) if read_url else self.engine
+        )
+        self.read_session_factory = (
+            async_sessionmaker(
+                bind=self.read_engine,
+                autoflush=False,
+                autocommit=False,
+                expire_on_commit=False,
+            )
+            if read_url
+            else self.session_factory
+        )
+
+    def get_read_session_factory(self) -> async_sessionmaker:
+        """Replica sessions, or primary ones once the request has written."""
+        if db_written():
+            return self.session_factory
+        return self.read_session_factory
 
     async def get_session(self) -> AsyncIterator[AsyncSession]:
         async with self.session_factory() as session:
@@ -41,37 +113,65 @@ class Provider:
             finally:
                 await session.close()
 
-    def inject_session(self, func):
-        async def wrapper(*args, **kwargs):
-            if "session" not in kwargs:
-                async with self.session_factory() as session:
-                    kwargs["session"] = session
-                    try:
-                        # Таймаут 20 секунд на выполнение операции
-                        res = await asyncio.wait_for(
-                            func(*args, **kwargs),
-                            timeout=20.0,
-                        )
+    async def get_read_session(self) -> AsyncIterator[AsyncSession]:
+        """Session for read-only routes; nothing is committed."""
+        async with self.get_read_session_factory()() as session:
+            yield session
+
+    @asynccontextmanager
+    async def session_scope(
+        self,
+        *,
+        readonly: bool = False,
+        name: str = "session",
+    ) -> AsyncIterator[AsyncSession]:
+        """
+        New session committed on success and rolled back on error.
+
+        The block, commit included, is limited to DB_OPERATION_TIMEOUT.
+        Readonly scopes use get_read_session_factory and never commit.
+        """
+        factory = self.get_read_session_factory() if readonly else self.session_factory
+        timeout = config.database.DB_OPERATION_TIMEOUT
+        async with factory() as session:
+            try:
+                async with asyncio.timeout(timeout):
+                    yield session
+                    if not readonly:
                         await session.commit()
-                        return res
-                    except TimeoutError as err:
-                        await session.rollback()
-                        msg = f"Operation {func.__name__} timed out after 20 seconds"
-                        raise TimeoutError(msg) from err
-                    except Exception as err:
-                        await session.rollback()
-                        raise err
+            except TimeoutError as err:
+                await session.rollback()
+                msg = f"Operation {name} timed out after {timeout:g} seconds"
+                raise TimeoutError(msg) from err
+            except Exception:
+                await session.rollback()
+                raise
 
-            return await func(*args, **kwargs)
+    def inject_session(self, func=None, *, readonly: bool = False):
+        """
+        Pass a new session to the method unless the caller gave one.
 
-        return wrapper
+        With ``readonly=True`` the session comes from the read replica (see
+        get_read_session_factory) and is never committed.
+        """
+        if func is None:
+            return functools.partial(self.inject_session, readonly=readonly)
+        name = func.__qualname__
 
-    def set_current_user(self, user):
-        self._current_user = user
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with service_call(name):
+                if "session" in kwargs:
+                    return await func(*args, **kwargs)
+
+                with span("db"):
+                    async with self.session_scope(
+                        readonly=readonly,
+                        name=func.__name__,
+                    ) as session:
+                        return await func(*args, session=session, **kwargs)
 
-    @property
-    def current_user(self):
-        return self._current_user
+        return wrapper
 
 
 provider = Provider()
@@ -1,9 +1,44 @@
-from .booking import BookingParams, BookingService
+from .booking import (
+    BookingCursor,
+    BookingExportFilters,
+    BookingPage,
+    BookingParams,
+    BookingRejectReason,
+    BookingScope,
+    BookingService,
+    BookingView,
+    BulkBookingItem,
+    BulkBookingResult,
+    has_conflict,
+    record_created,
+    reminder_rows,
+    validate_period,
+)
+from .holds import SlotHolds, slot_holds
+from .recurring import RecurringBookingParams, RecurringBookingService
 
 booking_service = BookingService()
+recurring_booking_service = RecurringBookingService()
 
 __all__ = [
+    "BookingCursor",
+    "BookingExportFilters",
+    "BookingPage",
     "BookingParams",
+    "BookingRejectReason",
+    "BookingScope",
     "BookingService",
+    "BookingView",
+    "BulkBookingItem",
+    "BulkBookingResult",
+    "RecurringBookingParams",
+    "RecurringBookingService",
+    "SlotHolds",
     "booking_service",
+    "has_conflict",
+    "record_created",
+    "recurring_booking_service",
+    "reminder_rows",
+    "slot_holds",
+    "validate_period",
 ]
@@ -1,14 +1,19 @@
-from dataclasses import dataclass
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from enum import StrEnum
 from uuid import UUID
 
 import sqlalchemy as sa
 
 from app.depends import AsyncSession, provider
+from app.infrastructure.cache import cached
 from app.infrastructure.database import Booking, Resource
 from app.infrastructure.database.models.notification import (
     Notification,
     NotificationStatus,
+    NotificationType,
 )
 from app.metrics.business import (
     booking_cancelled_total,
@@ -16,10 +21,21 @@ from app.metrics.business import (
     booking_duration_seconds,
     booking_lead_time_seconds,
     booking_status_changed_total,
+    customer_label,
 )
 
+from .holds import slot_holds
+from .intervals import Profile, occupancy, occupy, peak
+from .recurrence import load_recurring_busy
+
 # Maximum booking duration: 3 years in the future
 MAX_BOOKING_DURATION_DAYS = 365 * 3
+DEFAULT_PAGE_SIZE = 20
+EXPORT_BATCH_SIZE = 1000
+MAX_BULK_BOOKINGS = 500
+# Seconds a cached snapshot of a resource's bookings may be served
+RESOURCE_SNAPSHOT_TTL = 5.0
+_CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
 
 @dataclass
@@ -34,6 +50,187 @@ class BookingParams:
     source: str = "api"
 
 
+class BookingScope(StrEnum):
+    """Which bookings of a user to list."""
+
+    UPCOMING = "upcoming"  # Not finished yet, soonest first
+    PAST = "past"  # Already finished, latest first
+
+
+@dataclass(frozen=True)
+class BookingCursor:
+    """Keyset position on (start_time, id) used for paging bookings.
+
+    Encoded as ``<n|p><start_time in microseconds>_<id>``: short enough for
+    Telegram callback data and opaque for API clients.
+    """
+
+    start_time: datetime
+    id: int
+    backward: bool = False
+
+    def encode(self) -> str:
+        micros = (self.start_time - _CURSOR_EPOCH) // timedelta(microseconds=1)
+        return f"{'p' if self.backward else 'n'}{micros}_{self.id}"
+
+    @classmethod
+    def decode(cls, token: str) -> "BookingCursor":
+        msg = "Invalid booking cursor"
+        direction = token[:1]
+        micros, _, booking_id = token[1:].partition("_")
+        if direction not in {"n", "p"}:
+            raise ValueError(msg)
+        try:
+            return cls(
+                start_time=_CURSOR_EPOCH + timedelta(microseconds=int(micros)),
+                id=int(booking_id),
+                backward=direction == "p",
+            )
+        except (OverflowError, ValueError) as err:
+            raise ValueError(msg) from err
+
+
+@dataclass(frozen=True, slots=True)
+class BookingView:
+    """
+    Read-only booking for list views.
+
+    Built from selected columns, so reading it creates no ORM object and
+    leaves nothing in the session's identity map.
+    """
+
+    id: int
+    user_id: UUID
+    resource_id: int
+    start_time: datetime
+    end_time: datetime
+    created_at: datetime
+    resource_name: str | None = None
+
+
+def has_conflict(
+    bookings: list[BookingView],
+    start: datetime,
+    end: datetime,
+    capacity: int = 1,
+) -> bool:
+    """Check whether bookings fill the capacity at some moment of [start, end)."""
+    profile = occupancy(
+        [
+            (b.start_time, b.end_time)
+            for b in bookings
+            if b.start_time < end and b.end_time > start
+        ],
+    )
+    return peak(profile, start, end) >= capacity
+
+
+# Columns of BookingView in field order, resource_name excluded
+_VIEW_COLUMNS = (
+    Booking.id,
+    Booking.user_id,
+    Booking.resource_id,
+    Booking.start_time,
+    Booking.end_time,
+    Booking.created_at,
+)
+
+
+@dataclass
+class BookingPage:
+    """One page of bookings with resource names and cursors to neighbours."""
+
+    items: list[BookingView] = field(default_factory=list)
+    next_cursor: BookingCursor | None = None
+    prev_cursor: BookingCursor | None = None
+
+
+@dataclass(frozen=True)
+class BookingExportFilters:
+    """Filters for exporting bookings of a customer."""
+
+    customer_id: UUID
+    start: datetime | None = None
+    end: datetime | None = None
+    resource_id: int | None = None
+
+
+class BookingRejectReason:
+    """Reasons for rejecting an item of a bulk booking request."""
+
+    INVALID_TIME_RANGE = "invalid_time_range"  # End is not after start
+    NAIVE_DATETIME = "naive_datetime"  # Time without timezone
+    IN_PAST = "in_past"  # Start is in the past
+    TOO_FAR = "too_far"  # End is more than 3 years ahead
+    RESOURCE_NOT_FOUND = "resource_not_found"  # Missing or of another customer
+    CONFLICT = "conflict"  # Capacity filled by bookings or earlier items
+
+
+@dataclass(frozen=True)
+class BulkBookingItem:
+    """One booking of a bulk request."""
+
+    resource_id: int
+    start_time: datetime
+    end_time: datetime
+
+
+@dataclass
+class BulkBookingResult:
+    """Outcome of one bulk item: created booking or rejection reason."""
+
+    index: int
+    booking: Booking | None = None
+    resource_name: str | None = None
+    error: str | None = None
+
+
+def validate_period(start: datetime, end: datetime, now: datetime) -> str | None:
+    """Return a BookingRejectReason if the period cannot be booked."""
+    if start.tzinfo is None or end.tzinfo is None:
+        return BookingRejectReason.NAIVE_DATETIME
+    if end <= start:
+        return BookingRejectReason.INVALID_TIME_RANGE
+    if start < now:
+        return BookingRejectReason.IN_PAST
+    if end > now + timedelta(days=MAX_BOOKING_DURATION_DAYS):
+        return BookingRejectReason.TOO_FAR
+    return None
+
+
+def reminder_rows(booking_id: int, user_id: UUID, start_time: datetime) -> list:
+    """Rows of the 24h and 1h reminders sent before a booking starts."""
+    return [
+        {
+            "booking_id": booking_id,
+            "user_id": user_id,
+            "type": notification_type,
+            "status": NotificationStatus.PENDING,
+            "scheduled_at": start_time - before,
+        }
+        for notification_type, before in (
+            (NotificationType.BOOKING_24H, timedelta(hours=24)),
+            (NotificationType.BOOKING_1H, timedelta(hours=1)),
+        )
+    ]
+
+
+def record_created(params: BookingParams, now: datetime) -> None:
+    """Record business metrics of a created booking."""
+    customer_id = customer_label(params.customer_id)
+    booking_created_total.labels(
+        source=params.source,
+        customer_id=customer_id,
+    ).inc()
+    booking_duration_seconds.labels(
+        customer_id=customer_id,
+    ).observe((params.end_time - params.start_time).total_seconds())
+    # Lead time is the time from creation to start
+    booking_lead_time_seconds.labels(
+        customer_id=customer_id,
+    ).observe((params.start_time - now).total_seconds())
+
+
 class BookingService:
     """Service for managing bookings with conflict detection."""
 
@@ -43,16 +240,38 @@ class BookingService:
         resource_id: int,
         start_time: datetime,
         end_time: datetime,
+        holder: UUID | None = None,
         session: AsyncSession = None,
     ) -> bool:
         """
         Check if resource is available for the given time range.
 
-        Uses SELECT FOR UPDATE to prevent race conditions during booking creation.
-        Returns True if available (no conflicts), False otherwise.
+        The range is available while fewer than the resource's capacity
+        bookings overlap at every moment of it; the count is a sweep line
+        over the overlapping bookings, occurrences of recurring bookings and
+        periods held by other users than ``holder`` (see holds.py).
+
+        First locks the resource row with SELECT FOR UPDATE and reads the
+        capacity from it, then checks the holds alone, and only then queries
+        and locks the overlapping bookings. Concurrent bookings of a resource
+        are therefore serialised; this only protects anything inside the
+        transaction that inserts the booking (as in create_booking). For a
+        pre-check use get_resource_snapshot.
+        Returns True if available, False otherwise or if there is no resource.
         """
+        capacity = await session.scalar(
+            sa.select(Resource.capacity)
+            .where(Resource.id == resource_id)
+            .with_for_update(),
+        )
+        if capacity is None:
+            return False
+        held = await slot_holds.held(resource_id, exclude=holder)
+        if peak(occupancy(held), start_time, end_time) >= capacity:
+            return False
+
         stmt = (
-            sa.select(Booking)
+            sa.select(Booking.start_time, Booking.end_time)
             .where(
                 sa.and_(
                     Booking.resource_id == resource_id,
@@ -62,9 +281,18 @@ class BookingService:
             )
             .with_for_update()
         )
-        result = await session.scalars(stmt)
-        conflicting_bookings = result.all()
-        return len(conflicting_bookings) == 0
+        bookings = [tuple(row) for row in await session.execute(stmt)]
+
+        # Occurrences of recurring bookings not materialised yet
+        recurring_busy = await load_recurring_busy(
+            resource_id,
+            start_time,
+            end_time,
+            session,
+            lock=True,
+        )
+        profile = occupancy(bookings + recurring_busy + held)
+        return peak(profile, start_time, end_time) < capacity
 
     @provider.inject_session
     async def create_booking(
@@ -84,17 +312,7 @@ class BookingService:
         """
         now = datetime.now(timezone.utc)
 
-        # Validate time range
-        if params.end_time <= params.start_time:
-            return None
-
-        # Validate start time is not in the past
-        if params.start_time < now:
-            return None
-
-        # Validate end time does not exceed 3 years in future
-        max_end_time = now + timedelta(days=MAX_BOOKING_DURATION_DAYS)
-        if params.end_time > max_end_time:
+        if validate_period(params.start_time, params.end_time, now) is not None:
             return None
 
         # Check if resource exists and belongs to customer
@@ -107,6 +325,7 @@ class BookingService:
             resource_id=params.resource_id,
             start_time=params.start_time,
             end_time=params.end_time,
+            holder=params.user_id,
             session=session,
         )
 
@@ -123,59 +342,191 @@ class BookingService:
         )
         await session.flush()
 
-        notification_24h_time = params.start_time - timedelta(hours=24)
-        await Notification.create(
-            booking_id=booking.id,
-            user_id=params.user_id,
-            type="booking_24h",
-            status=NotificationStatus.PENDING,
-            scheduled_at=notification_24h_time,
-            session=session,
-        )
-
-        notification_1h_time = params.start_time - timedelta(hours=1)
-        await Notification.create(
-            booking_id=booking.id,
-            user_id=params.user_id,
-            type="booking_1h",
-            status=NotificationStatus.PENDING,
-            scheduled_at=notification_1h_time,
-            session=session,
+        await session.execute(
+            sa.insert(Notification),
+            reminder_rows(booking.id, params.user_id, params.start_time),
         )
         await session.commit()
+        await self.drop_snapshots({params.resource_id})
 
-        # Record business metrics
-        booking_created_total.labels(
-            source=params.source,
-            customer_id=str(params.customer_id),
-            resource_id=str(params.resource_id),
-        ).inc()
-
-        # Record booking duration
-        duration_seconds = (params.end_time - params.start_time).total_seconds()
-        booking_duration_seconds.labels(
-            customer_id=str(params.customer_id),
-            resource_id=str(params.resource_id),
-        ).observe(duration_seconds)
-
-        # Record booking lead time (time from creation to start)
-        lead_time_seconds = (params.start_time - now).total_seconds()
-        booking_lead_time_seconds.labels(
-            customer_id=str(params.customer_id),
-            resource_id=str(params.resource_id),
-        ).observe(lead_time_seconds)
+        record_created(params, now)
 
         return booking
 
     @provider.inject_session
+    async def create_bookings_bulk(
+        self,
+        user_id: UUID,
+        customer_id: UUID,
+        items: list[BulkBookingItem],
+        *,
+        source: str = "api",
+        session: AsyncSession = None,
+    ) -> list[BulkBookingResult]:
+        """
+        Create many bookings in one transaction, reporting a result per item.
+
+        Items are validated in memory, then checked against each other and
+        against existing bookings loaded with one locking range query per
+        resource, counting overlaps up to the resource's capacity. Accepted
+        bookings and their reminders are written with multi-row INSERTs;
+        rejected items do not affect the others.
+        """
+        now = datetime.now(timezone.utc)
+        results = [BulkBookingResult(index=i) for i in range(len(items))]
+
+        pending: dict[int, list[int]] = defaultdict(list)
+        for i, item in enumerate(items):
+            error = validate_period(item.start_time, item.end_time, now)
+            if error is not None:
+                results[i].error = error
+            else:
+                pending[item.resource_id].append(i)
+
+        resources: dict[int, tuple[str, int]] = {}
+        if pending:
+            # Lock resources in a stable order so concurrent batches cannot
+            # deadlock
+            rows = await session.execute(
+                sa.select(Resource.id, Resource.name, Resource.capacity)
+                .where(
+                    sa.and_(
+                        Resource.id.in_(pending),
+                        Resource.customer_id == customer_id,
+                    ),
+                )
+                .order_by(Resource.id)
+                .with_for_update(),
+            )
+            resources = {id_: (name, capacity) for id_, name, capacity in rows}
+
+        accepted: list[int] = []
+        for resource_id in sorted(pending):
+            indexes = pending[resource_id]
+            if resource_id not in resources:
+                for i in indexes:
+                    results[i].error = BookingRejectReason.RESOURCE_NOT_FOUND
+                continue
+            busy = await self._load_busy(
+                resource_id=resource_id,
+                start=min(items[i].start_time for i in indexes),
+                end=max(items[i].end_time for i in indexes),
+                holder=user_id,
+                session=session,
+            )
+            name, capacity = resources[resource_id]
+            # Earlier items of the batch win conflicts with later ones
+            for i in indexes:
+                period = (items[i].start_time, items[i].end_time)
+                if peak(busy, *period) >= capacity:
+                    results[i].error = BookingRejectReason.CONFLICT
+                else:
+                    occupy(busy, *period)
+                    accepted.append(i)
+                    results[i].resource_name = name
+
+        if not accepted:
+            return results
+
+        accepted.sort()
+        await self._insert_accepted(user_id, items, accepted, results, session)
+        await session.commit()
+        await self.drop_snapshots({items[i].resource_id for i in accepted})
+
+        for i in accepted:
+            record_created(
+                BookingParams(
+                    user_id=user_id,
+                    customer_id=customer_id,
+                    resource_id=items[i].resource_id,
+                    start_time=items[i].start_time,
+                    end_time=items[i].end_time,
+                    source=source,
+                ),
+                now,
+            )
+        return results
+
+    async def _insert_accepted(
+        self,
+        user_id: UUID,
+        items: list[BulkBookingItem],
+        accepted: list[int],
+        results: list[BulkBookingResult],
+        session: AsyncSession,
+    ) -> None:
+        """Insert accepted items and their reminders with multi-row INSERTs."""
+        bookings = await session.scalars(
+            sa.insert(Booking).returning(Booking, sort_by_parameter_order=True),
+            [
+                {
+                    "user_id": user_id,
+                    "resource_id": items[i].resource_id,
+                    "start_time": items[i].start_time,
+                    "end_time": items[i].end_time,
+                }
+                for i in accepted
+            ],
+        )
+        for i, booking in zip(accepted, bookings.all(), strict=True):
+            results[i].booking = booking
+        await session.execute(
+            sa.insert(Notification),
+            [
+                row
+                for i in accepted
+                for row in reminder_rows(
+                    results[i].booking.id,
+                    user_id,
+                    items[i].start_time,
+                )
+            ],
+        )
+
+    async def _load_busy(
+        self,
+        resource_id: int,
+        start: datetime,
+        end: datetime,
+        holder: UUID,
+        session: AsyncSession,
+    ) -> Profile:
+        """
+        Lock busy intervals of a resource within a range, return their profile.
+
+        Periods held by other users than ``holder`` are included.
+        """
+        stmt = (
+            sa.select(Booking.start_time, Booking.end_time)
+            .where(
+                sa.and_(
+                    Booking.resource_id == resource_id,
+                    Booking.start_time < end,
+                    Booking.end_time > start,
+                ),
+            )
+            .with_for_update()
+        )
+        result = await session.execute(stmt)
+        recurring_busy = await load_recurring_busy(
+            resource_id,
+            start,
+            end,
+            session,
+            lock=True,
+        )
+        held = await slot_holds.held(resource_id, exclude=holder)
+        return occupancy([tuple(row) for row in result] + recurring_busy + held)
+
+    @provider.inject_session(readonly=True)
     async def get_user_bookings(
         self,
         user_id: UUID,
         customer_id: UUID,
         session: AsyncSession = None,
-    ) -> list[Booking]:
+    ) -> list[BookingView]:
         """Get all bookings for a user within a customer."""
-        stmt = sa.select(Booking).where(
+        stmt = sa.select(*_VIEW_COLUMNS).where(
             sa.and_(
                 Booking.user_id == user_id,
                 # Booking belongs to resources of this customer
@@ -184,29 +535,189 @@ class BookingService:
                 ),
             ),
         )
-        result = await session.scalars(stmt)
-        return result.all()
+        result = await session.execute(stmt)
+        return [BookingView(*row) for row in result]
 
     @provider.inject_session
+    async def get_user_booking(
+        self,
+        booking_id: int,
+        user_id: UUID,
+        customer_id: UUID,
+        session: AsyncSession = None,
+    ) -> tuple[Booking, str] | None:
+        """Get one booking of a user within a customer with its resource name."""
+        stmt = (
+            sa.select(Booking, Resource.name)
+            .join(Resource, Resource.id == Booking.resource_id)
+            .where(
+                sa.and_(
+                    Booking.id == booking_id,
+                    Booking.user_id == user_id,
+                    Resource.customer_id == customer_id,
+                ),
+            )
+        )
+        row = (await session.execute(stmt)).first()
+        return tuple(row) if row else None
+
+    @provider.inject_session(readonly=True)
+    async def get_user_bookings_page(  # noqa: PLR0913
+        self,
+        user_id: UUID,
+        customer_id: UUID,
+        *,
+        scope: BookingScope = BookingScope.UPCOMING,
+        cursor: BookingCursor | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        session: AsyncSession = None,
+    ) -> BookingPage:
+        """
+        Get a page of user bookings within a customer with resource names.
+
+        Uses keyset pagination on (start_time, id), so the cost of a page does
+        not depend on how deep into the history it is.
+        """
+        now = datetime.now(timezone.utc)
+        ascending = scope == BookingScope.UPCOMING
+        backward = cursor is not None and cursor.backward
+        # Paging backward walks the scope order in reverse
+        forward_order = ascending != backward
+
+        conditions = [
+            Booking.user_id == user_id,
+            Resource.customer_id == customer_id,
+            Booking.end_time > now if ascending else Booking.end_time <= now,
+        ]
+        if cursor is not None:
+            key = sa.tuple_(Booking.start_time, Booking.id)
+            position = sa.tuple_(cursor.start_time, cursor.id)
+            conditions.append(key > position if forward_order else key < position)
+
+        if forward_order:
+            order_by = (Booking.start_time.asc(), Booking.id.asc())
+        else:
+            order_by = (Booking.start_time.desc(), Booking.id.desc())
+
+        stmt = (
+            sa.select(*_VIEW_COLUMNS, Resource.name)
+            .join(Resource, Resource.id == Booking.resource_id)
+            .where(sa.and_(*conditions))
+            .order_by(*order_by)
+            .limit(limit + 1)
+        )
+        result = await session.execute(stmt)
+        rows = [BookingView(*row) for row in result]
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if backward:
+            rows.reverse()
+        if not rows:
+            return BookingPage()
+
+        first, last = rows[0], rows[-1]
+        has_next = True if backward else has_more
+        has_prev = has_more if backward else cursor is not None
+        return BookingPage(
+            items=rows,
+            next_cursor=BookingCursor(last.start_time, last.id) if has_next else None,
+            prev_cursor=(
+                BookingCursor(first.start_time, first.id, backward=True)
+                if has_prev
+                else None
+            ),
+        )
+
+    async def iter_customer_bookings(
+        self,
+        filters: BookingExportFilters,
+        batch_size: int = EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[sa.Row]:
+        """
+        Iterate over bookings of a customer using a server-side cursor.
+
+        Rows are fetched from the database in batches of batch_size, so memory
+        stays flat regardless of the export size. The generator owns its session
+        because it outlives the request handler that starts it.
+        """
+        conditions = [Resource.customer_id == filters.customer_id]
+        if filters.start is not None:
+            conditions.append(Booking.end_time > filters.start)
+        if filters.end is not None:
+            conditions.append(Booking.start_time < filters.end)
+        if filters.resource_id is not None:
+            conditions.append(Booking.resource_id == filters.resource_id)
+
+        stmt = (
+            sa.select(
+                Booking.id,
+                Booking.resource_id,
+                Resource.name.label("resource_name"),
+                Booking.user_id,
+                Booking.start_time,
+                Booking.end_time,
+                Booking.created_at,
+            )
+            .join(Resource, Resource.id == Booking.resource_id)
+            .where(sa.and_(*conditions))
+            .order_by(Booking.start_time.asc(), Booking.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async with provider.get_read_session_factory()() as session:
+            result = await session.stream(stmt)
+            async for row in result:
+                yield row
+
+    @provider.inject_session(readonly=True)
     async def get_resource_bookings(
         self,
         resource_id: int,
         session: AsyncSession = None,
-    ) -> list[Booking]:
-        """Get all future bookings for a resource."""
+    ) -> list[BookingView]:
+        """Get bookings of a resource that have not ended yet."""
         now = datetime.now(timezone.utc)
         stmt = (
-            sa.select(Booking)
+            sa.select(*_VIEW_COLUMNS)
             .where(
                 sa.and_(
                     Booking.resource_id == resource_id,
-                    Booking.start_time >= now,  # Only future bookings
+                    # Running bookings too, new periods may overlap them
+                    Booking.end_time > now,
                 ),
             )
             .order_by(Booking.start_time.asc())
         )
-        result = await session.scalars(stmt)
-        return list(result.all())
+        result = await session.execute(stmt)
+        return [BookingView(*row) for row in result]
+
+    @cached("resource_bookings", ttl=RESOURCE_SNAPSHOT_TTL)
+    @provider.inject_session
+    async def get_resource_snapshot(
+        self,
+        resource_id: int,
+        session: AsyncSession = None,
+    ) -> list[BookingView]:
+        """
+        Not ended bookings of a resource, cached for RESOURCE_SNAPSHOT_TTL.
+
+        For display and lock-free pre-checks only: the snapshot is dropped in
+        every worker when bookings of the resource are created or cancelled
+        here or by RecurringBookingService, but occurrences of series beyond
+        the materialised horizon are not in it, so create_booking stays the
+        authoritative check. A miss reads the
+        primary, not the replica: it usually follows such a drop, and a
+        lagging replica would cache the old bookings for the whole TTL.
+        """
+        return await self.get_resource_bookings(
+            resource_id=resource_id,
+            session=session,
+        )
+
+    async def drop_snapshots(self, resource_ids: set[int]) -> None:
+        """Invalidate cached snapshots of resources whose bookings changed."""
+        for resource_id in resource_ids:
+            await self.get_resource_snapshot.invalidate(self, resource_id)
 
     @provider.inject_session
     async def cancel_booking(
@@ -236,20 +747,19 @@ class BookingService:
         await session.delete(booking)
         try:
             await session.commit()
+            await self.drop_snapshots({booking.resource_id})
 
             # Record business metrics for cancellation
             booking_cancelled_total.labels(
                 source=source,
-                customer_id=str(customer_id),
-                resource_id=str(booking.resource_id),
+                customer_id=customer_label(customer_id),
             ).inc()
 
             # Record status change metric
             booking_status_changed_total.labels(
                 from_status="active",
                 to_status="cancelled",
-                customer_id=str(customer_id),
-                resource_id=str(booking.resource_id),
+                customer_id=customer_label(customer_id),
             ).inc()
 
         except Exception:
@@ -0,0 +1,221 @@
+"""
+Temporary holds on booking periods.
+
+A user who entered a period in the bot holds it for BOOKING_HOLD_SECONDS
+while confirming; meanwhile check_availability and bulk creation treat it as
+busy for everyone else, taking one seat of the resource's capacity. A user
+has at most one hold per resource, a new one replaces it. With
+CACHE_REDIS_DSN holds live in Redis, one hash per resource
+(``<prefix>:holds:<resource_id>``, holder -> "start,end,expires_at" in epoch
+milliseconds), and are shared by all workers; otherwise they are per
+process. Holds only save wasted attempts, bookings are still checked under
+lock, so Redis errors are logged and treated as no holds.
+"""
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+import time
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from app.config import config
+from app.infrastructure.cache import cache_backend
+from app.infrastructure.cache.backend import RedisBackend
+from app.log import log
+from app.metrics.cache import cache_errors_total
+
+from .intervals import Interval, occupancy, peak
+
+if TYPE_CHECKING:
+    from redis.commands.core import AsyncScript
+
+# Drops expired holds, refuses the period if the caller's bookings (ARGV[8..]
+# as start, end pairs) and live holds of other holders together already fill
+# the capacity (ARGV[7]) at some moment of it (sweep over their clipped
+# endpoints), else stores the caller's hold. Atomic, so two workers cannot
+# both take the last seat.
+_HOLD_SCRIPT = """
+local now = tonumber(ARGV[1])
+local start = tonumber(ARGV[3])
+local stop = tonumber(ARGV[4])
+local events = {}
+for i = 8, #ARGV - 1, 2 do
+    local s, e = tonumber(ARGV[i]), tonumber(ARGV[i + 1])
+    if s < stop and e > start then
+        table.insert(events, {math.max(s, start), 1})
+        table.insert(events, {math.min(e, stop), -1})
+    end
+end
+local entries = redis.call('HGETALL', KEYS[1])
+for i = 1, #entries, 2 do
+    local s, e, exp = string.match(entries[i + 1], '(%d+),(%d+),(%d+)')
+    s, e = tonumber(s), tonumber(e)
+    if tonumber(exp) <= now then
+        redis.call('HDEL', KEYS[1], entries[i])
+    elseif entries[i] ~= ARGV[2] and s < stop and e > start then
+        table.insert(events, {math.max(s, start), 1})
+        table.insert(events, {math.min(e, stop), -1})
+    end
+end
+table.sort(events, function(a, b)
+    if a[1] == b[1] then return a[2] < b[2] end
+    return a[1] < b[1]
+end)
+local level = 0
+for _, event in ipairs(events) do
+    level = level + event[2]
+    if level >= tonumber(ARGV[7]) then
+        return 0
+    end
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3] .. ',' .. ARGV[4] .. ',' .. ARGV[5])
+redis.call('PEXPIRE', KEYS[1], ARGV[6])
+return 1
+"""
+
+
+def _ms(dt: datetime) -> int:
+    return int(dt.timestamp() * 1000)
+
+
+def _dt(ms: int) -> datetime:
+    return datetime.fromtimestamp(ms / 1000, UTC)
+
+
+class SlotHolds:
+    """TTL leases on (resource, period) taken while a booking is confirmed."""
+
+    name = "slot_holds"
+
+    def __init__(self, backend: RedisBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self._script: AsyncScript | None = None
+        # resource id -> holder -> (start, end, expires_at in epoch ms)
+        self._local: dict[int, dict[str, tuple[int, int, int]]] = {}
+
+    async def hold(  # noqa: PLR0913
+        self,
+        resource_id: int,
+        holder: UUID,
+        start: datetime,
+        end: datetime,
+        capacity: int = 1,
+        *,
+        booked: Iterable[Interval] = (),
+    ) -> bool:
+        """
+        Hold the period for holder.
+
+        ``booked`` are the resource's bookings as the caller knows them (e.g.
+        from get_resource_snapshot); False if they and the holds of other
+        holders together fill the capacity at some moment of the period.
+        """
+        now = int(time.time() * 1000)
+        entry = (_ms(start), _ms(end), now + int(self.ttl * 1000))
+        busy = [(_ms(s), _ms(e)) for s, e in booked]
+        if not self.backend.enabled:
+            return self._hold_local(
+                resource_id,
+                str(holder),
+                entry,
+                now,
+                capacity,
+                booked=busy,
+            )
+        if self._script is None:
+            self._script = self.backend.client.register_script(_HOLD_SCRIPT)
+        try:
+            # Registered once; run on the current client, which the backend
+            # recreates after stop()
+            held = await self._script(
+                client=self.backend.client,
+                keys=[self._key(resource_id)],
+                args=[
+                    now,
+                    str(holder),
+                    *entry,
+                    int(self.ttl * 1000),
+                    capacity,
+                    *(ms for interval in busy for ms in interval),
+                ],
+            )
+        except (RedisError, OSError) as e:
+            self._error("hold", e)
+            return True
+        return bool(held)
+
+    async def release(self, resource_id: int, holder: UUID) -> None:
+        if not self.backend.enabled:
+            self._local.get(resource_id, {}).pop(str(holder), None)
+            return
+        try:
+            await self.backend.client.hdel(self._key(resource_id), str(holder))
+        except (RedisError, OSError) as e:
+            self._error("release", e)
+
+    async def held(
+        self,
+        resource_id: int,
+        *,
+        exclude: UUID | None = None,
+    ) -> list[Interval]:
+        """Live held periods of a resource, except those of ``exclude``."""
+        now = int(time.time() * 1000)
+        if not self.backend.enabled:
+            entries = self._local.get(resource_id, {})
+        else:
+            try:
+                raw = await self.backend.client.hgetall(self._key(resource_id))
+            except (RedisError, OSError) as e:
+                self._error("held", e)
+                return []
+            entries = {
+                holder.decode(): tuple(map(int, value.split(b",")))
+                for holder, value in raw.items()
+            }
+        skipped = str(exclude) if exclude is not None else None
+        return sorted(
+            (_dt(start), _dt(end))
+            for holder, (start, end, expires_at) in entries.items()
+            if expires_at > now and holder != skipped
+        )
+
+    def _hold_local(  # noqa: PLR0913
+        self,
+        resource_id: int,
+        holder: str,
+        entry: tuple[int, int, int],
+        now: int,
+        capacity: int,
+        *,
+        booked: list[tuple[int, int]],
+    ) -> bool:
+        holds = self._local.setdefault(resource_id, {})
+        others = list(booked)
+        for other, (start, end, expires_at) in list(holds.items()):
+            if expires_at <= now:
+                del holds[other]
+            elif other != holder:
+                others.append((start, end))
+        if peak(occupancy(others), entry[0], entry[1]) >= capacity:
+            return False
+        holds[holder] = entry
+        return True
+
+    def _key(self, resource_id: int) -> str:
+        return self.backend.key("holds", str(resource_id))
+
+    def _error(self, operation: str, error: Exception) -> None:
+        cache_errors_total.labels(cache=self.name, operation=operation).inc()
+        log(
+            level="WARN",
+            method=f"slot_holds_{operation}",
+            path="SlotHolds",
+            text_detail=f"Redis error, holds are not enforced: {error}",
+        )
+
+
+slot_holds = SlotHolds(cache_backend, config.booking.BOOKING_HOLD_SECONDS)
@@ -0,0 +1,65 @@
+"""Counting overlaps of (start, end) time intervals with a sweep line."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from datetime import datetime
+from operator import itemgetter
+
+Interval = tuple[datetime, datetime]
+# Sorted (time, count) breakpoints: count intervals cover [time, next time)
+Profile = list[tuple[datetime, int]]
+
+
+def occupancy(intervals: list[Interval]) -> Profile:
+    """Build the overlap count profile of intervals with a sweep line.
+
+    Endpoints are sorted once, O(n log n); intervals are half-open, so one
+    ending where another starts does not add to the count.
+    """
+    events = sorted(
+        [(start, 1) for start, _ in intervals] + [(end, -1) for _, end in intervals],
+    )
+    profile: Profile = []
+    count = 0
+    for time, delta in events:
+        count += delta
+        if profile and profile[-1][0] == time:
+            profile[-1] = (time, count)
+        else:
+            profile.append((time, count))
+    return profile
+
+
+def levels(
+    profile: Profile,
+    start: datetime,
+    end: datetime,
+) -> Iterator[tuple[datetime, datetime, int]]:
+    """Split [start, end) into (start, end, count) pieces of constant count.
+
+    O(log n + k) for the k breakpoints inside the range.
+    """
+    idx = bisect_right(profile, start, key=itemgetter(0))
+    level = profile[idx - 1][1] if idx else 0
+    while idx < len(profile) and profile[idx][0] < end:
+        yield start, profile[idx][0], level
+        start, level = profile[idx]
+        idx += 1
+    yield start, end, level
+
+
+def peak(profile: Profile, start: datetime, end: datetime) -> int:
+    """Return the largest overlap count within [start, end)."""
+    return max(level for _, _, level in levels(profile, start, end))
+
+
+def occupy(profile: Profile, start: datetime, end: datetime) -> None:
+    """Add the interval [start, end) to the profile in place."""
+    for time in (start, end):
+        idx = bisect_left(profile, time, key=itemgetter(0))
+        if idx == len(profile) or profile[idx][0] != time:
+            profile.insert(idx, (time, profile[idx - 1][1] if idx else 0))
+    idx = bisect_left(profile, start, key=itemgetter(0))
+    while profile[idx][0] < end:
+        profile[idx] = (profile[idx][0], profile[idx][1] + 1)
+        idx += 1
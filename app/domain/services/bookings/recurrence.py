@@ -0,0 +1,216 @@
+"""RRULE-style recurrence rules and lazy expansion into occurrences.
+
+Supported subset of RFC 5545: ``FREQ=DAILY|WEEKLY`` with ``INTERVAL``,
+``BYDAY`` (weekly only) and either ``COUNT`` or ``UNTIL``, e.g.
+``FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH;UNTIL=20261231T000000Z``.
+"""
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from enum import StrEnum
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+import sqlalchemy as sa
+
+from app.depends import AsyncSession
+from app.infrastructure.database import RecurringBooking
+
+from .intervals import Interval
+
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+MAX_COUNT = 1000
+
+
+class Frequency(StrEnum):
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """Parsed recurrence rule; byday holds weekday numbers (Monday is 0)."""
+
+    freq: Frequency
+    interval: int = 1
+    byday: tuple[int, ...] = ()
+    count: int | None = None
+    until: datetime | None = None
+
+    def __str__(self) -> str:
+        parts = [f"FREQ={self.freq}", f"INTERVAL={self.interval}"]
+        if self.byday:
+            parts.append("BYDAY=" + ",".join(WEEKDAYS[d] for d in self.byday))
+        if self.count is not None:
+            parts.append(f"COUNT={self.count}")
+        if self.until is not None:
+            parts.append(f"UNTIL={self.until:%Y%m%dT%H%M%SZ}")
+        return ";".join(parts)
+
+    def dates(self, first: date, from_date: date) -> Iterator[date]:
+        """Yield local dates of occurrences from the period holding from_date."""
+        if self.freq == Frequency.DAILY:
+            step = timedelta(days=self.interval)
+            k = max(0, (from_date - first).days // self.interval)
+            day = first + k * step
+            while True:
+                yield day
+                day += step
+
+        week = first - timedelta(days=first.weekday())
+        step = timedelta(weeks=self.interval)
+        week += max(0, (from_date - week).days // 7 // self.interval) * step
+        byday = self.byday or (first.weekday(),)
+        while True:
+            for weekday in byday:
+                day = week + timedelta(days=weekday)
+                if day >= first:
+                    yield day
+            week += step
+
+
+@lru_cache(maxsize=1024)
+def parse_rule(text: str) -> RecurrenceRule:
+    """Parse an RRULE string; raises ValueError for unsupported rules."""
+    fields = {}
+    for part in text.removeprefix("RRULE:").split(";"):
+        key, sep, value = part.partition("=")
+        if not sep or not value:
+            msg = f"Invalid rule part: {part!r}"
+            raise ValueError(msg)
+        fields[key.strip().upper()] = value.strip().upper()
+
+    try:
+        freq = Frequency(fields.pop("FREQ", ""))
+    except ValueError as err:
+        msg = "FREQ must be DAILY or WEEKLY"
+        raise ValueError(msg) from err
+
+    try:
+        interval = int(fields.pop("INTERVAL", "1"))
+        count = int(fields["COUNT"]) if "COUNT" in fields else None
+        until = (
+            datetime.strptime(fields["UNTIL"], "%Y%m%dT%H%M%SZ").replace(
+                tzinfo=timezone.utc,
+            )
+            if "UNTIL" in fields
+            else None
+        )
+        byday = (
+            tuple(
+                sorted({WEEKDAYS.index(d) for d in fields["BYDAY"].split(",")}),
+            )
+            if "BYDAY" in fields
+            else ()
+        )
+    except ValueError as err:
+        msg = "Invalid INTERVAL, COUNT, UNTIL or BYDAY value"
+        raise ValueError(msg) from err
+    fields.pop("COUNT", None)
+    fields.pop("UNTIL", None)
+    fields.pop("BYDAY", None)
+
+    if fields:
+        msg = f"Unsupported rule parts: {', '.join(sorted(fields))}"
+        raise ValueError(msg)
+    if interval < 1:
+        msg = "INTERVAL must be positive"
+        raise ValueError(msg)
+    if count is not None and not 1 <= count <= MAX_COUNT:
+        msg = f"COUNT must be between 1 and {MAX_COUNT}"
+        raise ValueError(msg)
+    if count is not None and until is not None:
+        msg = "COUNT and UNTIL cannot be used together"
+        raise ValueError(msg)
+    if byday and freq != Frequency.WEEKLY:
+        msg = "BYDAY is supported only for WEEKLY rules"
+        raise ValueError(msg)
+    return RecurrenceRule(
+        freq=freq,
+        interval=interval,
+        byday=byday,
+        count=count,
+        until=until,
+    )
+
+
+def expand(  # noqa: PLR0913
+    rule: RecurrenceRule,
+    dtstart: datetime,
+    duration: timedelta,
+    tz: ZoneInfo,
+    *,
+    start_from: datetime,
+    before: datetime,
+) -> Iterator[Interval]:
+    """Lazily yield occurrences starting within [start_from, before).
+
+    Occurrences keep the local wall-clock time of dtstart in tz, so a weekly
+    10:00 meeting stays at 10:00 across DST changes. Rules without COUNT jump
+    straight to start_from instead of walking from dtstart.
+    """
+    local_start = dtstart.astimezone(tz)
+    first = local_start.date()
+    from_date = first if rule.count is not None else start_from.astimezone(tz).date()
+    for n, day in enumerate(rule.dates(first, from_date)):
+        if rule.count is not None and n >= rule.count:
+            return
+        start = datetime.combine(day, local_start.timetz().replace(tzinfo=tz))
+        start = start.astimezone(timezone.utc)
+        if start >= before or (rule.until is not None and start > rule.until):
+            return
+        if start >= start_from:
+            yield start, start + duration
+
+
+def series_occurrences(
+    series: RecurringBooking,
+    start_from: datetime,
+    before: datetime,
+) -> Iterator[Interval]:
+    """Occurrences of a stored series starting within [start_from, before)."""
+    return expand(
+        parse_rule(series.rule),
+        series.dtstart,
+        series.duration,
+        ZoneInfo(series.timezone),
+        start_from=start_from,
+        before=before,
+    )
+
+
+async def load_recurring_busy(
+    resource_id: int,
+    start: datetime,
+    end: datetime,
+    session: AsyncSession,
+    *,
+    lock: bool = False,
+) -> list[Interval]:
+    """
+    Busy intervals of a resource within [start, end) from series not yet
+    materialised into bookings. Occurrences of different series may overlap
+    and are kept apart, so that overlaps can be counted (intervals.occupancy).
+
+    Occurrences before a series' materialized_until already exist as Booking
+    rows (or were cancelled), so only the part after it is expanded.
+    """
+    stmt = sa.select(RecurringBooking).where(
+        sa.and_(
+            RecurringBooking.resource_id == resource_id,
+            RecurringBooking.dtstart < end,
+            RecurringBooking.materialized_until < end,
+            sa.or_(
+                RecurringBooking.ends_at.is_(None),
+                RecurringBooking.ends_at > start,
+            ),
+        ),
+    )
+    if lock:
+        stmt = stmt.with_for_update()
+    busy: list[Interval] = []
+    for series in await session.scalars(stmt):
+        start_from = max(series.materialized_until, start - series.duration)
+        busy.extend(series_occurrences(series, start_from, end))
+    return busy
@@ -0,0 +1,282 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from itertools import pairwise
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+import sqlalchemy as sa
+
+from app.depends import AsyncSession, provider
+from app.infrastructure.database import Booking, RecurringBooking, Resource
+from app.infrastructure.database.models.notification import Notification
+from app.log import log
+
+from .booking import (
+    MAX_BOOKING_DURATION_DAYS,
+    BookingParams,
+    BookingService,
+    record_created,
+    reminder_rows,
+    validate_period,
+)
+from .holds import slot_holds
+from .intervals import occupancy, peak
+from .recurrence import (
+    expand,
+    load_recurring_busy,
+    parse_rule,
+    series_occurrences,
+)
+
+# Occurrences starting within this many days are stored as Booking rows
+RECURRENCE_HORIZON_DAYS = 28
+
+
+@dataclass
+class RecurringBookingParams:
+    """Parameters for creating a recurring booking; times are the first one."""
+
+    user_id: UUID
+    customer_id: UUID
+    resource_id: int
+    start_time: datetime
+    end_time: datetime
+    rule: str
+    timezone: str = "UTC"
+    source: str = "api"
+
+
+class RecurringBookingService:
+    """Service for repeating bookings stored as one rule."""
+
+    # Owns the cached resource snapshots, which list occurrences as bookings
+    _bookings = BookingService()
+
+    @provider.inject_session
+    async def create_recurring_booking(
+        self,
+        params: RecurringBookingParams,
+        session: AsyncSession = None,
+    ) -> RecurringBooking | None:
+        """
+        Create a series and materialise its occurrences within the horizon.
+
+        Returns None if the first occurrence is invalid, the resource does not
+        belong to the customer, occurrences overlap each other or existing
+        bookings, other series and periods held by other users (see holds.py)
+        fill the resource's capacity during any of them. Conflicts are checked
+        up to the booking limit of 3 years, since no booking can be made later
+        than that. Raises ValueError for an invalid rule or timezone and for a
+        COUNT or UNTIL series ending after that limit.
+        """
+        rule = parse_rule(params.rule)
+        tz = ZoneInfo(params.timezone)
+        now = datetime.now(timezone.utc)
+        if validate_period(params.start_time, params.end_time, now) is not None:
+            return None
+        check_until = now + timedelta(days=MAX_BOOKING_DURATION_DAYS)
+        if rule.until is not None and rule.until > check_until:
+            msg = f"UNTIL must be within {MAX_BOOKING_DURATION_DAYS} days from now"
+            raise ValueError(msg)
+
+        # Locked like in check_availability, so bookings of the resource
+        # cannot be created concurrently
+        resource = await session.scalar(
+            sa.select(Resource)
+            .where(Resource.id == params.resource_id)
+            .with_for_update(),
+        )
+        if not resource or resource.customer_id != params.customer_id:
+            return None
+
+        duration = params.end_time - params.start_time
+        occurrences = list(
+            expand(
+                rule,
+                params.start_time,
+                duration,
+                tz,
+                start_from=params.start_time,
+                before=check_until,
+            ),
+        )
+        if not occurrences:
+            return None
+        if rule.count is not None and len(occurrences) < rule.count:
+            msg = f"COUNT must end within {MAX_BOOKING_DURATION_DAYS} days from now"
+            raise ValueError(msg)
+        # A series must not overlap itself
+        if any(prev[1] > cur[0] for prev, cur in pairwise(occurrences)):
+            return None
+
+        window_end = occurrences[-1][1]
+        existing = await session.execute(
+            sa.select(Booking.start_time, Booking.end_time)
+            .where(
+                sa.and_(
+                    Booking.resource_id == params.resource_id,
+                    Booking.start_time < window_end,
+                    Booking.end_time > params.start_time,
+                ),
+            )
+            .with_for_update(),
+        )
+        busy = occupancy(
+            [tuple(row) for row in existing]
+            + await load_recurring_busy(
+                params.resource_id,
+                params.start_time,
+                window_end,
+                session,
+                lock=True,
+            )
+            + await slot_holds.held(params.resource_id, exclude=params.user_id),
+        )
+        if any(peak(busy, *period) >= resource.capacity for period in occurrences):
+            return None
+
+        # A finite series ends within check_until, so it is fully expanded
+        finite = rule.count is not None or rule.until is not None
+
+        series = RecurringBooking(
+            resource_id=params.resource_id,
+            user_id=params.user_id,
+            dtstart=params.start_time,
+            duration=duration,
+            rule=str(rule),
+            timezone=params.timezone,
+            ends_at=occurrences[-1][1] if finite else None,
+            materialized_until=params.start_time,
+        )
+        session.add(series)
+        await session.flush()
+        await self._materialize(series, now, session)
+        await session.commit()
+        await self._bookings.drop_snapshots({params.resource_id})
+
+        record_created(
+            BookingParams(
+                user_id=params.user_id,
+                customer_id=params.customer_id,
+                resource_id=params.resource_id,
+                start_time=params.start_time,
+                end_time=params.end_time,
+                source=f"{params.source}_recurring",
+            ),
+            now,
+        )
+        return series
+
+    @provider.inject_session
+    async def cancel_recurring_booking(
+        self,
+        series_id: int,
+        user_id: UUID,
+        session: AsyncSession = None,
+    ) -> bool:
+        """
+        Delete a series and its future occurrences; past ones stay as history.
+
+        Returns False if the series is not found or belongs to another user.
+        """
+        series = await RecurringBooking.get(id=series_id, session=session)
+        if not series or series.user_id != user_id:
+            return False
+
+        await session.execute(
+            sa.delete(Booking).where(
+                sa.and_(
+                    Booking.recurring_id == series_id,
+                    Booking.start_time > datetime.now(timezone.utc),
+                ),
+            ),
+        )
+        await session.delete(series)
+        await session.commit()
+        await self._bookings.drop_snapshots({series.resource_id})
+        return True
+
+    @provider.inject_session
+    async def materialize_recurring_bookings(
+        self,
+        session: AsyncSession = None,
+    ) -> int:
+        """Extend all series up to the rolling horizon; returns series count."""
+        now = datetime.now(timezone.utc)
+        horizon = now + timedelta(days=RECURRENCE_HORIZON_DAYS)
+        stmt = (
+            sa.select(RecurringBooking)
+            .where(
+                sa.and_(
+                    RecurringBooking.materialized_until < horizon,
+                    sa.or_(
+                        RecurringBooking.ends_at.is_(None),
+                        RecurringBooking.ends_at > RecurringBooking.materialized_until,
+                    ),
+                ),
+            )
+            .with_for_update(skip_locked=True)
+        )
+        series_list = (await session.scalars(stmt)).all()
+        extended = set()
+        for series in series_list:
+            if await self._materialize(series, now, session):
+                extended.add(series.resource_id)
+        await session.commit()
+        await self._bookings.drop_snapshots(extended)
+
+        if series_list:
+            log(
+                level="info",
+                method="materialize_recurring_bookings",
+                path="RecurringBookingService",
+                text_detail=f"Extended {len(series_list)} recurring bookings",
+            )
+        return len(series_list)
+
+    async def _materialize(
+        self,
+        series: RecurringBooking,
+        now: datetime,
+        session: AsyncSession,
+    ) -> bool:
+        """
+        Insert occurrences up to the horizon as bookings with reminders.
+
+        Returns whether any booking was inserted.
+        """
+        horizon = now + timedelta(days=RECURRENCE_HORIZON_DAYS)
+        occurrences = list(
+            series_occurrences(series, series.materialized_until, horizon),
+        )
+        series.materialized_until = horizon
+        if not occurrences:
+            return False
+
+        booking_ids = await session.scalars(
+            sa.insert(Booking).returning(Booking.id, sort_by_parameter_order=True),
+            [
+                {
+                    "user_id": series.user_id,
+                    "resource_id": series.resource_id,
+                    "recurring_id": series.id,
+                    "start_time": start,
+                    "end_time": end,
+                }
+                for start, end in occurrences
+            ],
+        )
+        # Reminders already due are skipped for occurrences starting soon
+        reminders = [
+            row
+            for booking_id, (start, _) in zip(
+                booking_ids.all(),
+                occurrences,
+                strict=True,
+            )
+            for row in reminder_rows(booking_id, series.user_id, start)
+            if row["scheduled_at"] > now
+        ]
+        if reminders:
+            await session.execute(sa.insert(Notification), reminders)
+        return True
@@ -4,6 +4,7 @@ from typing import Any
 import uuid
 from zoneinfo import ZoneInfo
 
+from aiogram import Bot
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -12,7 +13,7 @@ from app.infrastructure.database.models.notification import (
     Notification,
     NotificationStatus,
 )
-from app.infrastructure.database.models.users import BotConfig, User
+from app.infrastructure.database.models.users import User
 from app.log import log
 
 from .factory import NotificationFactory
@@ -24,7 +25,6 @@ class NotificationService:
     def __init__(self, session_factory):
         """Initialize notification service with database session factory."""
         self.session_factory = session_factory
-        self._bot_cache = {}  # Cache: customer_id -> Bot
 
     async def send_booking_24h(self, notification: Notification) -> bool:
         """Send 24-hour booking reminder notification."""
@@ -65,7 +65,6 @@ class NotificationService:
             if not customer_id:
                 await self._mark_as_failed(
                     notification,
-                    session,
                     "Could not determine customer for notification",
                 )
                 if not external_session:
@@ -73,11 +72,10 @@ class NotificationService:
                 return False
 
             # Get bot for customer
-            bot = await self._get_bot_for_customer(customer_id, session)
+            bot = self._get_bot_for_customer(customer_id)
             if not bot:
                 await self._mark_as_failed(
                     notification,
-                    session,
                     f"Bot not found for customer {customer_id}",
                 )
                 if not external_session:
@@ -89,7 +87,6 @@ class NotificationService:
             if not booking:
                 await self._mark_as_failed(
                     notification,
-                    session,
                     "Booking data not loaded",
                 )
                 if not external_session:
@@ -130,7 +127,7 @@ class NotificationService:
                     text_detail=f"Error sending notification {notification.id}: {e}",
                     exception=e,
                 )
-                await self._mark_as_failed(notification, session, str(e))
+                await self._mark_as_failed(notification, str(e))
                 if not external_session:
                     await session.commit()
                 return False
@@ -154,7 +151,7 @@ class NotificationService:
     async def _get_customer_for_notification(
         self,
         notification: Notification,
-    ) -> str | None:
+    ) -> uuid.UUID | None:
         """Get customer ID for notification's booking resource."""
         try:
             if not notification.booking or not notification.booking.resource_obj:
@@ -164,7 +161,7 @@ class NotificationService:
             if not resource.customer_id:
                 return None
 
-            return str(resource.customer_id)
+            return resource.customer_id
 
         except Exception as e:  # noqa: BLE001
             log(
@@ -176,110 +173,23 @@ class NotificationService:
             )
             return None
 
-    async def _get_bot_for_customer(  # noqa: PLR0911
-        self,
-        customer_id_str: str,
-        session: AsyncSession,
-    ) -> Any | None:
-        """Get bot for customer from DB with caching."""
-        # Check cache
-        if customer_id_str in self._bot_cache:
-            return self._bot_cache[customer_id_str]
-
-        try:
-            # Convert string to UUID
-            try:
-                customer_id_uuid = uuid.UUID(customer_id_str)
-            except ValueError:
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Invalid UUID format for: {customer_id_str}",
-                )
-                return None
-
-            # Find bot for this customer: get id and token
-            stmt = (
-                sa.select(BotConfig.id, BotConfig.token)
-                .where(
-                    BotConfig.owner_id == customer_id_uuid,
-                )
-                .limit(1)
-            )
-
-            row = await session.execute(stmt)
-            res = row.first()
-            if not res:
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"BotConfig not found for customer {customer_id_str}",
-                )
-                return None
-
-            bot_id, bot_token = res[0], res[1]
-
-            # Try to get bot from BotManager
-            bot = bot_manager.bots.get(bot_id)
-            if bot:
-                self._bot_cache[customer_id_str] = bot
-                log(
-                    level="debug",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Bot for customer {customer_id_str} obtained from BotManager",  # noqa: E501
-                )
-                return bot
+    def _get_bot_for_customer(self, customer_id: uuid.UUID) -> Bot | None:
+        """
+        Get the running bot of a customer from BotManager.
 
-            if not bot_token:
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Bot token not found for customer {customer_id_str}",
-                )
-                return None
-
-            try:
-                await bot_manager.start_bot(bot_id, bot_token)
-                bot = bot_manager.bots.get(bot_id)
-                if bot:
-                    self._bot_cache[customer_id_str] = bot
-                    log(
-                        level="debug",
-                        method="_get_bot_for_customer",
-                        path="NotificationService",
-                        text_detail=f"Customer Bot {customer_id_str} registered",
-                    )
-                    return bot
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Failed to get bot {customer_id_str}",
-                )
-                return None
-            except Exception as e:  # noqa: BLE001
-                log(
-                    level="error",
-                    method="_get_bot_for_customer",
-                    path="NotificationService",
-                    text_detail=f"Error starting bot BotManager{customer_id_str}: {e}",
-                    exception=e,
-                )
-                return None
-
-        except Exception as e:  # noqa: BLE001
+        Bots and their HTTP sessions are owned by BotManager, so this never
+        queries the DB or starts polling; a customer whose bot is not running
+        gets None and the notification is marked as failed.
+        """
+        bot = bot_manager.get_customer_bot(customer_id)
+        if bot is None:
             log(
                 level="error",
                 method="_get_bot_for_customer",
                 path="NotificationService",
-                text_detail=f"Error getting bot for customer {customer_id_str}: {e}",
-                exception=e,
+                text_detail=f"No running bot for customer {customer_id}",
             )
-            return None
+        return bot
 
     async def _send_telegram_message(self, bot: Any, user_id: str, message: str):
         """Send message via Telegram."""
@@ -317,18 +227,3 @@ class NotificationService:
         notification.status = NotificationStatus.FAILED
         notification.error = error
         notification.processed_at = datetime.now(ZoneInfo("UTC"))
-
-    async def clear_bot_cache(self):
-        """Clear cached bot sessions."""
-        for bot in self._bot_cache.values():
-            try:
-                await bot.session.close()
-            except Exception as e:  # noqa: BLE001
-                log(
-                    level="error",
-                    method="clear_bot_cache",
-                    path="NotificationService",
-                    text_detail=f"Error closing bot session: {e}",
-                    exception=e,
-                )
-        self._bot_cache.clear()
@@ -7,6 +7,8 @@ from uuid import UUID
 import sqlalchemy as sa
 
 from app.depends import AsyncSession, provider
+from app.domain.services.bookings.intervals import levels, occupancy
+from app.domain.services.bookings.recurrence import load_recurring_busy
 from app.infrastructure.database import Booking
 from app.infrastructure.database.models.booking import Resource
 from app.infrastructure.database.models.users import (
@@ -26,20 +28,33 @@ class FreeSlotsParams:
     slot: int
 
 
-def _merge_intervals(
-    intervals: list[tuple[datetime, datetime]],
-) -> list[tuple[datetime, datetime]]:
-    if not intervals:
-        return []
-    intervals = sorted(intervals, key=lambda x: x[0])
-    merged: list[tuple[datetime, datetime]] = [intervals[0]]
-    for start, end in intervals[1:]:
-        last_start, last_end = merged[-1]
-        if start <= last_end:
-            merged[-1] = (last_start, max(last_end, end))
-        else:
-            merged.append((start, end))
-    return merged
+@dataclass(frozen=True)
+class FreeSlot:
+    """Slot with fewer bookings than capacity; remaining is seats left."""
+
+    start: datetime
+    end: datetime
+    remaining: int
+
+
+@dataclass(frozen=True)
+class ResourceStats:
+    """Booking statistics of one resource over [start, end)."""
+
+    start: datetime
+    end: datetime
+    bookings: int
+    users: int
+    booked_seconds: float
+    avg_duration_seconds: float | None
+    avg_lead_time_seconds: float | None
+    capacity: int = 1
+
+    @property
+    def utilization(self) -> float:
+        """Share of the period's seat time covered by bookings."""
+        period = (self.end - self.start).total_seconds()
+        return self.booked_seconds / (period * self.capacity)
 
 
 class ResourceService:
@@ -120,6 +135,7 @@ class ResourceService:
         current_user: User,
         name: str,
         customer_id: UUID | None = None,
+        capacity: int = 1,
         session: AsyncSession | None = None,
     ) -> Resource | None:
         """Create a new resource for a customer.
@@ -143,13 +159,13 @@ class ResourceService:
         ):
             return None
 
-        resource = Resource(customer_id=customer_id, name=name)
+        resource = Resource(customer_id=customer_id, name=name, capacity=capacity)
         session.add(resource)
         await session.flush()
         await session.refresh(resource)
         return resource
 
-    @provider.inject_session
+    @provider.inject_session(readonly=True)
     async def get_resources_for_customer(
         self,
         current_user: User,
@@ -216,9 +232,14 @@ class ResourceService:
         resource_id: int,
         current_user: User,
         name: str | None = None,
+        capacity: int | None = None,
         session: AsyncSession | None = None,
     ) -> Resource | None:
-        """Update resource with permission check."""
+        """Update resource with permission check.
+
+        Lowering capacity does not touch existing bookings, it only limits
+        new ones.
+        """
         resource = await self.get_resource(
             resource_id=resource_id,
             current_user=current_user,
@@ -229,6 +250,8 @@ class ResourceService:
 
         if name is not None:
             resource.name = name
+        if capacity is not None:
+            resource.capacity = capacity
 
         await session.flush()
         await session.refresh(resource)
@@ -256,15 +279,20 @@ class ResourceService:
         await session.delete(resource)
         return True
 
-    @provider.inject_session
+    @provider.inject_session(readonly=True)
     async def get_free_slots(
         self,
         resource_id: int,
         current_user: User,
         params: FreeSlotsParams,
         session: AsyncSession | None = None,
-    ) -> list[tuple[datetime, datetime]] | None:
-        """Return list of free slots (start,end) for given interval and slot size.
+    ) -> list[FreeSlot] | None:
+        """Return free slots for given interval and slot size.
+
+        A slot is free while fewer bookings than the resource's capacity
+        overlap it; each slot reports the seats left for its whole duration.
+        Bookings and recurring occurrences are loaded once and counted with
+        a sweep line, then slots are cut in one pass over the counts.
 
         Returns None if resource not found or access denied (multitenancy).
         Raises ValueError for invalid params.
@@ -301,43 +329,114 @@ class ResourceService:
             return None
 
         # Load bookings that overlap requested interval (SQL does the filtering)
-        stmt = sa.select(Booking).where(
+        stmt = sa.select(Booking.start_time, Booking.end_time).where(
             sa.and_(
                 Booking.resource_id == resource_id,
                 Booking.start_time < end,
                 Booking.end_time > start,
             ),
         )
-        result = await session.scalars(stmt)
-        bookings = list(result.all())
+        bookings = [tuple(row) for row in await session.execute(stmt)]
 
-        busy = _merge_intervals(
-            [
-                (max(b.start_time, effective_start), min(b.end_time, end))
-                for b in bookings
-            ],
+        recurring_busy = await load_recurring_busy(
+            resource_id,
+            effective_start,
+            end,
+            session,
         )
+        profile = occupancy(bookings + recurring_busy)
+        capacity = resource.capacity
 
-        # Build free intervals (gaps between busy intervals)
-        free_intervals: list[tuple[datetime, datetime]] = []
-        cursor = effective_start
-        for b_start, b_end in busy:
-            if cursor < b_start:
-                free_intervals.append((cursor, b_start))
-            cursor = max(cursor, b_end)
-        if cursor < end:
-            free_intervals.append((cursor, end))
-
-        # Split free intervals into fixed-size slots
+        # Cut fixed-size slots from each run of time with seats left; a slot
+        # gets the fewest seats left among the pieces it covers
         slot_delta = timedelta(seconds=slot)
-        free_slots: list[tuple[datetime, datetime]] = []
-        for free_start, free_end in free_intervals:
-            t = free_start
-            while t + slot_delta <= free_end:
-                free_slots.append((t, t + slot_delta))
+        free_slots: list[FreeSlot] = []
+        t: datetime | None = None
+        remaining = capacity
+        for piece_start, piece_end, count in levels(profile, effective_start, end):
+            if count >= capacity:
+                t = None
+                continue
+            if t is None:
+                t, remaining = piece_start, capacity
+            remaining = min(remaining, capacity - count)
+            while t + slot_delta <= piece_end:
+                free_slots.append(FreeSlot(t, t + slot_delta, remaining))
                 t = t + slot_delta
+                remaining = capacity - count if t < piece_end else capacity
 
         return free_slots
 
+    @provider.inject_session(readonly=True)
+    async def get_resource_stats(
+        self,
+        resource_id: int,
+        current_user: User,
+        start: datetime,
+        end: datetime,
+        session: AsyncSession | None = None,
+    ) -> ResourceStats | None:
+        """Aggregate bookings overlapping [start, end) in a single query.
+
+        Per-resource numbers are served from the database rather than metric
+        labels to keep Prometheus cardinality bounded. Booked time is clipped
+        to the period. Returns None if resource not found or access denied.
+        """
+        if start.tzinfo is None or end.tzinfo is None:
+            msg = "start and end must be timezone-aware datetimes"
+            raise ValueError(msg)
+        if end <= start:
+            msg = "end must be after start"
+            raise ValueError(msg)
+        if (end - start) > timedelta(days=366):
+            msg = "period must not exceed 366 days"
+            raise ValueError(msg)
+
+        resource = await self.get_resource(
+            resource_id=resource_id,
+            current_user=current_user,
+            session=session,
+        )
+        if resource is None:
+            return None
+
+        def seconds(interval):
+            return sa.func.extract("epoch", interval)
+
+        stmt = sa.select(
+            sa.func.count(),
+            sa.func.count(sa.distinct(Booking.user_id)),
+            sa.func.coalesce(
+                sa.func.sum(
+                    seconds(
+                        sa.func.least(Booking.end_time, end)
+                        - sa.func.greatest(Booking.start_time, start),
+                    ),
+                ),
+                0,
+            ),
+            sa.func.avg(seconds(Booking.end_time - Booking.start_time)),
+            sa.func.avg(seconds(Booking.start_time - Booking.created_at)),
+        ).where(
+            sa.and_(
+                Booking.resource_id == resource_id,
+                Booking.start_time < end,
+                Booking.end_time > start,
+            ),
+        )
+        bookings, users, booked, avg_duration, avg_lead = (
+            await session.execute(stmt)
+        ).one()
+        return ResourceStats(
+            start=start,
+            end=end,
+            bookings=bookings,
+            users=users,
+            booked_seconds=float(booked),
+            avg_duration_seconds=None if avg_duration is None else float(avg_duration),
+            avg_lead_time_seconds=None if avg_lead is None else float(avg_lead),
+            capacity=resource.capacity,
+        )
+
 
 resource_service = ResourceService()
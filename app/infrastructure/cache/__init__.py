@@ -0,0 +1,4 @@
+from .cache import Cache, cache_backend, cached
+from .local import MISSING, LocalCache
+
+__all__ = ["MISSING", "Cache", "LocalCache", "cache_backend", "cached"]
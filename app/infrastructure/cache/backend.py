@@ -0,0 +1,142 @@
+"""
+Redis tier of the caches and invalidation between workers.
+
+Values live under ``<prefix>:<cache>:<key>``. Deleting a key publishes
+``{"cache", "key", "origin"}`` on ``<prefix>:invalidate``; every worker drops
+the key from its local tier (``key`` is null for a whole cache). Messages
+sent while a worker is disconnected are lost, so its local tiers are cleared
+whenever the subscription is (re)established.
+"""
+
+import asyncio
+from collections.abc import Callable
+import contextlib
+import json
+import uuid
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from app.log import log
+
+# Lets a worker skip its own messages, its local tier is already up to date
+WORKER_ID = uuid.uuid4().hex
+RECONNECT_DELAY = 1.0
+PUBSUB_HEALTH_CHECK_INTERVAL = 30
+
+
+class RedisBackend:
+    """Shared Redis client and the invalidation subscriber of one process."""
+
+    def __init__(self, dsn: str | None, prefix: str, timeout: float):
+        self.dsn = dsn
+        self.prefix = prefix
+        self.timeout = timeout
+        self.channel = f"{prefix}:invalidate"
+        self._client: redis.Redis | None = None
+        self._listener: asyncio.Task | None = None
+        # cache name -> callback evicting a key (None for all) locally
+        self._evictors: dict[str, Callable[[str | None], None]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.dsn is not None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.Redis.from_url(
+                self.dsn,
+                socket_timeout=self.timeout,
+                socket_connect_timeout=self.timeout,
+            )
+        return self._client
+
+    def register(self, name: str, evict: Callable[[str | None], None]) -> None:
+        if name in self._evictors:
+            msg = f"Cache {name!r} is already registered"
+            raise ValueError(msg)
+        self._evictors[name] = evict
+
+    def key(self, name: str, key: str) -> str:
+        return f"{self.prefix}:{name}:{key}"
+
+    async def get(self, name: str, key: str) -> bytes | None:
+        return await self.client.get(self.key(name, key))
+
+    async def set(self, name: str, key: str, data: bytes, ttl: float) -> None:
+        await self.client.set(self.key(name, key), data, px=max(int(ttl * 1000), 1))
+
+    async def delete(self, name: str, key: str) -> None:
+        await self.client.delete(self.key(name, key))
+        await self.publish(name, key)
+
+    async def clear(self, name: str) -> None:
+        keys = [k async for k in self.client.scan_iter(match=self.key(name, "*"))]
+        if keys:
+            await self.client.unlink(*keys)
+        await self.publish(name, None)
+
+    async def publish(self, name: str, key: str | None) -> None:
+        message = json.dumps({"cache": name, "key": key, "origin": WORKER_ID})
+        await self.client.publish(self.channel, message)
+
+    async def start(self) -> None:
+        """Subscribe to invalidations; a no-op without CACHE_REDIS_DSN."""
+        if self.enabled and self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _listen(self) -> None:
+        # Separate connection without socket_timeout: reads block until a
+        # message arrives, dead connections are found by health checks
+        subscriber = redis.Redis.from_url(
+            self.dsn,
+            health_check_interval=PUBSUB_HEALTH_CHECK_INTERVAL,
+        )
+        try:
+            while True:
+                try:
+                    await self._consume(subscriber)
+                except (RedisError, OSError) as e:
+                    log(
+                        level="WARN",
+                        method="cache_invalidation",
+                        path="RedisBackend",
+                        text_detail=f"Invalidation channel lost: {e}",
+                        exception=e,
+                    )
+                await asyncio.sleep(RECONNECT_DELAY)
+        finally:
+            await subscriber.aclose()
+
+    async def _consume(self, subscriber: redis.Redis) -> None:
+        async with subscriber.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(self.channel)
+            self._evict_all()
+            async for message in pubsub.listen():
+                self._on_message(message["data"])
+
+    def _on_message(self, data: bytes) -> None:
+        try:
+            message = json.loads(data)
+        except ValueError:
+            return
+        if message.get("origin") == WORKER_ID:
+            return
+        evict = self._evictors.get(message.get("cache"))
+        if evict is not None:
+            evict(message.get("key"))
+
+    def _evict_all(self) -> None:
+        for evict in self._evictors.values():
+            evict(None)
@@ -0,0 +1,214 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+import functools
+import inspect
+import pickle
+import time
+from typing import Any
+
+from redis.exceptions import RedisError
+
+from app.config import config
+from app.log import log
+from app.metrics.cache import (
+    cache_errors_total,
+    cache_load_seconds,
+    cache_requests_total,
+)
+
+from .backend import RedisBackend
+from .local import MISSING, LocalCache
+
+cache_backend = RedisBackend(
+    config.cache.CACHE_REDIS_DSN,
+    config.cache.CACHE_KEY_PREFIX,
+    config.cache.CACHE_REDIS_TIMEOUT,
+)
+
+# Arguments left out of keys built by @cached
+_SKIPPED_ARGUMENTS = frozenset({"self", "cls", "session"})
+
+
+class Cache:
+    """
+    Two-tier cache: an in-process LRU in front of Redis.
+
+    get_or_load() answers from the local tier, then from Redis, and runs the
+    loader only when both miss; concurrent misses of one key in a process
+    share a single loader call. Values go to Redis pickled, with their expiry,
+    so a local copy never outlives the shared one. Without CACHE_REDIS_DSN,
+    or while Redis fails, the cache works as a local one.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl: float | None = None,
+        maxsize: int | None = None,
+        backend: RedisBackend = cache_backend,
+    ):
+        self.name = name
+        self.ttl = ttl if ttl is not None else config.cache.CACHE_DEFAULT_TTL
+        self.local = LocalCache(maxsize or config.cache.CACHE_LOCAL_MAXSIZE)
+        self.backend = backend
+        self._loading: dict[str, asyncio.Future] = {}
+        # Bumped by every invalidation; values loaded across one are not stored
+        self._generation = 0
+        backend.register(name, self._evict)
+
+    async def get(self, key: str) -> Any:
+        """Return the cached value or MISSING."""
+        value = self.local.get(key)
+        if value is not MISSING:
+            self._count("local")
+            return value
+        value = await self._get_shared(key)
+        self._count("miss" if value is MISSING else "shared")
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = ttl if ttl is not None else self.ttl
+        self.local.set(key, value, ttl)
+        if not self.backend.enabled:
+            return
+        data = pickle.dumps((time.time() + ttl, value))
+        try:
+            await self.backend.set(self.name, key, data, ttl)
+        except (RedisError, OSError) as e:
+            self._error("set", e)
+
+    async def delete(self, key: str) -> None:
+        """Drop the key here, in Redis and in the local tier of every worker."""
+        self._evict(key)
+        if not self.backend.enabled:
+            return
+        try:
+            await self.backend.delete(self.name, key)
+        except (RedisError, OSError) as e:
+            self._error("delete", e)
+
+    async def clear(self) -> None:
+        self._evict(None)
+        if not self.backend.enabled:
+            return
+        try:
+            await self.backend.clear(self.name)
+        except (RedisError, OSError) as e:
+            self._error("clear", e)
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable]) -> Any:
+        """Return the cached value, calling loader once on a miss."""
+        value = self.local.get(key)
+        if value is not MISSING:
+            self._count("local")
+            return value
+
+        pending = self._loading.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load(key, loader))
+            self._loading[key] = pending
+            pending.add_done_callback(functools.partial(self._loaded, key))
+        else:
+            self._count("coalesced")
+        # A cancelled caller must not cancel the load others are waiting for
+        return await asyncio.shield(pending)
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable]) -> Any:
+        value = await self._get_shared(key)
+        if value is not MISSING:
+            self._count("shared")
+            return value
+
+        self._count("miss")
+        generation = self._generation
+        with cache_load_seconds.labels(cache=self.name).time():
+            value = await loader()
+        if generation == self._generation:
+            await self.set(key, value)
+        return value
+
+    def _loaded(self, key: str, future: asyncio.Future) -> None:
+        self._loading.pop(key, None)
+        # Mark the error as retrieved even if every waiter was cancelled
+        if not future.cancelled():
+            future.exception()
+
+    async def _get_shared(self, key: str) -> Any:
+        if not self.backend.enabled:
+            return MISSING
+        try:
+            data = await self.backend.get(self.name, key)
+        except (RedisError, OSError) as e:
+            self._error("get", e)
+            return MISSING
+        if data is None:
+            return MISSING
+        # Only this application writes to the cache keys in Redis
+        expires_at, value = pickle.loads(data)  # noqa: S301
+        self.local.set(key, value, expires_at - time.time())
+        return value
+
+    def _evict(self, key: str | None) -> None:
+        self._generation += 1
+        if key is None:
+            self.local.clear()
+        else:
+            self.local.delete(key)
+
+    def _count(self, result: str) -> None:
+        cache_requests_total.labels(cache=self.name, result=result).inc()
+
+    def _error(self, operation: str, error: Exception) -> None:
+        cache_errors_total.labels(cache=self.name, operation=operation).inc()
+        log(
+            level="WARN",
+            method=f"cache_{operation}",
+            path=self.name,
+            text_detail=f"Redis error, using local tier only: {error}",
+        )
+
+
+def cached(
+    name: str,
+    *,
+    ttl: float | None = None,
+    maxsize: int | None = None,
+):
+    """
+    Cache results of an async function in a Cache called ``name``.
+
+    The key joins str() of the arguments (defaults applied) except self, cls
+    and session. The wrapper exposes ``cache`` and ``invalidate(*args,
+    **kwargs)``, called with the same arguments as the function (including
+    self for methods).
+    """
+
+    def decorator(func):
+        cache = Cache(name, ttl=ttl, maxsize=maxsize)
+        signature = inspect.signature(func)
+
+        def make_key(*args, **kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return ":".join(
+                str(value)
+                for arg, value in bound.arguments.items()
+                if arg not in _SKIPPED_ARGUMENTS
+            )
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await cache.get_or_load(
+                make_key(*args, **kwargs),
+                lambda: func(*args, **kwargs),
+            )
+
+        async def invalidate(*args, **kwargs) -> None:
+            await cache.delete(make_key(*args, **kwargs))
+
+        wrapper.cache = cache
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
@@ -0,0 +1,49 @@
+from collections import OrderedDict
+import time
+from typing import Any
+
+# Returned for absent keys, so that None can be cached
+MISSING = object()
+
+
+class LocalCache:
+    """
+    In-process LRU with per-entry expiry.
+
+    Not thread-safe; it is only used from the event loop. Expired entries are
+    dropped when they are read or pushed out by newer ones.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        # key -> (expires_at on the monotonic clock, value)
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """Return the value, or ``default`` if it is absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
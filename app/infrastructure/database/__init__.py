@@ -7,6 +7,7 @@ from .models import (
     CustomerMember,
     Feedback,
     Notification,
+    RecurringBooking,
     Resource,
     User,
     UserBot,
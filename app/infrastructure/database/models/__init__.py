@@ -1,4 +1,4 @@
-from .booking import Booking, Resource
+from .booking import Booking, RecurringBooking, Resource
 from .feedback import Feedback
 from .notification import Notification, NotificationStatus, NotificationType
 from .shared import Base
@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 import uuid as uuid_lib
 
@@ -26,6 +27,10 @@ class Resource(Base, CreatedMixin):
         UUID,
         sa.ForeignKey("customers.id", ondelete="CASCADE"),
     )
+    # Bookings that may overlap at any moment, e.g. desks in a zone
+    capacity: so.Mapped[int] = so.mapped_column(default=1, server_default="1")
+
+    __table_args__ = (sa.CheckConstraint("capacity >= 1", name="capacity_positive"),)
 
 
 class Booking(BaseWithDt):
@@ -47,6 +52,11 @@ class Booking(BaseWithDt):
     end_time: so.Mapped[sa.DateTime] = so.mapped_column(
         sa.DateTime(timezone=True),
     )
+    recurring_id: so.Mapped[int | None] = so.mapped_column(
+        sa.ForeignKey("recurring_bookings.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
 
     notifications: so.Mapped[list["Notification"]] = so.relationship(
         "Notification",
@@ -59,3 +69,42 @@ class Booking(BaseWithDt):
         backref="bookings",
         lazy="select",
     )
+
+    __table_args__ = (
+        sa.Index("ix__bookings__user_id_start_time", "user_id", "start_time"),
+    )
+
+
+class RecurringBooking(BaseWithDt):
+    """Repeating booking stored once as an RRULE-style rule.
+
+    Occurrences up to materialized_until exist as Booking rows; later ones
+    are expanded from the rule on demand.
+    """
+
+    __tablename__ = "recurring_bookings"
+
+    id: so.Mapped[int] = so.mapped_column(
+        primary_key=True,
+    )
+    resource_id: so.Mapped[int] = so.mapped_column(
+        sa.ForeignKey("resources.id", ondelete="CASCADE"),
+        index=True,
+    )
+    user_id: so.Mapped[uuid_lib.UUID] = so.mapped_column(
+        UUID,
+        sa.ForeignKey("users.id", ondelete="CASCADE"),
+    )
+    dtstart: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+    )
+    duration: so.Mapped[timedelta] = so.mapped_column(sa.Interval)
+    rule: so.Mapped[str] = so.mapped_column(sa.String(255))
+    timezone: so.Mapped[str] = so.mapped_column(sa.String(64), default="UTC")
+    ends_at: so.Mapped[datetime | None] = so.mapped_column(
+        sa.DateTime(timezone=True),
+        nullable=True,
+    )
+    materialized_until: so.Mapped[datetime] = so.mapped_column(
+        sa.DateTime(timezone=True),
+    )
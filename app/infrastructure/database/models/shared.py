@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cache
 
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -19,18 +20,111 @@ convention = {
 }
 
 
+def _param(key: str) -> str:
+    # Prefixed so that names never clash with column names in VALUES / SET
+    return f"p_{key}"
+
+
+def _params(kwargs: dict) -> dict:
+    return {_param(k): v for k, v in kwargs.items() if v is not None}
+
+
+def _condition_keys(kwargs: dict) -> tuple[tuple[str, bool], ...]:
+    """Cache key of filter kwargs; None values compile to IS NULL."""
+    return tuple((k, v is None) for k, v in kwargs.items())
+
+
 class Base(AsyncAttrs, DeclarativeBase):
+    """
+    Declarative base with CRUD helpers.
+
+    The helpers build each statement once per model and set of keyword
+    names and run it with bound parameters, so repeated calls skip
+    statement construction and always hit SQLAlchemy's compiled cache and
+    asyncpg's prepared statement cache.
+    """
+
     __abstract__ = True
     _primary_key_name = "id"
 
     metadata = sa.MetaData(naming_convention=convention)
 
+    @classmethod
+    def _pk(cls):
+        return getattr(cls, cls._primary_key_name)
+
+    @classmethod
+    @cache
+    def _select_by_pk(cls) -> sa.Select:
+        return sa.select(cls).where(cls._pk() == sa.bindparam(_param("pk")))
+
+    @classmethod
+    @cache
+    def _select_by_pk_list(cls) -> sa.Select:
+        return sa.select(cls).where(
+            cls._pk().in_(sa.bindparam(_param("pk"), expanding=True)),
+        )
+
+    @classmethod
+    @cache
+    def _select_all(cls) -> sa.Select:
+        return sa.select(cls)
+
+    @classmethod
+    @cache
+    def _select_where(cls, keys: tuple[tuple[str, bool], ...]) -> sa.Select:
+        conditions = [
+            getattr(cls, k).is_(None)
+            if is_null
+            else getattr(cls, k) == sa.bindparam(_param(k))
+            for k, is_null in keys
+        ]
+        return sa.select(cls).where(sa.and_(*conditions))
+
+    @classmethod
+    @cache
+    def _insert(cls, keys: tuple[str, ...]) -> sa.Insert:
+        return (
+            pg_insert(cls)
+            .values({k: sa.bindparam(_param(k)) for k in keys})
+            .returning(cls)
+        )
+
+    @classmethod
+    @cache
+    def _update_by_pk(cls, keys: tuple[str, ...]) -> sa.Update:
+        return (
+            sa.update(cls)
+            .where(cls._pk() == sa.bindparam(_param("pk")))
+            .values({k: sa.bindparam(_param(k)) for k in keys})
+            .returning(cls)
+            # Refresh an instance the session already holds instead of
+            # returning it with the old values
+            .execution_options(populate_existing=True)
+        )
+
+    @classmethod
+    @cache
+    def _upsert(cls, keys: tuple[str, ...]) -> sa.Insert:
+        values = {k: sa.bindparam(_param(k)) for k in keys}
+        return (
+            pg_insert(cls)
+            .values(values)
+            .on_conflict_do_update(index_elements=[cls._primary_key_name], set_=values)
+            .returning(cls)
+            .execution_options(populate_existing=True)
+        )
+
+    @classmethod
+    @cache
+    def _delete_by_pk(cls) -> sa.Delete:
+        return sa.delete(cls).where(cls._pk() == sa.bindparam(_param("pk")))
+
     @classmethod
     @provider.inject_session
     async def get(cls, id: int, session: AsyncSession = None):  # noqa: A002
         """Get one record by primary key"""
-        stmt = sa.select(cls).where(getattr(cls, cls._primary_key_name) == id)
-        return await session.scalar(stmt)
+        return await session.scalar(cls._select_by_pk(), {_param("pk"): id})
 
     @classmethod
     @provider.inject_session
@@ -40,41 +134,38 @@ class Base(AsyncAttrs, DeclarativeBase):
         session: AsyncSession = None,
     ) -> list[any]:
         """Get multiple records by primary key list"""
-        stmt = sa.select(cls).where(
-            getattr(cls, cls._primary_key_name).in_(id_list),
+        result = await session.scalars(
+            cls._select_by_pk_list(),
+            {_param("pk"): list(id_list)},
         )
-        result = await session.scalars(stmt)
         return result.all()
 
     @classmethod
     @provider.inject_session
     async def get_all(cls, session: AsyncSession = None):
         """Get all records"""
-        stmt = sa.select(cls)
-        return await session.scalars(stmt)
+        return await session.scalars(cls._select_all())
 
     @classmethod
     @provider.inject_session
     async def get_all_by(cls, session: AsyncSession = None, **kwargs):
         """Get all records based on the conditions"""
-        conditions = [getattr(cls, k) == v for k, v in kwargs.items()]
-        stmt = sa.select(cls).where(sa.and_(*conditions))
-        return await session.scalars(stmt)
+        stmt = cls._select_where(_condition_keys(kwargs))
+        return await session.scalars(stmt, _params(kwargs))
 
     @classmethod
     @provider.inject_session
     async def get_by(cls, session: AsyncSession = None, **kwargs):
         """Get one record based on the conditions"""
-        conditions = [getattr(cls, k) == v for k, v in kwargs.items()]
-        stmt = sa.select(cls).where(sa.and_(*conditions))
-        return await session.scalar(stmt)
+        stmt = cls._select_where(_condition_keys(kwargs))
+        return await session.scalar(stmt, _params(kwargs))
 
     @classmethod
     @provider.inject_session
     async def create(cls, session: AsyncSession = None, **kwargs):
         """Create a record with the return of the created object"""
-        stmt = pg_insert(cls).values(kwargs).returning(cls)
-        return await session.scalar(stmt)
+        stmt = cls._insert(tuple(kwargs))
+        return await session.scalar(stmt, {_param(k): v for k, v in kwargs.items()})
 
     @classmethod
     @provider.inject_session
@@ -85,13 +176,10 @@ class Base(AsyncAttrs, DeclarativeBase):
         **kwargs,
     ):
         """Updating a record with the return of the updated object"""
-        stmt = (
-            sa.update(cls)
-            .where(getattr(cls, cls._primary_key_name) == id)
-            .values(kwargs)
-            .returning(cls)
-        )
-        return await session.scalar(stmt)
+        stmt = cls._update_by_pk(tuple(kwargs))
+        params = {_param(k): v for k, v in kwargs.items()}
+        params[_param("pk")] = id
+        return await session.scalar(stmt, params)
 
     @classmethod
     @provider.inject_session
@@ -103,20 +191,14 @@ class Base(AsyncAttrs, DeclarativeBase):
     ):
         """Update or create a record with one UPSERT query"""
         kwargs[cls._primary_key_name] = id
-        stmt = (
-            pg_insert(cls)
-            .values(kwargs)
-            .on_conflict_do_update(index_elements=[cls._primary_key_name], set_=kwargs)
-            .returning(cls)
-        )
-        return await session.scalar(stmt)
+        stmt = cls._upsert(tuple(kwargs))
+        return await session.scalar(stmt, {_param(k): v for k, v in kwargs.items()})
 
     @classmethod
     @provider.inject_session
     async def delete(cls, id: str | int, session: AsyncSession = None) -> None:  # noqa: A002
         """Delete a record"""
-        stmt = sa.delete(cls).where(getattr(cls, cls._primary_key_name) == id)
-        await session.provider.inject_session(stmt)
+        await session.execute(cls._delete_by_pk(), {_param("pk"): id})
 
     def to_dict(self) -> dict[str, any]:
         """Convert object to dictionary"""
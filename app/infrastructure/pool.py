@@ -0,0 +1,80 @@
+"""
+Connection pool with metrics and a cheap liveness check.
+
+pool_pre_ping costs a round trip on every checkout. Here only connections
+that sat idle in the pool for longer than DB_POOL_PING_IDLE_SECONDS are
+pinged: a connection returned a moment ago is almost certainly alive, and
+if it is not, SQLAlchemy detects the disconnect on first use and
+invalidates the whole pool anyway.
+"""
+
+import time
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.metrics.db import (
+    db_pool_checked_out,
+    db_pool_checkout_seconds,
+    db_pool_overflow,
+    db_pool_size,
+)
+
+_CHECKED_IN_AT = "checked_in_at"
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Default asyncio pool recording checkout wait time and usage gauges."""
+
+    # Value of the "pool" label; a class attribute so that pools recreated
+    # after dispose keep it
+    pool_name = "primary"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        db_pool_size.labels(pool=self.pool_name).set(self.size())
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_seconds.labels(pool=self.pool_name).observe(
+                time.perf_counter() - start,
+            )
+            self._update_gauges()
+
+    def _do_return_conn(self, record):
+        super()._do_return_conn(record)
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        db_pool_checked_out.labels(pool=self.pool_name).set(self.checkedout())
+        # overflow() is negative while the pool itself is not full
+        db_pool_overflow.labels(pool=self.pool_name).set(max(0, self.overflow()))
+
+
+class ReplicaAsyncQueuePool(InstrumentedAsyncQueuePool):
+    """Pool of the read replica engine."""
+
+    pool_name = "replica"
+
+
+def ping_idle_connections(engine: Engine, idle_seconds: float) -> None:
+    """Ping connections idle for longer than idle_seconds on checkout."""
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):  # noqa: ARG001
+        connection_record.info[_CHECKED_IN_AT] = time.monotonic()
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):  # noqa: ARG001
+        checked_in_at = connection_record.info.get(_CHECKED_IN_AT)
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as err:
+            # The pool drops the connection and retries with a new one
+            raise DisconnectionError from err
@@ -1,10 +1,22 @@
-import contextlib
+"""
+Structured JSON logs.
+
+``log`` only collects fields and puts the record on a queue; a QueueListener
+thread serializes it and writes it out, so the event loop never waits for
+JSON encoding, stream writes or reading source files.
+"""
+
+import atexit
 import datetime
+import json
+import linecache
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import random
+from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from pydantic import BaseModel, Field, computed_field
-
 from app.config import config
 
 MSK_ZONE = ZoneInfo("Europe/Moscow")
@@ -16,82 +28,102 @@ def strip_filename(name: str):
 
 def get_error_source(error: Exception):
     """
-    Get the line of code where the error occurred
+    Get the place in our code where the error occurred.
+
+    Only walks the traceback; the source line itself is read later by the
+    log listener thread (see _with_source).
     """
     try:
-        exc_traceback = error.__traceback__
-
-        if exc_traceback is None:
-            return None
-
-        tb = exc_traceback
+        tb = error.__traceback__
         while tb is not None:
-            frame = tb.tb_frame
-            filename = frame.f_code.co_filename
+            filename = tb.tb_frame.f_code.co_filename
             if (
                 "site-packages" not in filename
                 and "lib/python" not in filename
                 and "<" not in filename
                 and "logs.py" not in filename
             ):
-                line_no = tb.tb_lineno
-                try:
-                    with open(filename, encoding="utf-8") as f:
-                        lines = f.readlines()
-                        if line_no - 1 < len(lines):
-                            source_line = lines[line_no - 1].strip()
-                            return {
-                                "error": str(error),
-                                "filename": f"{strip_filename(filename)}:{line_no}",
-                                "source": source_line,
-                            }
-                except Exception:  # noqa: BLE001, S110
-                    pass
                 return {
                     "error": str(error),
-                    "filename": f"{strip_filename(filename)}:{line_no}",
-                    "source": "Couldn't read the line",
+                    "filename": filename,
+                    "line_no": tb.tb_lineno,
                 }
-
             tb = tb.tb_next
-
         return None
 
     except Exception:  # noqa: BLE001
         return None
 
 
-class Detail(BaseModel):
-    detail: str | dict
-
-
-class JsonLogSchema(BaseModel):
-    datetime_msk: datetime.datetime
-    level: str
-    method: str
-    path: str
-    bot_id: int | None = None
-    bot_username: str | None = None
-    url: str | None = None
-    ip: str | None = None
-    status: int | None = None
-    size: int | None = None
-    duration: int | None = None
-    raw_detail: str | None = Field(None, exclude=True)
-    text_detail: str | None = Field(None, exclude=True)
-    error: dict | None = None
-    user: dict | None = None
-
-    @computed_field
-    @property
-    def detail(self) -> str | dict | None:
-        if self.raw_detail:
-            try:
-                d = Detail.model_validate_json(self.raw_detail)
-                return d.detail
-            except Exception:  # noqa: BLE001
-                ...
-        return self.text_detail
+def _with_source(error: dict) -> dict:
+    # linecache keeps file contents in memory after the first read
+    source = linecache.getline(error["filename"], error["line_no"]).strip()
+    return {
+        "error": error["error"],
+        "filename": f"{strip_filename(error['filename'])}:{error['line_no']}",
+        "source": source or "Couldn't read the line",
+    }
+
+
+def _detail(raw_detail: str | None, text_detail: str | dict | None):
+    """Use "detail" of a JSON error body if there is one, else text_detail."""
+    if raw_detail:
+        try:
+            detail = json.loads(raw_detail)["detail"]
+        except (ValueError, TypeError, KeyError):
+            pass
+        else:
+            if isinstance(detail, str | dict):
+                return detail
+    return text_detail
+
+
+def _default(value):
+    if isinstance(value, datetime.datetime | datetime.date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return repr(value)
+
+
+class JsonFormatter(logging.Formatter):
+    """Serialize the field dict passed as record.msg into one JSON line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = dict(record.msg)
+        if fields.get("error"):
+            fields["error"] = _with_source(fields["error"])
+        detail = _detail(fields.pop("raw_detail"), fields.pop("text_detail"))
+        if detail is not None:
+            fields["detail"] = detail
+        return json.dumps(
+            {k: v for k, v in fields.items() if v is not None},
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=_default,
+        )
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+_output = logging.StreamHandler()
+_output.setFormatter(JsonFormatter())
+_listener = QueueListener(_queue, _output)
+
+logger = logging.getLogger("app")
+logger.setLevel(logging.INFO)
+logger.addHandler(DeferredQueueHandler(_queue))
+logger.propagate = False
+
+_listener.start()
+# Flush records still in the queue on interpreter exit
+atexit.register(_listener.stop)
 
 
 def log(  # noqa: PLR0913
@@ -105,36 +137,46 @@ def log(  # noqa: PLR0913
     status: int | None = None,
     size: int | None = None,
     duration: int | None = None,
+    request_id: str | None = None,
+    spans: dict | None = None,
     exception: Exception | None = None,
     raw_detail: str | None = None,
     text_detail: str | dict | None = None,
     user: dict | None = None,
 ):
-    error = None
-    if exception is not None:
-        with contextlib.suppress(Exception):
-            error = get_error_source(exception)
-
-    model = JsonLogSchema.model_validate(
+    # Sample successful request logs; errors and non-request logs are kept
+    sample_rate = config.server.LOG_INFO_SAMPLE_RATE
+    if (
+        level == "INFO"
+        and status is not None
+        and sample_rate < 1
+        and random.random() >= sample_rate  # noqa: S311
+    ):
+        return
+
+    error = get_error_source(exception) if exception is not None else None
+
+    # Keys keep the order of the JSON output
+    logger.info(
         {
             "datetime_msk": datetime.datetime.now(tz=MSK_ZONE),
             "level": level,
             "method": method,
             "path": path,
-            "ip": ip,
+            "bot_id": bot_id,
+            "bot_username": bot_username,
             "url": url,
+            "ip": ip,
             "status": status,
             "size": size,
             "duration": duration,
+            "request_id": request_id,
+            "spans": spans,
             "error": error,
+            "user": user,
             "raw_detail": raw_detail,
             "text_detail": text_detail,
-            "user": user,
-            "bot_id": bot_id,
-            "bot_username": bot_username,
         },
     )
-
-    logging.info(model.model_dump_json(exclude_defaults=True, exclude_none=True))
     if config.server.EXCEPT_LOG and exception is not None:
         logging.exception(msg="Error", stack_info=True, stacklevel=1)
@@ -1,5 +1,14 @@
 """Metrics module for business and technical metrics."""
 
 from .business import business_metrics
+from .cache import cache_metrics
+from .db import db_metrics
+from .multiprocess import mark_worker_dead, multiprocess_enabled
 
-__all__ = ["business_metrics"]
+__all__ = [
+    "business_metrics",
+    "cache_metrics",
+    "db_metrics",
+    "mark_worker_dead",
+    "multiprocess_enabled",
+]
@@ -1,30 +1,42 @@
 from prometheus_client import Counter, Histogram
 
+from app.config import config
+
+from .cardinality import BoundedLabel
+
+# Per-resource numbers come from GET /api/resources/{id}/stats instead of
+# labels: customers x resources series would grow without bound.
+customer_label = BoundedLabel(
+    limit=config.metrics.METRICS_CUSTOMER_LIMIT,
+    allowlist=config.metrics.customer_allowlist,
+)
+bot_label = BoundedLabel(limit=config.metrics.METRICS_BOT_LIMIT)
+
 booking_created_total = Counter(
     "booking_created_total",
     "Total number of bookings created",
-    ["source", "customer_id", "resource_id"],
+    ["source", "customer_id"],
 )
 booking_cancelled_total = Counter(
     "booking_cancelled_total",
     "Total number of bookings cancelled",
-    ["source", "customer_id", "resource_id"],
+    ["source", "customer_id"],
 )
 booking_status_changed_total = Counter(
     "booking_status_changed_total",
     "Total number of booking status changes",
-    ["from_status", "to_status", "customer_id", "resource_id"],
+    ["from_status", "to_status", "customer_id"],
 )
 booking_duration_seconds = Histogram(
     "booking_duration_seconds",
     "Duration of bookings in seconds",
-    ["customer_id", "resource_id"],
+    ["customer_id"],
     buckets=[300, 600, 1800, 3600, 7200, 14400, 28800, 86400],
 )
 booking_lead_time_seconds = Histogram(
     "booking_lead_time_seconds",
     "Time between booking creation and start time in seconds",
-    ["customer_id", "resource_id"],
+    ["customer_id"],
     buckets=[60, 300, 900, 1800, 3600, 7200, 14400, 28800, 86400, 172800, 604800],
 )
 bot_messages_total = Counter(
@@ -38,6 +50,12 @@ bot_message_processing_seconds = Histogram(
     ["bot_id", "handler"],
     buckets=[0.1, 0.5, 1.0, 2.0, 5.0, 10.0],
 )
+request_span_seconds = Histogram(
+    "request_span_seconds",
+    "Time spent in a span (e.g. db) per HTTP request",
+    ["span"],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
 business_metrics = [
     booking_created_total,
     booking_cancelled_total,
@@ -46,24 +64,22 @@ business_metrics = [
     booking_lead_time_seconds,
     bot_messages_total,
     bot_message_processing_seconds,
+    request_span_seconds,
 ]
 booking_created_total.labels(
     source="unknown",
     customer_id="unknown",
-    resource_id="unknown",
 )
 booking_cancelled_total.labels(
     source="unknown",
     customer_id="unknown",
-    resource_id="unknown",
 )
 booking_status_changed_total.labels(
     from_status="unknown",
     to_status="unknown",
     customer_id="unknown",
-    resource_id="unknown",
 )
-booking_duration_seconds.labels(customer_id="unknown", resource_id="unknown")
-booking_lead_time_seconds.labels(customer_id="unknown", resource_id="unknown")
+booking_duration_seconds.labels(customer_id="unknown")
+booking_lead_time_seconds.labels(customer_id="unknown")
 bot_messages_total.labels(bot_id="unknown", chat_type="unknown", handler="unknown")
 bot_message_processing_seconds.labels(bot_id="unknown", handler="unknown")
@@ -0,0 +1,19 @@
+from prometheus_client import Counter, Histogram
+
+cache_requests_total = Counter(
+    "cache_requests_total",
+    "Cache lookups by tier that answered: local, shared (Redis) or miss",
+    ["cache", "result"],
+)
+cache_load_seconds = Histogram(
+    "cache_load_seconds",
+    "Time spent computing values on cache misses",
+    ["cache"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+)
+cache_errors_total = Counter(
+    "cache_errors_total",
+    "Failed Redis operations; the cache falls back to the local tier",
+    ["cache", "operation"],
+)
+cache_metrics = [cache_requests_total, cache_load_seconds, cache_errors_total]
@@ -0,0 +1,38 @@
+"""Bounded label values for metrics labelled by tenant-like ids."""
+
+from collections.abc import Iterable
+import threading
+
+OTHER = "other"
+
+
+class BoundedLabel:
+    """
+    Map label values onto at most ``limit`` distinct values plus "other".
+
+    This is a first-seen cap, not top-K retention: values are admitted first
+    come, first served until the limit is reached and reported as "other"
+    afterwards, so the first values seen (early noise included) keep their
+    slots for the life of the process. Values from the allowlist always
+    pass, so list the biggest tenants there. An admitted value is never
+    evicted, so every series it starts stays continuous and the number of
+    series stays bounded; evicting by frequency would start new series and
+    leave the old ones in the registry. With several workers the limit
+    applies per process.
+    """
+
+    def __init__(self, limit: int, allowlist: Iterable[str] = ()):
+        self.limit = limit
+        self._allowlist = frozenset(allowlist)
+        self._admitted: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, value) -> str:
+        value = str(value)
+        if value in self._allowlist or value in self._admitted:
+            return value
+        with self._lock:
+            if len(self._admitted) < self.limit:
+                self._admitted.add(value)
+                return value
+        return OTHER
@@ -0,0 +1,54 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.config import config
+
+from .cardinality import BoundedLabel
+
+# Statements are fingerprinted, so the label set is bounded by the code;
+# the limit only guards against dynamically built SQL
+fingerprint_label = BoundedLabel(limit=config.metrics.METRICS_STATEMENT_LIMIT)
+
+db_query_duration_seconds = Histogram(
+    "db_query_duration_seconds",
+    "Execution time of SQL statements by normalized fingerprint",
+    ["operation", "table", "fingerprint"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+db_pool_checkout_seconds = Histogram(
+    "db_pool_checkout_seconds",
+    "Time spent waiting for a connection from the pool",
+    ["pool"],
+    buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0],
+)
+# Pool gauges are summed over uvicorn workers in multiprocess mode
+db_pool_size = Gauge(
+    "db_pool_size",
+    "Configured number of persistent pool connections",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+db_pool_checked_out = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+db_pool_overflow = Gauge(
+    "db_pool_overflow",
+    "Connections open above the pool size",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+db_slow_queries_total = Counter(
+    "db_slow_queries_total",
+    "SQL statements slower than DB_SLOW_QUERY_MS by calling service method",
+    ["caller"],
+)
+db_metrics = [
+    db_query_duration_seconds,
+    db_pool_checkout_seconds,
+    db_pool_size,
+    db_pool_checked_out,
+    db_pool_overflow,
+    db_slow_queries_total,
+]
@@ -0,0 +1,29 @@
+"""
+prometheus_client multiprocess mode for ``uvicorn --workers N``.
+
+It is switched on by the PROMETHEUS_MULTIPROC_DIR environment variable, which
+must point to an empty directory before the first worker starts (see the
+prod docker-compose entrypoint). Each worker then writes its samples to mmap
+files there, and /metrics (exposed by Instrumentator) merges all of them
+with MultiProcessCollector: counters and histogram buckets are summed per
+label set, so any worker returns the totals of the whole server.
+
+Gauges must be created with a ``multiprocess_mode`` ("livesum", "max", ...)
+to be merged meaningfully.
+"""
+
+import os
+
+from prometheus_client import multiprocess
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def multiprocess_enabled() -> bool:
+    return MULTIPROC_DIR_ENV in os.environ
+
+
+def mark_worker_dead() -> None:
+    """Drop live gauge files of this worker on shutdown."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())
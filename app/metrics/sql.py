@@ -0,0 +1,106 @@
+"""
+SQL statement instrumentation via SQLAlchemy engine events.
+
+Every cursor execution is timed and recorded in db_query_duration_seconds
+under a fingerprint of the statement: literals and bind parameters are
+replaced with "?" and IN lists / multi-row VALUES are collapsed, so the same
+query always maps to the same series. Statements slower than
+DB_SLOW_QUERY_MS are logged together with the service method that ran them.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import re
+import time
+
+from sqlalchemy import Engine, event
+
+from app.config import config
+from app.context import get_request_context, get_service_call
+from app.log import log
+
+from .db import (
+    db_query_duration_seconds,
+    db_slow_queries_total,
+    fingerprint_label,
+)
+
+# Longest statement text written to the slow-query log
+MAX_LOGGED_STATEMENT = 2000
+
+_LITERALS = re.compile(
+    r"'(?:''|[^'])*'"  # strings
+    r"|\$\d+|%\(\w+\)s|\?"  # bind parameters
+    r"|\b\d+(?:\.\d+)?\b",  # numbers
+)
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_REPEATED_LISTS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+_TABLE = re.compile(r"\b(?:FROM|INTO|UPDATE)\s+\"?([\w.]+)", re.IGNORECASE)
+
+
+@dataclass(frozen=True, slots=True)
+class Fingerprint:
+    operation: str
+    table: str
+    digest: str
+    statement: str
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> Fingerprint:
+    """Normalize a statement so that executions of one query share a key."""
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _LITERALS.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    normalized = _REPEATED_LISTS.sub("(...)", normalized)
+    operation = normalized.split(" ", 1)[0].upper() or "UNKNOWN"
+    table = _TABLE.search(normalized)
+    return Fingerprint(
+        operation=operation,
+        table=table.group(1) if table else "",
+        digest=hashlib.sha1(normalized.encode()).hexdigest()[:12],  # noqa: S324
+        statement=normalized,
+    )
+
+
+def _before_cursor_execute(context, **_):
+    context.query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(statement: str, context, **_):
+    elapsed = time.perf_counter() - context.query_started_at
+    fp = fingerprint(statement)
+    db_query_duration_seconds.labels(
+        operation=fp.operation,
+        table=fp.table,
+        fingerprint=fingerprint_label(fp.digest),
+    ).observe(elapsed)
+
+    if elapsed * 1000 >= config.database.DB_SLOW_QUERY_MS:
+        caller = get_service_call() or "unknown"
+        db_slow_queries_total.labels(caller=caller).inc()
+        request = get_request_context()
+        log(
+            level="WARN",
+            method="SLOW_QUERY",
+            path=caller,
+            duration=round(elapsed * 1000),
+            request_id=request.request_id if request else None,
+            text_detail={
+                "fingerprint": fp.digest,
+                "statement": fp.statement[:MAX_LOGGED_STATEMENT],
+            },
+        )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach statement timing to an engine (``AsyncEngine.sync_engine``)."""
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        _before_cursor_execute,
+        named=True,
+    )
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute, named=True)
@@ -2,100 +2,137 @@ import http
 import math
 import time
 
-from fastapi import Request, Response, status
-from starlette.middleware.base import RequestResponseEndpoint
-from starlette.types import Message
+from fastapi import status
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.depends import provider
+from app.config import config
+from app.context import RequestContext, request_context
 from app.log import log
+from app.metrics.business import request_span_seconds
 
 DISABLED_ROUTES = ["/metrics", "/docs", "/openapi.json", "/favicon.ico", "/ping"]
+# Longer client-supplied request ids are cut to keep logs bounded
+MAX_REQUEST_ID = 64
 
 
 class LoggingMiddleware:
-    @staticmethod
-    async def get_protocol(request: Request) -> str:
-        protocol = str(request.scope.get("type", ""))
-        http_version = str(request.scope.get("http_version", ""))
-        return f"{protocol.upper()}/{http_version}"
+    """
+    Pure ASGI middleware logging every HTTP request.
 
-    @staticmethod
-    async def set_body(request: Request, body: bytes) -> None:
-        async def receive() -> Message:
-            return {"type": "http.request", "body": body}
+    Each request runs in its own RequestContext; its id comes from the
+    X-Request-ID header (or is generated) and is returned in the response.
+
+    Status, size and timing are taken from the messages passed to ``send``,
+    so responses (including streamed ones) go to the client untouched. The
+    body is kept only for error responses, up to LOG_ERROR_BODY_LIMIT bytes.
+    """
 
-        request._receive = receive  # noqa: SLF001
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.body_limit = config.server.LOG_ERROR_BODY_LIMIT
 
-    def _get_client_ip(self, request: Request) -> str:
-        if request.headers.get("X-Forwarded-For"):
-            ips = request.headers["X-Forwarded-For"].split(",")
+    @staticmethod
+    def _get_client_ip(scope: Scope) -> str:
+        headers = Headers(scope=scope)
+        if headers.get("X-Forwarded-For"):
+            ips = headers["X-Forwarded-For"].split(",")
             return ips[0].strip()
 
-        if request.headers.get("X-Real-IP"):
-            return request.headers["X-Real-IP"]
+        if headers.get("X-Real-IP"):
+            return headers["X-Real-IP"]
 
-        if request.client:
-            return request.client.host
+        if scope.get("client"):
+            return scope["client"][0]
         return "unknown"
 
-    async def get_body(self, request: Request) -> bytes:
-        body = await request.body()
-        await self.set_body(request, body)
-        return body
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or any(e in scope["path"] for e in DISABLED_ROUTES):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("X-Request-ID", "")[:MAX_REQUEST_ID]
+        with request_context(request_id or None) as ctx:
+            await self._handle(ctx, scope, receive, send)
 
-    async def __call__(
+    async def _handle(
         self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-        *args,  # noqa: ARG002
-        **kwargs,  # noqa: ARG002
-    ):
-        start_time = time.time()
+        ctx: RequestContext,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        start_time = time.perf_counter()
+        status_code = http.HTTPStatus.INTERNAL_SERVER_ERROR.value
+        size = 0
+        error_body = bytearray()
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, size, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-request-id", ctx.request_id.encode()),
+                ]
+            elif message["type"] == "http.response.body":
+                body = message.get("body", b"")
+                size += len(body)
+                if (
+                    status_code >= status.HTTP_400_BAD_REQUEST
+                    and len(error_body) < self.body_limit
+                ):
+                    error_body.extend(body[: self.body_limit - len(error_body)])
+            await send(message)
+
         exception_object = None
+        broken_stream = False
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_wrapper)
         except Exception as ex:  # noqa: BLE001
-            response_body = bytes(http.HTTPStatus.INTERNAL_SERVER_ERROR.phrase.encode())
-            response = Response(
-                content=response_body,
-                status_code=http.HTTPStatus.INTERNAL_SERVER_ERROR.real,
-            )
             exception_object = ex
-            response_headers = {}
-        else:
-            response_headers = dict(response.headers.items())
-            response_body = b""
-            async for chunk in response.body_iterator:
-                response_body += chunk
-            response = Response(
-                content=response_body,
-                status_code=response.status_code,
-                headers=dict(response.headers),
-                media_type=response.media_type,
-            )
-
-        if any(e in request.url.path for e in DISABLED_ROUTES):
-            return response
-
-        duration: int = math.ceil((time.time() - start_time) * 1000)
+            # Too late to replace a response that is already being streamed
+            broken_stream = response_started
+            if not broken_stream:
+                response_body = http.HTTPStatus.INTERNAL_SERVER_ERROR.phrase.encode()
+                await send_wrapper(
+                    {
+                        "type": "http.response.start",
+                        "status": status_code,
+                        "headers": [
+                            (b"content-length", str(len(response_body)).encode()),
+                            (b"content-type", b"text/plain; charset=utf-8"),
+                        ],
+                    },
+                )
+                await send_wrapper(
+                    {"type": "http.response.body", "body": response_body},
+                )
+
+        duration: int = math.ceil((time.perf_counter() - start_time) * 1000)
         if exception_object:
             level = "ERROR"
-        elif response.status_code >= status.HTTP_400_BAD_REQUEST:
+        elif status_code >= status.HTTP_400_BAD_REQUEST:
             level = "WARN"
         else:
             level = "INFO"
-        cu = provider.current_user
+        for name, (_, seconds) in ctx.spans.items():
+            request_span_seconds.labels(span=name).observe(seconds)
         log(
             level=level,
-            method=request.method,
-            path=request.url.path,
-            ip=self._get_client_ip(request),
-            status=response.status_code,
-            size=int(response_headers.get("content-length", 0)),
+            method=scope["method"],
+            path=scope["path"],
+            ip=self._get_client_ip(scope),
+            status=status_code,
+            size=size,
             duration=duration,
+            request_id=ctx.request_id,
+            spans=ctx.spans_ms(),
             exception=exception_object,
-            raw_detail=response_body.decode(errors="ignore"),
-            user=cu.to_dict() if cu else None,
+            raw_detail=error_body.decode(errors="ignore") or None,
+            user=ctx.user.to_dict() if ctx.user else None,
         )
-        provider.set_current_user(user=None)
-        return response
+        if broken_stream:
+            raise exception_object
@@ -10,6 +10,7 @@ from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.domain.services.bookings import recurring_booking_service
 from app.domain.services.feedback.evaluation_notification import (
     EvaluationNotificationService,
 )
@@ -75,6 +76,18 @@ class NotificationScheduler:
             replace_existing=True,
         )
 
+        # Extend recurring bookings up to the rolling horizon
+        self.scheduler.add_job(
+            self._materialize_recurring_bookings_job,
+            trigger=IntervalTrigger(
+                hours=1,
+                start_date=datetime.now(ZoneInfo("UTC")) + timedelta(seconds=20),
+            ),
+            id="materialize_recurring_bookings",
+            name="Materialize recurring bookings",
+            replace_existing=True,
+        )
+
         self.scheduler.start()
         self.is_running = True
         log(
@@ -94,9 +107,6 @@ class NotificationScheduler:
             return
         self.scheduler.shutdown(wait=True)
 
-        # Clear cache
-        await self.notification_service.clear_bot_cache()
-
         self.is_running = False
         log(
             level="info",
@@ -228,6 +238,19 @@ class NotificationScheduler:
                 exception=e,
             )
 
+    async def _materialize_recurring_bookings_job(self):
+        """Job for storing upcoming occurrences of recurring bookings."""
+        try:
+            await recurring_booking_service.materialize_recurring_bookings()
+        except Exception as e:  # noqa: BLE001
+            log(
+                level="error",
+                method="_materialize_recurring_bookings_job",
+                path="NotificationScheduler",
+                text_detail=f"Error in recurring bookings job: {e}",
+                exception=e,
+            )
+
     async def force_check(self) -> dict[str, Any]:
         """Force manual check of pending notifications."""
         try:
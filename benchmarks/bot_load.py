@@ -0,0 +1,332 @@
+"""
+Load test of the client bot flows against the local Bot API stand-in.
+
+Seeds a customer with a bot and --resources resources, starts the Bot API
+stand-in in this process and the application (uvicorn, polling mode) in a
+child one pointed at it with BOT_API_URL. Then --users simulated users go
+through the booking flow concurrently: /start, "📅 Забронировать", a resource
+button, a period (random hour within --days, so users contend for slots),
+confirming the held period and "🗓 Мои бронирования". Prints p50/p99 per
+handler, measured from queuing the update to the bot's reply, and DB queries
+per update from the app's /metrics. Needs a migrated database (POSTGRES_*
+env as for the app).
+
+    python -m benchmarks.bot_load --users 200 --resources 5 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import itertools
+import os
+import random
+import subprocess
+import sys
+import time
+import uuid
+
+import aiohttp
+from prometheus_client.parser import text_string_to_metric_families
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.depends import provider
+from app.infrastructure.database import Booking, BotConfig, Customer, Resource, User
+
+from .fake_telegram import FakeBotApi, Reply
+from .pool_size import percentile
+
+BOT_ID = 7_000_000_001
+ADMIN_BOT_ID = 7_000_000_000
+OWNER_TLG_ID = 499_999_999
+FIRST_USER_TLG_ID = 500_000_000
+CUSTOMER_ID = uuid.uuid5(uuid.NAMESPACE_URL, "booking-bot-load-test")
+APP_START_TIMEOUT = 60.0
+
+
+@dataclass
+class Stats:
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    errors: dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    created: int = 0
+    conflicts: int = 0
+
+
+async def seed(resources: int) -> None:
+    """Owner, customer, bot and resources; old load-test bookings are removed."""
+    async with provider.session_scope() as session:
+        owner_id = await session.scalar(
+            pg_insert(User)
+            .values(tlg_id=OWNER_TLG_ID, first_name="Load test owner")
+            .on_conflict_do_update(
+                index_elements=["tlg_id"],
+                set_={"tlg_id": OWNER_TLG_ID},
+            )
+            .returning(User.id),
+        )
+        await session.execute(
+            pg_insert(Customer)
+            .values(id=CUSTOMER_ID, name="Load test", owner_id=owner_id)
+            .on_conflict_do_nothing(),
+        )
+        await session.execute(
+            pg_insert(BotConfig)
+            .values(
+                id=BOT_ID,
+                token=f"{BOT_ID}:load-test",
+                username=f"bot{BOT_ID}",
+                name="Load test bot",
+                owner_id=CUSTOMER_ID,
+            )
+            .on_conflict_do_nothing(),
+        )
+        existing = await session.scalar(
+            sa.select(sa.func.count())
+            .select_from(Resource)
+            .where(Resource.customer_id == CUSTOMER_ID),
+        )
+        session.add_all(
+            Resource(name=f"Load room {i + 1}", customer_id=CUSTOMER_ID)
+            for i in range(existing, resources)
+        )
+        await session.execute(
+            sa.delete(Booking).where(
+                Booking.resource_id.in_(
+                    sa.select(Resource.id).where(Resource.customer_id == CUSTOMER_ID),
+                ),
+            ),
+        )
+    await provider.engine.dispose()
+
+
+def start_app(api_url: str, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "BOT_API_URL": api_url,
+        "USE_WEBHOOK": "false",
+        "ADMINBOT_ID": str(ADMIN_BOT_ID),
+        "ADMINBOT_TOKEN": f"{ADMIN_BOT_ID}:load-test",
+    }
+    return subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "error",
+        ],
+        env=env,
+    )
+
+
+async def db_queries(http: aiohttp.ClientSession, base: str) -> float:
+    async with http.get(f"{base}/metrics") as response:
+        text = await response.text()
+    return sum(
+        sample.value
+        for family in text_string_to_metric_families(text)
+        if family.name == "db_query_duration_seconds"
+        for sample in family.samples
+        if sample.name.endswith("_count")
+    )
+
+
+class SimulatedUser:
+    """One simulated Telegram user talking to the bot."""
+
+    def __init__(self, api: FakeBotApi, tlg_id: int, stats: Stats, timeout: float):
+        self.api = api
+        self.tlg_id = tlg_id
+        self.stats = stats
+        self.timeout = timeout
+        self.user = {"id": tlg_id, "is_bot": False, "first_name": f"User {tlg_id}"}
+        self._message_ids = itertools.count(1)
+
+    async def step(self, handler: str, update: dict, reply: str):
+        """Send an update and wait for the reply of the handler."""
+        start = time.perf_counter()
+        self.api.push_update(BOT_ID, update)
+        try:
+            answer = await self.api.next_reply(self.tlg_id, reply, self.timeout)
+        except TimeoutError:
+            self.stats.errors[handler] += 1
+            return None
+        self.stats.latencies[handler].append(answer.at - start)
+        return answer
+
+    def message(self, text: str) -> dict:
+        message = {
+            "message_id": next(self._message_ids),
+            "date": int(time.time()),
+            "chat": {"id": self.tlg_id, "type": "private"},
+            "from": self.user,
+            "text": text,
+        }
+        if text.startswith("/"):
+            message["entities"] = [
+                {"type": "bot_command", "offset": 0, "length": len(text)},
+            ]
+        return {"message": message}
+
+    def callback(self, data: str, message_id: int) -> dict:
+        return {
+            "callback_query": {
+                "id": uuid.uuid4().hex,
+                "from": self.user,
+                "chat_instance": str(self.tlg_id),
+                "data": data,
+                "message": {
+                    "message_id": message_id,
+                    "date": int(time.time()),
+                    "chat": {"id": self.tlg_id, "type": "private"},
+                    "text": "",
+                },
+            },
+        }
+
+    @staticmethod
+    def buttons(reply: Reply, prefix: str) -> list[str]:
+        """Callback data of the reply's inline buttons starting with prefix."""
+        return [
+            button["callback_data"]
+            for row in (reply.reply_markup or {}).get("inline_keyboard", [])
+            for button in row
+            if button.get("callback_data", "").startswith(prefix)
+        ]
+
+    async def book(self, rng: random.Random, days: int) -> None:
+        if not await self.step("start_handler", self.message("/start"), "sendMessage"):
+            return
+        answer = await self.step(
+            "start_booking",
+            self.message("📅 Забронировать"),
+            "sendMessage",
+        )
+        if answer is None:
+            return
+        buttons = self.buttons(answer, "booking:resource:")
+        if not buttons:
+            self.stats.errors["start_booking"] += 1
+            return
+        if not await self.step(
+            "pick_resource",
+            self.callback(rng.choice(buttons), message_id=1),
+            "editMessageText",
+        ):
+            return
+
+        day = datetime.now(UTC).date() + timedelta(days=rng.randint(1, days))
+        hour = rng.randint(8, 19)
+        period = f"{day:%d.%m.%Y} {hour:02}:00-{hour + 1:02}:00"
+        answer = await self.step("receive_period", self.message(period), "sendMessage")
+        # A free period is held and has to be confirmed
+        confirm = self.buttons(answer, "booking:confirm:") if answer else []
+        if confirm:
+            answer = await self.step(
+                "confirm_booking",
+                self.callback(confirm[0], message_id=1),
+                "editMessageText",
+            )
+        if answer is not None:
+            if "успешно" in answer.data.get("text", ""):
+                self.stats.created += 1
+            else:
+                self.stats.conflicts += 1
+        await self.step(
+            "my_bookings",
+            self.message("🗓 Мои бронирования"),
+            "sendMessage",
+        )
+
+
+async def wait_polling(api: FakeBotApi, app: subprocess.Popen) -> None:
+    deadline = time.perf_counter() + APP_START_TIMEOUT
+    while BOT_ID not in api.polling:
+        if app.poll() is not None:
+            msg = f"Application exited with code {app.returncode}"
+            raise RuntimeError(msg)
+        if time.perf_counter() > deadline:
+            msg = "Bot did not start polling"
+            raise RuntimeError(msg)
+        await asyncio.sleep(0.2)
+
+
+async def run(args) -> None:
+    await seed(args.resources)
+    api = FakeBotApi(
+        latency=args.latency_ms / 1000,
+        rate_limit=args.rate_limit,
+        seed=0,
+    )
+    api_url = await api.start(port=args.api_port)
+    app = start_app(api_url, args.app_port)
+    app_url = f"http://127.0.0.1:{args.app_port}"
+    stats = Stats()
+    try:
+        await wait_polling(api, app)
+        async with aiohttp.ClientSession() as http:
+            queries_before = await db_queries(http, app_url)
+            rng = random.Random(0)  # noqa: S311
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def simulate(i: int) -> None:
+                user = SimulatedUser(api, FIRST_USER_TLG_ID + i, stats, args.timeout)
+                async with semaphore:
+                    await user.book(rng, args.days)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(simulate(i) for i in range(args.users)))
+            elapsed = time.perf_counter() - start
+            queries = await db_queries(http, app_url) - queries_before
+    finally:
+        app.terminate()
+        app.wait()
+        await api.stop()
+
+    report(args, stats, elapsed, queries, api)
+
+
+def report(args, stats: Stats, elapsed: float, queries: float, api) -> None:
+    updates = sum(len(v) for v in stats.latencies.values()) + sum(
+        stats.errors.values(),
+    )
+    print(  # noqa: T201
+        f"{'handler':<16} {'updates':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}",
+    )
+    for handler, latencies in stats.latencies.items():
+        print(  # noqa: T201
+            f"{handler:<16} {len(latencies):>8} "
+            f"{percentile(latencies, 50) * 1000:>8.1f} "
+            f"{percentile(latencies, 99) * 1000:>8.1f} "
+            f"{stats.errors[handler]:>7}",
+        )
+    print(  # noqa: T201
+        f"\n{args.users} users in {elapsed:.1f} s, {updates / elapsed:.0f} updates/s; "
+        f"bookings created {stats.created}, conflicts {stats.conflicts}; "
+        f"429 answers {api.rate_limited}; "
+        f"DB queries per update {queries / max(updates, 1):.1f}",
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--resources", type=int, default=5)
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--api-port", type=int, default=8081)
+    parser.add_argument("--app-port", type=int, default=8090)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+HTTP connections and time of sending messages from many bots.
+
+Sends a notification-like load to the local Bot API stand-in (run in its
+own process): messages from random bots with limited concurrency. "per_bot"
+gives every bot its own AiohttpSession (aiogram's default), "shared" uses
+one SharedAiohttpSession for all of them. Every connection opened costs a
+TLS handshake against api.telegram.org; --tls serves the stand-in over HTTPS
+with a self-signed certificate to include that cost.
+
+    python -m benchmarks.bot_sessions --bots 100 --messages 2000 --tls
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import ssl
+import tempfile
+import time
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+import aiohttp
+
+from app.bot.session import SharedAiohttpSession
+
+from .fake_telegram import self_signed_cert, serve
+
+HOST = "127.0.0.1"
+
+
+def trust(session: AiohttpSession, client_tls: ssl.SSLContext | None):
+    if client_tls is not None:
+        session._connector_init["ssl"] = client_tls  # noqa: SLF001
+    return session
+
+
+def per_bot(count: int, server: TelegramAPIServer, client_tls) -> list[Bot]:
+    return [
+        Bot(
+            token=f"{i + 1}:token",
+            session=trust(AiohttpSession(api=server), client_tls),
+        )
+        for i in range(count)
+    ]
+
+
+def shared(count: int, server: TelegramAPIServer, client_tls) -> list[Bot]:
+    session = trust(SharedAiohttpSession(api=server), client_tls)
+    return [Bot(token=f"{i + 1}:token", session=session) for i in range(count)]
+
+
+async def connections_seen(base: str, client_tls) -> int:
+    async with (
+        aiohttp.ClientSession() as http,
+        http.get(f"{base}/stats", ssl=client_tls) as response,
+    ):
+        return (await response.json())["connections"]
+
+
+async def wait_started(base: str, client_tls) -> None:
+    for _ in range(100):
+        try:
+            await connections_seen(base, client_tls)
+        except aiohttp.ClientError:
+            await asyncio.sleep(0.1)
+        else:
+            return
+    msg = "Bot API stand-in did not start"
+    raise RuntimeError(msg)
+
+
+async def run(variant, args, base: str, client_tls) -> tuple[float, int]:
+    bots = variant(args.bots, TelegramAPIServer.from_base(base), client_tls)
+    rng = random.Random(0)  # noqa: S311
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def send(bot: Bot) -> None:
+        async with semaphore:
+            await bot.send_message(chat_id=1, text="Reminder")
+
+    opened = await connections_seen(base, client_tls)
+    start = time.perf_counter()
+    await asyncio.gather(*(send(rng.choice(bots)) for _ in range(args.messages)))
+    elapsed = time.perf_counter() - start
+    opened = await connections_seen(base, client_tls) - opened
+
+    await asyncio.gather(
+        *(AiohttpSession.close(session) for session in {bot.session for bot in bots}),
+    )
+    return elapsed, opened
+
+
+async def compare(args, base: str, client_tls) -> None:
+    await wait_started(base, client_tls)
+    print(f"{'session':<8} {'seconds':>8} {'msg/s':>8} {'connections':>12}")  # noqa: T201
+    for name, variant in (("per_bot", per_bot), ("shared", shared)):
+        # Best of --repeat rounds; connections are the same in every round
+        elapsed, opened = min(
+            [await run(variant, args, base, client_tls) for _ in range(args.repeat)],
+        )
+        print(  # noqa: T201
+            f"{name:<8} {elapsed:>8.2f} {args.messages / elapsed:>8.0f} {opened:>12}",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bots", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--tls", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key, client_tls = None, None, None
+        if args.tls:
+            cert, key = self_signed_cert(directory)
+            client_tls = ssl.create_default_context(cafile=cert)
+        server = multiprocessing.get_context("spawn").Process(
+            target=serve,
+            args=(HOST, args.port, args.latency_ms / 1000, cert, key),
+            daemon=True,
+        )
+        server.start()
+        scheme = "https" if args.tls else "http"
+        try:
+            asyncio.run(compare(args, f"{scheme}://{HOST}:{args.port}", client_tls))
+        finally:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Local stand-in for the Telegram Bot API.
+
+Answers ``POST /bot<token>/<method>`` like api.telegram.org would, so the
+bots can run without the network. Implemented: getMe, getUpdates (long
+polling), sendMessage, editMessageText, answerCallbackQuery, setWebhook and
+deleteWebhook; other methods return ``true``. Every call waits --latency-ms,
+and a --rate-limit share of message calls gets 429 with retry_after.
+
+Updates for the bots are queued with ``POST /_updates/<bot_id>`` (or
+FakeBotApi.push_update in process); replies of the bots are kept per chat
+for FakeBotApi.next_reply. ``GET /stats`` returns requests per method and
+the number of client TCP connections. Point the app at it with
+``BOT_API_URL=http://127.0.0.1:8081``.
+
+    python -m benchmarks.fake_telegram --port 8081 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+import itertools
+import json
+import random
+import ssl
+import subprocess
+import time
+
+from aiohttp import web
+
+# Methods answering a user; only they are rate limited
+REPLY_METHODS = frozenset({"sendmessage", "editmessagetext", "answercallbackquery"})
+
+
+@dataclass
+class Reply:
+    """A call of a bot answering a chat."""
+
+    method: str
+    chat_id: int
+    data: dict
+    at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def reply_markup(self) -> dict | None:
+        markup = self.data.get("reply_markup")
+        return json.loads(markup) if markup else None
+
+
+@dataclass
+class _BotState:
+    updates: list[dict] = field(default_factory=list)
+    arrived: asyncio.Event = field(default_factory=asyncio.Event)
+    update_ids: itertools.count = field(default_factory=lambda: itertools.count(1))
+    webhook: str | None = None
+
+
+class FakeBotApi:
+    """aiohttp application imitating the Bot API methods used by the bots."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit: float = 0.0,
+        retry_after: int = 1,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.requests: dict[str, int] = defaultdict(int)
+        self.rate_limited = 0
+        # (host, port) of every client connection seen
+        self.connections: set[tuple] = set()
+        # Bots that called getUpdates at least once
+        self.polling: set[int] = set()
+        self._bots: dict[int, _BotState] = defaultdict(_BotState)
+        self._replies: dict[int, asyncio.Queue[Reply]] = defaultdict(asyncio.Queue)
+        # callback query id -> chat, answerCallbackQuery has no chat_id
+        self._callback_chats: dict[str, int] = {}
+        self._message_ids = itertools.count(1)
+        self._random = random.Random(seed)  # noqa: S311
+        self.app = web.Application()
+        self.app.router.add_post("/bot{token}/{method}", self.handle)
+        self.app.router.add_post("/_updates/{bot_id}", self.post_update)
+        self.app.router.add_get("/stats", self.stats)
+
+    def push_update(self, bot_id: int, update: dict) -> int:
+        """Queue an update (without update_id) for a bot; returns its id."""
+        state = self._bots[bot_id]
+        update = {"update_id": next(state.update_ids), **update}
+        if "callback_query" in update:
+            query = update["callback_query"]
+            self._callback_chats[query["id"]] = query["from"]["id"]
+        state.updates.append(update)
+        state.arrived.set()
+        return update["update_id"]
+
+    async def next_reply(self, chat_id: int, method: str, timeout: float) -> Reply:
+        """Wait for the next call of ``method`` answering the chat."""
+        replies = self._replies[chat_id]
+        async with asyncio.timeout(timeout):
+            while True:
+                reply = await replies.get()
+                if reply.method == method.lower():
+                    return reply
+
+    async def handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"].lower()
+        self.requests[method] += 1
+        self.connections.add(request.transport.get_extra_info("peername"))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        data = dict(await request.post())
+        bot_id = int(request.match_info["token"].split(":", 1)[0])
+        if method in REPLY_METHODS and self._random.random() < self.rate_limit:
+            self.rate_limited += 1
+            return web.json_response(
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": f"Too Many Requests: retry after {self.retry_after}",
+                    "parameters": {"retry_after": self.retry_after},
+                },
+                status=429,
+            )
+        handler = getattr(self, f"_{method}", None)
+        result = await handler(bot_id, data) if handler else True
+        return web.json_response({"ok": True, "result": result})
+
+    async def post_update(self, request: web.Request) -> web.Response:
+        update_id = self.push_update(
+            int(request.match_info["bot_id"]),
+            await request.json(),
+        )
+        return web.json_response({"update_id": update_id})
+
+    async def stats(self, request: web.Request) -> web.Response:  # noqa: ARG002
+        return web.json_response(
+            {
+                "requests": self.requests,
+                "rate_limited": self.rate_limited,
+                "connections": len(self.connections),
+            },
+        )
+
+    async def _getme(self, bot_id: int, data: dict) -> dict:  # noqa: ARG002
+        return self._bot_user(bot_id)
+
+    async def _getupdates(self, bot_id: int, data: dict) -> list[dict]:
+        self.polling.add(bot_id)
+        state = self._bots[bot_id]
+        offset = int(data.get("offset") or 0)
+        # Updates below the offset are confirmed by the bot
+        state.updates = [u for u in state.updates if u["update_id"] >= offset]
+        if not state.updates:
+            state.arrived.clear()
+            try:
+                async with asyncio.timeout(float(data.get("timeout") or 0)):
+                    await state.arrived.wait()
+            except TimeoutError:
+                return []
+        limit = int(data.get("limit") or 100)
+        return state.updates[:limit]
+
+    async def _setwebhook(self, bot_id: int, data: dict) -> bool:
+        self._bots[bot_id].webhook = data["url"]
+        return True
+
+    async def _deletewebhook(self, bot_id: int, data: dict) -> bool:  # noqa: ARG002
+        self._bots[bot_id].webhook = None
+        return True
+
+    async def _sendmessage(self, bot_id: int, data: dict) -> dict:
+        chat_id = int(data["chat_id"])
+        self._reply("sendmessage", chat_id, data)
+        return self._message(bot_id, chat_id, next(self._message_ids), data)
+
+    async def _editmessagetext(self, bot_id: int, data: dict) -> dict:
+        chat_id = int(data["chat_id"])
+        self._reply("editmessagetext", chat_id, data)
+        return self._message(bot_id, chat_id, int(data["message_id"]), data)
+
+    async def _answercallbackquery(self, bot_id: int, data: dict) -> bool:  # noqa: ARG002
+        chat_id = self._callback_chats.pop(data["callback_query_id"], None)
+        if chat_id is not None:
+            self._reply("answercallbackquery", chat_id, data)
+        return True
+
+    def _reply(self, method: str, chat_id: int, data: dict) -> None:
+        self._replies[chat_id].put_nowait(Reply(method, chat_id, data))
+
+    def _bot_user(self, bot_id: int) -> dict:
+        return {
+            "id": bot_id,
+            "is_bot": True,
+            "first_name": f"Bot {bot_id}",
+            "username": f"bot{bot_id}",
+        }
+
+    def _message(self, bot_id: int, chat_id: int, message_id: int, data: dict):
+        return {
+            "message_id": message_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": self._bot_user(bot_id),
+            "text": data.get("text", ""),
+        }
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Serve in the running loop; returns the base URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        host, port = self._runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    async def stop(self) -> None:
+        await self._runner.cleanup()
+
+
+def self_signed_cert(directory: str) -> tuple[str, str]:
+    """Certificate and key files for 127.0.0.1 (needs the openssl CLI)."""
+    cert, key = f"{directory}/cert.pem", f"{directory}/key.pem"
+    subprocess.run(  # noqa: S603
+        [  # noqa: S607
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "ec",
+            "-pkeyopt",
+            "ec_paramgen_curve:prime256v1",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-addext",
+            "subjectAltName=IP:127.0.0.1",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def serve(  # noqa: PLR0913
+    host: str,
+    port: int,
+    latency: float = 0.0,
+    cert: str | None = None,
+    key: str | None = None,
+    *,
+    rate_limit: float = 0.0,
+) -> None:
+    """Run the stand-in until the process is stopped."""
+    ssl_context = None
+    if cert is not None:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(cert, key)
+    web.run_app(
+        FakeBotApi(latency=latency, rate_limit=rate_limit).app,
+        host=host,
+        port=port,
+        ssl_context=ssl_context,
+        access_log=None,
+        print=None,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0)
+    args = parser.parse_args()
+    serve(
+        args.host,
+        args.port,
+        latency=args.latency_ms / 1000,
+        rate_limit=args.rate_limit,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+"""
+End-to-end benchmarks of the booking hot paths, written as JSON.
+
+Seeds a customer with a "contended" resource and a "dense" one holding
+--bookings bookings of the API user, then runs the application (uvicorn,
+bots pointed at the local Bot API stand-in) in a child process and measures
+over HTTP:
+
+- create_contended: POST /api/bookings, --concurrency clients booking random
+  hours out of --slots on one resource; conflicts (400) are expected, and
+  overlapping rows left in the table are reported as ``overlaps``;
+- free_slots: GET /api/resources/{id}/free_slots over --window-days of the
+  dense resource;
+- list_heavy: GET /api/bookings for the user owning all those bookings;
+- notification_batch: after the app stops, --notifications due reminders are
+  sent in process by NotificationScheduler's job (batches of its batch_size)
+  through the stand-in.
+
+Results go to --output (hot_paths-<commit>.json by default) with the commit
+and parameters; --compare prints the change against an earlier file. Needs
+a migrated database (POSTGRES_* env as for the app).
+
+    python -m benchmarks.hot_paths
+    python -m benchmarks.hot_paths --compare hot_paths-<earlier commit>.json
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import json
+from pathlib import Path
+import random
+import subprocess
+import time
+import uuid
+
+from aiogram import Bot
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
+import aiohttp
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import aliased
+
+from app.api.security import compress_token
+from app.bot import bot_manager
+from app.depends import provider
+from app.domain.services.feedback import feedback_service
+from app.domain.services.notification.service import NotificationService
+from app.infrastructure.database import Booking, Customer, Notification, Resource, User
+from app.infrastructure.database.models.notification import (
+    NotificationStatus,
+    NotificationType,
+)
+from app.schedulers.scheduler import NotificationScheduler
+
+from .bot_load import start_app
+from .fake_telegram import FakeBotApi
+from .pool_size import percentile
+
+USER_TLG_ID = 499_999_998
+NOTIFY_BOT_ID = 7_000_000_002
+CUSTOMER_ID = uuid.uuid5(uuid.NAMESPACE_URL, "booking-hot-paths-benchmark")
+APP_START_TIMEOUT = 60.0
+# Metrics compared by --compare; True if higher is better
+COMPARED = {"rps": True, "p50_ms": False, "p99_ms": False}
+
+
+@dataclass
+class Setup:
+    user_id: uuid.UUID
+    token: str
+    contended_id: int
+    dense_id: int
+    # Start of the first hour the benchmark books or queries
+    day: datetime
+
+
+@dataclass
+class Result:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    seconds: float = 0.0
+    extra: dict = field(default_factory=dict)
+
+    def summary(self) -> dict:
+        requests = len(self.latencies) + self.errors
+        return {
+            "requests": requests,
+            "errors": self.errors,
+            "seconds": round(self.seconds, 3),
+            "rps": round(requests / self.seconds, 1) if self.seconds else 0.0,
+            "p50_ms": round(percentile(self.latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(self.latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(self.latencies, 99) * 1000, 2),
+            **self.extra,
+        }
+
+
+async def _resource(session, name: str) -> int:
+    resource_id = await session.scalar(
+        sa.select(Resource.id).where(
+            Resource.customer_id == CUSTOMER_ID,
+            Resource.name == name,
+        ),
+    )
+    if resource_id is None:
+        resource = Resource(name=name, customer_id=CUSTOMER_ID)
+        session.add(resource)
+        await session.flush()
+        resource_id = resource.id
+    return resource_id
+
+
+async def seed(bookings: int) -> Setup:
+    """Benchmark customer and resources with --bookings fresh dense bookings."""
+    day = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+    day += timedelta(days=1)
+    async with provider.session_scope() as session:
+        user_id, api_token = (
+            await session.execute(
+                pg_insert(User)
+                .values(tlg_id=USER_TLG_ID, first_name="Benchmark user")
+                .on_conflict_do_update(
+                    index_elements=["tlg_id"],
+                    set_={"tlg_id": USER_TLG_ID},
+                )
+                .returning(User.id, User.api_token),
+            )
+        ).one()
+        await session.execute(
+            pg_insert(Customer)
+            .values(id=CUSTOMER_ID, name="Benchmark", owner_id=user_id)
+            .on_conflict_do_nothing(),
+        )
+        contended_id = await _resource(session, "Contended room")
+        dense_id = await _resource(session, "Dense room")
+        await session.execute(
+            sa.delete(Booking).where(
+                Booking.resource_id.in_((contended_id, dense_id)),
+            ),
+        )
+        # One hour out of every 90 minutes is booked
+        await session.execute(
+            sa.insert(Booking),
+            [
+                {
+                    "resource_id": dense_id,
+                    "user_id": user_id,
+                    "start_time": day + timedelta(minutes=90 * i),
+                    "end_time": day + timedelta(minutes=90 * i + 60),
+                }
+                for i in range(bookings)
+            ],
+        )
+    return Setup(user_id, compress_token(str(api_token)), contended_id, dense_id, day)
+
+
+async def overlaps(resource_id: int) -> int:
+    """Pairs of overlapping bookings of a resource; must stay 0."""
+    first, second = aliased(Booking), aliased(Booking)
+    async with provider.session_scope(readonly=True) as session:
+        return await session.scalar(
+            sa.select(sa.func.count())
+            .select_from(first)
+            .join(
+                second,
+                sa.and_(
+                    second.resource_id == first.resource_id,
+                    second.id > first.id,
+                    second.start_time < first.end_time,
+                    first.start_time < second.end_time,
+                ),
+            )
+            .where(first.resource_id == resource_id),
+        )
+
+
+async def drive(
+    request: Callable[[int], Awaitable[bool]],
+    count: int,
+    concurrency: int,
+) -> Result:
+    """Run ``request(i)`` count times with limited concurrency."""
+    result = Result()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                ok = await request(i)
+            except aiohttp.ClientError:
+                ok = False
+            if ok:
+                result.latencies.append(time.perf_counter() - start)
+            else:
+                result.errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(count)))
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+async def create_contended(http, base: str, setup: Setup, args) -> Result:
+    rng = random.Random(0)  # noqa: S311
+    outcomes = {"created": 0, "conflicts": 0}
+
+    async def create(i: int) -> bool:  # noqa: ARG001
+        start = setup.day + timedelta(hours=rng.randrange(args.slots))
+        body = {
+            "customer_id": str(CUSTOMER_ID),
+            "resource_id": setup.contended_id,
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(hours=1)).isoformat(),
+        }
+        async with http.post(f"{base}/api/bookings/", json=body) as response:
+            await response.read()
+            if response.status == 200:  # noqa: PLR2004
+                outcomes["created"] += 1
+            elif response.status == 400:  # noqa: PLR2004
+                outcomes["conflicts"] += 1
+            else:
+                return False
+            return True
+
+    result = await drive(create, args.requests, args.concurrency)
+    result.extra = {**outcomes, "overlaps": await overlaps(setup.contended_id)}
+    return result
+
+
+async def free_slots(http, base: str, setup: Setup, args) -> Result:
+    params = {
+        "start": setup.day.isoformat(),
+        "end": (setup.day + timedelta(days=args.window_days)).isoformat(),
+        "slot": 1800,
+    }
+    url = f"{base}/api/resources/{setup.dense_id}/free_slots"
+    slots = 0
+
+    async def get(i: int) -> bool:  # noqa: ARG001
+        nonlocal slots
+        async with http.get(url, params=params) as response:
+            body = await response.json()
+            slots = len(body) if response.status == 200 else slots  # noqa: PLR2004
+            return response.status == 200  # noqa: PLR2004
+
+    await drive(get, args.warmup, args.concurrency)
+    result = await drive(get, args.requests, args.concurrency)
+    result.extra = {"slots": slots}
+    return result
+
+
+async def list_heavy(http, base: str, setup: Setup, args) -> Result:  # noqa: ARG001
+    params = {"customer_id": str(CUSTOMER_ID), "limit": 100}
+
+    async def get(i: int) -> bool:  # noqa: ARG001
+        async with http.get(f"{base}/api/bookings/", params=params) as response:
+            await response.read()
+            return response.status == 200  # noqa: PLR2004
+
+    await drive(get, args.warmup, args.concurrency)
+    return await drive(get, args.requests, args.concurrency)
+
+
+async def notification_batch(api_url: str, setup: Setup, args) -> Result:
+    """Send due reminders for the first dense bookings in process."""
+    async with provider.session_scope() as session:
+        booking_ids = await session.scalars(
+            sa.select(Booking.id)
+            .where(Booking.resource_id == setup.dense_id)
+            .order_by(Booking.start_time)
+            .limit(args.notifications),
+        )
+        due = datetime.now(UTC) - timedelta(minutes=1)
+        await session.execute(
+            sa.insert(Notification),
+            [
+                {
+                    "type": NotificationType.BOOKING_1H,
+                    "status": NotificationStatus.PENDING,
+                    "booking_id": booking_id,
+                    "user_id": setup.user_id,
+                    "scheduled_at": due,
+                }
+                for booking_id in booking_ids
+            ],
+        )
+
+    bot = Bot(
+        token=f"{NOTIFY_BOT_ID}:benchmark",
+        session=AiohttpSession(api=TelegramAPIServer.from_base(api_url)),
+    )
+    bot_manager.bots[NOTIFY_BOT_ID] = bot
+    bot_manager.customer_bots[CUSTOMER_ID] = NOTIFY_BOT_ID
+    scheduler = NotificationScheduler(
+        provider.session_factory,
+        NotificationService(provider.session_factory),
+        feedback_service,
+    )
+    pending = (
+        sa.select(sa.func.count())
+        .select_from(Notification)
+        .join(Booking, Booking.id == Notification.booking_id)
+        .where(
+            Booking.resource_id == setup.dense_id,
+            Notification.status == NotificationStatus.PENDING,
+        )
+    )
+
+    result = Result()
+    start = time.perf_counter()
+    try:
+        # Bounded in case the job stops making progress
+        for _ in range(args.notifications // scheduler.batch_size + 2):
+            async with provider.session_scope(readonly=True) as session:
+                if not await session.scalar(pending):
+                    break
+            batch_start = time.perf_counter()
+            await scheduler._process_notifications_job()  # noqa: SLF001
+            result.latencies.append(time.perf_counter() - batch_start)
+        result.seconds = time.perf_counter() - start
+    finally:
+        await bot.session.close()
+
+    async with provider.session_scope(readonly=True) as session:
+        sent = await session.scalar(
+            sa.select(sa.func.count())
+            .select_from(Notification)
+            .join(Booking, Booking.id == Notification.booking_id)
+            .where(
+                Booking.resource_id == setup.dense_id,
+                Notification.status == NotificationStatus.SENT,
+            ),
+        )
+    result.extra = {
+        "notifications": args.notifications,
+        "sent": sent,
+        "notifications_per_s": round(sent / result.seconds, 1)
+        if result.seconds
+        else 0.0,
+    }
+    return result
+
+
+async def wait_ready(http, base: str, app: subprocess.Popen) -> None:
+    deadline = time.perf_counter() + APP_START_TIMEOUT
+    while True:
+        if app.poll() is not None:
+            msg = f"Application exited with code {app.returncode}"
+            raise RuntimeError(msg)
+        try:
+            async with http.get(f"{base}/api/ping") as response:
+                if response.status == 200:  # noqa: PLR2004
+                    return
+        except aiohttp.ClientError:
+            pass
+        if time.perf_counter() > deadline:
+            msg = "Application did not start"
+            raise RuntimeError(msg)
+        await asyncio.sleep(0.2)
+
+
+async def run(args) -> dict:
+    setup = await seed(args.bookings)
+    api = FakeBotApi()
+    api_url = await api.start(port=args.api_port)
+    base = f"http://127.0.0.1:{args.app_port}"
+    results = {}
+    try:
+        app = start_app(api_url, args.app_port)
+        try:
+            async with aiohttp.ClientSession(
+                headers={"Authorization": f"Bearer {setup.token}"},
+                connector=aiohttp.TCPConnector(limit=args.concurrency),
+            ) as http:
+                await wait_ready(http, base, app)
+                for name, scenario in (
+                    ("create_contended", create_contended),
+                    ("free_slots", free_slots),
+                    ("list_heavy", list_heavy),
+                ):
+                    results[name] = (await scenario(http, base, setup, args)).summary()
+        finally:
+            app.terminate()
+            app.wait()
+        results["notification_batch"] = (
+            await notification_batch(api_url, setup, args)
+        ).summary()
+    finally:
+        await api.stop()
+        await provider.engine.dispose()
+    return results
+
+
+def git_commit() -> str | None:
+    completed = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return completed.stdout.strip() or None
+
+
+def compare(current: dict, previous: dict) -> None:
+    print(  # noqa: T201
+        f"\n{'scenario':<20} {'metric':<8} {'before':>10} {'after':>10} {'change':>8}",
+    )
+    for name, result in current["results"].items():
+        before = previous["results"].get(name)
+        if before is None:
+            continue
+        for metric, higher_is_better in COMPARED.items():
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * 100
+            better = (change > 0) == higher_is_better
+            print(  # noqa: T201
+                f"{name:<20} {metric:<8} {old:>10} {new:>10} {change:>+7.1f}%"
+                f"{'' if abs(change) < 1 else ' better' if better else ' worse'}",
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--slots", type=int, default=24)
+    parser.add_argument("--bookings", type=int, default=5000)
+    parser.add_argument("--window-days", type=int, default=7)
+    parser.add_argument("--notifications", type=int, default=500)
+    parser.add_argument("--api-port", type=int, default=8081)
+    parser.add_argument("--app-port", type=int, default=8090)
+    parser.add_argument("--output", type=Path, help="hot_paths-<commit>.json")
+    parser.add_argument("--compare", type=Path)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    commit = git_commit()
+    report = {
+        "commit": commit,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "parameters": {
+            k: v for k, v in vars(args).items() if k not in {"output", "compare"}
+        },
+        "results": results,
+    }
+    output = args.output or Path(f"hot_paths-{commit or 'unknown'}.json")
+    output.write_text(json.dumps(report, indent=2) + "\n")
+    print(json.dumps(results, indent=2))  # noqa: T201
+    if args.compare is not None:
+        compare(report, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
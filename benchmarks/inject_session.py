@@ -0,0 +1,106 @@
+"""
+Per-call overhead of Provider.inject_session without a database.
+
+The session factory is replaced by a stub, so the numbers show only what the
+decorator adds around a call: the previous asyncio.wait_for wrapper versus
+the asyncio.timeout session scope. Before Python 3.12 wait_for runs the
+call in a separate task; since 3.12 it uses asyncio.timeout itself, so the
+difference there is small.
+
+    python -m benchmarks.inject_session --calls 100000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import platform
+import time
+
+from app.context import service_call, span
+from app.depends import provider
+
+
+class StubSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+def wait_for_inject_session(func):
+    """The decorator as it was before the session scope."""
+    name = func.__qualname__
+
+    async def wrapper(*args, **kwargs):
+        with service_call(name):
+            if "session" not in kwargs:
+                with span("db"):
+                    async with provider.session_factory() as session:
+                        kwargs["session"] = session
+                        try:
+                            res = await asyncio.wait_for(
+                                func(*args, **kwargs),
+                                timeout=20.0,
+                            )
+                            await session.commit()
+                            return res
+                        except Exception:
+                            await session.rollback()
+                            raise
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+async def get(key: int, session=None) -> int:  # noqa: ARG001
+    # Yield to the loop once, as a real query does
+    await asyncio.sleep(0)
+    return key
+
+
+async def measure(func, calls: int, repeat: int = 1) -> float:
+    """Mean time per call in microseconds, best of repeat rounds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for i in range(calls):
+            await func(i)
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+async def run(calls: int, repeat: int) -> None:
+    provider.session_factory = StubSession
+    variants = {
+        "plain call": get,
+        "asyncio.wait_for": wait_for_inject_session(get),
+        "session_scope": provider.inject_session(get),
+    }
+    # Warm up
+    for func in variants.values():
+        await measure(func, min(calls, 1000))
+    baseline = await measure(get, calls, repeat)
+    print(f"Python {platform.python_version()}")  # noqa: T201
+    for name, func in variants.items():
+        per_call = await measure(func, calls, repeat)
+        print(  # noqa: T201
+            f"{name:<18} {per_call:7.2f} us/call  ({per_call - baseline:+.2f} us)",
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.calls, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark of /metrics exposition with per-resource vs per-customer labels.
+
+Fills a fresh registry with booking metrics as the old labelling
+(customer_id, resource_id) and the bounded one (customer_id only, capped by
+BoundedLabel) would, then times generate_latest.
+
+    python -m benchmarks.metrics_scrape --customers 100 --resources 10000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest
+
+from app.metrics.cardinality import BoundedLabel
+
+LEAD_TIME_BUCKETS = (3600, 21600, 86400, 259200, 604800, 2592000)
+
+
+def build_registry(
+    bookings: list[tuple[str, str]],
+    *,
+    per_resource: bool,
+    customer_limit: int,
+) -> CollectorRegistry:
+    registry = CollectorRegistry()
+    labels = ["customer_id", "resource_id"] if per_resource else ["customer_id"]
+    created = Counter(
+        "booking_created_total",
+        "Bookings created",
+        ["source", *labels],
+        registry=registry,
+    )
+    lead_time = Histogram(
+        "booking_lead_time_seconds",
+        "Time from creation to start",
+        labels,
+        buckets=LEAD_TIME_BUCKETS,
+        registry=registry,
+    )
+    customer_label = BoundedLabel(customer_limit)
+    for customer_id, resource_id in bookings:
+        if per_resource:
+            values = {"customer_id": customer_id, "resource_id": resource_id}
+        else:
+            values = {"customer_id": customer_label(customer_id)}
+        created.labels(source="api", **values).inc()
+        lead_time.labels(**values).observe(random.uniform(0, 2592000))  # noqa: S311
+    return registry
+
+
+def time_scrape(registry: CollectorRegistry, rounds: int) -> tuple[float, int]:
+    """Median scrape time in ms and payload size in bytes."""
+    timings = []
+    payload = b""
+    for _ in range(rounds):
+        start = time.perf_counter()
+        payload = generate_latest(registry)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), len(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--customers", type=int, default=100)
+    parser.add_argument("--resources", type=int, default=10_000)
+    parser.add_argument("--customer-limit", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    bookings = [
+        (f"customer-{resource % args.customers}", str(resource))
+        for resource in range(args.resources)
+    ]
+    for per_resource in (True, False):
+        registry = build_registry(
+            bookings,
+            per_resource=per_resource,
+            customer_limit=args.customer_limit,
+        )
+        median_ms, size = time_scrape(registry, args.rounds)
+        name = "customer_id+resource_id" if per_resource else "bounded customer_id"
+        print(  # noqa: T201
+            f"{name:<24} scrape {median_ms:8.2f} ms  payload {size / 1024:9.1f} KiB",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Python-side cost of the Base CRUD helper statements, per call.
+
+Measures what happens before a query reaches asyncpg: building the
+statement, generating its cache key and fetching the compiled form from
+SQLAlchemy's compiled cache. "rebuilt" creates the statement on every call
+as the helpers used to; "cached" reuses the statement built once per model
+and keyword names (the cache key is memoized on the statement object).
+
+    python -m benchmarks.orm_overhead --calls 20000
+"""
+
+import argparse
+import time
+import uuid
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.infrastructure.database import Customer, User
+from app.infrastructure.database.models.shared import _condition_keys
+
+DIALECT = postgresql.asyncpg.dialect()
+
+
+def prepare(stmt, compiled_cache: dict) -> None:
+    """Cache key plus compiled cache lookup, as Connection.execute does."""
+    stmt._compile_w_cache(  # noqa: SLF001
+        DIALECT,
+        compiled_cache=compiled_cache,
+        column_keys=[],
+    )
+
+
+def rebuilt_cases(user_id: uuid.UUID) -> dict:
+    return {
+        "get": lambda: sa.select(User).where(User.id == user_id),
+        "get_by": lambda: sa.select(Customer).where(
+            sa.and_(
+                *[
+                    getattr(Customer, k) == v
+                    for k, v in {"owner_id": user_id, "name": "x"}.items()
+                ],
+            ),
+        ),
+        "create": lambda: (
+            pg_insert(User).values({"tlg_id": 1, "first_name": "a"}).returning(User)
+        ),
+        "update": lambda: (
+            sa.update(User)
+            .where(User.id == user_id)
+            .values({"api_token": user_id})
+            .returning(User)
+        ),
+    }
+
+
+def cached_cases() -> dict:
+    kwargs = {"owner_id": uuid.uuid4(), "name": "x"}
+    return {
+        "get": User._select_by_pk,  # noqa: SLF001
+        "get_by": lambda: Customer._select_where(_condition_keys(kwargs)),  # noqa: SLF001
+        "create": lambda: User._insert(("tlg_id", "first_name")),  # noqa: SLF001
+        "update": lambda: User._update_by_pk(("api_token",)),  # noqa: SLF001
+    }
+
+
+def measure(build, calls: int, repeat: int) -> float:
+    """Best mean time per call in microseconds."""
+    compiled_cache: dict = {}
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            prepare(build(), compiled_cache)
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rebuilt = rebuilt_cases(uuid.uuid4())
+    cached = cached_cases()
+    print(f"{'helper':<8} {'rebuilt us':>11} {'cached us':>10} {'speedup':>8}")  # noqa: T201
+    for name, build in rebuilt.items():
+        before = measure(build, args.calls, args.repeat)
+        after = measure(cached[name], args.calls, args.repeat)
+        print(f"{name:<8} {before:>11.2f} {after:>10.2f} {before / after:>7.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
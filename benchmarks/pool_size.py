@@ -0,0 +1,152 @@
+"""
+Find the connection pool size with the best throughput for N workers.
+
+Starts --workers processes, each with its own async engine (as uvicorn
+workers do) and --concurrency clients that check out a connection, run
+--statement and hold the connection for --hold-ms (time spent in the
+transaction by application code). Every pool size from --pool-sizes is run
+for --duration seconds; throughput, latency percentiles and checkout wait
+are printed, and the smallest size within 5% of the best throughput is
+recommended. Needs a migrated database (POSTGRES_* env as for the app).
+
+    python -m benchmarks.pool_size --workers 4 --pool-sizes 5,10,20,30
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import statistics
+import time
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import config
+
+DEFAULT_STATEMENT = (
+    "SELECT count(*) FROM bookings "
+    "WHERE resource_id = 1 AND start_time < now() + interval '1 day' "
+    "AND end_time > now()"
+)
+# Sizes within this share of the best throughput count as equally good
+THROUGHPUT_TOLERANCE = 0.05
+
+
+@dataclass
+class WorkerResult:
+    queries: int = 0
+    errors: int = 0
+    latencies: list[float] = field(default_factory=list)
+    waits: list[float] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Run:
+    pool_size: int
+    statement: str
+    concurrency: int
+    duration: float
+    hold: float
+
+
+async def _client(engine, run: Run, deadline: float, result: WorkerResult) -> None:
+    statement = sa.text(run.statement)
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            async with engine.connect() as conn:
+                result.waits.append(time.perf_counter() - start)
+                await conn.execute(statement)
+                if run.hold:
+                    await asyncio.sleep(run.hold)
+        except Exception:  # noqa: BLE001
+            result.errors += 1
+            continue
+        result.queries += 1
+        result.latencies.append(time.perf_counter() - start)
+
+
+async def _worker(run: Run) -> WorkerResult:
+    engine = create_async_engine(
+        config.database.database_url,
+        pool_size=run.pool_size,
+        max_overflow=0,
+        pool_timeout=config.database.DB_POOL_TIMEOUT,
+        pool_use_lifo=True,
+    )
+    result = WorkerResult()
+    try:
+        # Open the pool first so connect time is not measured
+        async with engine.connect() as conn:
+            await conn.execute(sa.text("SELECT 1"))
+        deadline = time.perf_counter() + run.duration
+        await asyncio.gather(
+            *(_client(engine, run, deadline, result) for _ in range(run.concurrency)),
+        )
+    finally:
+        await engine.dispose()
+    return result
+
+
+def run_worker(run: Run) -> WorkerResult:
+    return asyncio.run(_worker(run))
+
+
+def percentile(values: list[float], q: int) -> float:
+    if len(values) < 2:  # noqa: PLR2004
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=config.database.WEB_CONCURRENCY)
+    parser.add_argument("--pool-sizes", default="5,10,20,30")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--hold-ms", type=float, default=5.0)
+    parser.add_argument("--statement", default=DEFAULT_STATEMENT)
+    args = parser.parse_args()
+
+    print(  # noqa: T201
+        f"{'pool':>5} {'conns':>6} {'qps':>9} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'wait ms':>8} {'errors':>7}",
+    )
+    throughput: dict[int, float] = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for size in (int(s) for s in args.pool_sizes.split(",")):
+            run = Run(
+                pool_size=size,
+                statement=args.statement,
+                concurrency=args.concurrency,
+                duration=args.duration,
+                hold=args.hold_ms / 1000,
+            )
+            results = list(executor.map(run_worker, [run] * args.workers))
+            latencies = [v for r in results for v in r.latencies]
+            waits = [v for r in results for v in r.waits]
+            throughput[size] = sum(r.queries for r in results) / args.duration
+            print(  # noqa: T201
+                f"{size:>5} {size * args.workers:>6} {throughput[size]:>9.0f} "
+                f"{percentile(latencies, 50) * 1000:>8.2f} "
+                f"{percentile(latencies, 95) * 1000:>8.2f} "
+                f"{percentile(latencies, 99) * 1000:>8.2f} "
+                f"{statistics.fmean(waits) * 1000 if waits else 0:>8.2f} "
+                f"{sum(r.errors for r in results):>7}",
+            )
+
+    best = max(throughput.values())
+    recommended = min(
+        size
+        for size, qps in throughput.items()
+        if qps >= best * (1 - THROUGHPUT_TOLERANCE)
+    )
+    print(  # noqa: T201
+        f"\nRecommended for {args.workers} workers: DB_POOL_SIZE={recommended} "
+        f"(DB_MAX_CONNECTIONS={recommended * args.workers} without overflow)",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Cost of reading a list of bookings as ORM entities vs column projections.
+
+Runs the same query against an in-memory SQLite database with a synchronous
+session, so only SQLAlchemy's result processing is measured: "entities"
+loads Booking objects into the identity map (as the list views used to),
+"views" selects the columns into BookingView. Each variant then builds the
+API response models, as GET /api/bookings does.
+
+    python -m benchmarks.read_path --rows 20 --calls 2000
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+import time
+import tracemalloc
+import uuid
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from app.api.routes.bookings.schema import BookingResponse
+from app.domain.services.bookings import BookingView
+from app.domain.services.bookings.booking import _VIEW_COLUMNS
+from app.infrastructure.database import Booking, Resource
+
+
+def populate(session: Session, rows: int) -> None:
+    # SQLite does not enforce foreign keys, so users and customers are skipped
+    user_id = uuid.uuid4()
+    session.add(Resource(id=1, name="Room", customer_id=uuid.uuid4()))
+    start = datetime.now(timezone.utc)
+    session.add_all(
+        Booking(
+            resource_id=1,
+            user_id=user_id,
+            start_time=start + timedelta(hours=i),
+            end_time=start + timedelta(hours=i + 1),
+        )
+        for i in range(rows)
+    )
+    session.commit()
+
+
+def read_entities(session: Session, limit: int) -> list[BookingResponse]:
+    stmt = (
+        sa.select(Booking, Resource.name)
+        .join(Resource, Resource.id == Booking.resource_id)
+        .limit(limit)
+    )
+    rows = [tuple(row) for row in session.execute(stmt)]
+    responses = [
+        BookingResponse(**booking.to_dict(), resource_name=resource_name)
+        for booking, resource_name in rows
+    ]
+    # Objects stay in the identity map until the session ends
+    session.close()
+    return responses
+
+
+def read_views(session: Session, limit: int) -> list[BookingResponse]:
+    stmt = (
+        sa.select(*_VIEW_COLUMNS, Resource.name)
+        .join(Resource, Resource.id == Booking.resource_id)
+        .limit(limit)
+    )
+    rows = [BookingView(*row) for row in session.execute(stmt)]
+    responses = [BookingResponse.model_validate(view) for view in rows]
+    session.close()
+    return responses
+
+
+def measure(read, session: Session, rows: int, calls: int, repeat: int) -> tuple:
+    """Best mean time per call in microseconds and peak memory in KiB."""
+    read(session, rows)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            read(session, rows)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    read(session, rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best / calls * 1e6, peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        Resource.__table__.create(conn)
+        Booking.__table__.create(conn)
+    session = Session(engine)
+    populate(session, args.rows)
+
+    entities = measure(read_entities, session, args.rows, args.calls, args.repeat)
+    views = measure(read_views, session, args.rows, args.calls, args.repeat)
+    print(f"{'variant':<9} {'us/call':>9} {'peak KiB':>9}")  # noqa: T201
+    for name, (micros, peak) in (("entities", entities), ("views", views)):
+        print(f"{name:<9} {micros:>9.1f} {peak:>9.1f}")  # noqa: T201
+    print(f"speedup   {entities[0] / views[0]:>8.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
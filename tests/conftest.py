@@ -0,0 +1,11 @@
+import os
+
+# app.config validates these on import; the tests never connect anywhere
+for name, value in {
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+    "POSTGRES_DB": "test",
+    "ADMINBOT_TOKEN": "test",
+    "ADMINBOT_ID": "1",
+}.items():
+    os.environ.setdefault(name, value)
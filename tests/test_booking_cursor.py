@@ -0,0 +1,25 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from app.domain.services.bookings import BookingCursor
+
+
+@pytest.mark.parametrize("backward", [False, True])
+def test_round_trip(backward):
+    cursor = BookingCursor(
+        start_time=datetime(2026, 5, 1, 12, 30, 15, 123456, tzinfo=UTC),
+        id=42,
+        backward=backward,
+    )
+
+    assert BookingCursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize(
+    "token",
+    ["", "x1_1", "n", "n1_", "n_1", "nabc_1", "n1_abc", f"n{10**20}_1", "n1.5_1"],
+)
+def test_tampered_cursor_is_rejected(token):
+    with pytest.raises(ValueError, match="Invalid booking cursor"):
+        BookingCursor.decode(token)
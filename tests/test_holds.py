@@ -0,0 +1,52 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+from app.domain.services.bookings.holds import SlotHolds
+from app.infrastructure.cache.backend import RedisBackend
+
+START = datetime.now(UTC).replace(microsecond=0) + timedelta(days=1)
+END = START + timedelta(hours=1)
+
+
+def make_holds() -> SlotHolds:
+    # No DSN: holds are kept in the process (_hold_local)
+    return SlotHolds(RedisBackend(None, "test", 1), ttl=60)
+
+
+def test_bookings_and_holds_share_capacity():
+    holds = make_holds()
+    booked = [(START - timedelta(minutes=30), START + timedelta(minutes=30))]
+
+    async def run():
+        first = await holds.hold(1, uuid4(), START, END, 2, booked=booked)
+        second = await holds.hold(1, uuid4(), START, END, 2, booked=booked)
+        return first, second
+
+    assert asyncio.run(run()) == (True, False)
+
+
+def test_touching_booking_leaves_seat_free():
+    holds = make_holds()
+    booked = [(START - timedelta(hours=1), START)]
+
+    async def run():
+        return await holds.hold(1, uuid4(), START, END, 1, booked=booked)
+
+    assert asyncio.run(run())
+
+
+def test_holder_replaces_own_hold():
+    holds = make_holds()
+    holder = uuid4()
+
+    async def run():
+        await holds.hold(1, holder, START, END)
+        replaced = await holds.hold(1, holder, START, END)
+        other = await holds.hold(1, uuid4(), START, END)
+        return replaced, other, await holds.held(1)
+
+    replaced, other, held = asyncio.run(run())
+    assert replaced
+    assert not other
+    assert held == [(START, END)]
@@ -0,0 +1,67 @@
+from datetime import UTC, datetime, timedelta
+
+from app.domain.services.bookings import has_conflict
+from app.domain.services.bookings.booking import BookingView
+from app.domain.services.bookings.intervals import levels, occupancy, occupy, peak
+
+T0 = datetime(2026, 1, 1, 9, tzinfo=UTC)
+
+
+def at(hours: float) -> datetime:
+    return T0 + timedelta(hours=hours)
+
+
+def booking(start: float, end: float) -> BookingView:
+    return BookingView(
+        id=1,
+        user_id=None,
+        resource_id=1,
+        start_time=at(start),
+        end_time=at(end),
+        created_at=T0,
+    )
+
+
+def test_touching_intervals_do_not_overlap():
+    profile = occupancy([(at(0), at(1)), (at(1), at(2))])
+
+    assert peak(profile, at(0), at(2)) == 1
+    assert peak(profile, at(2), at(3)) == 0
+    assert not has_conflict([booking(0, 1)], at(1), at(2))
+    assert not has_conflict([booking(1, 2)], at(0), at(1))
+    assert has_conflict([booking(0, 1)], at(0.5), at(2))
+
+
+def test_peak_counts_overlaps_at_one_moment():
+    # [0, 2) and [1, 3) overlap only in [1, 2); [2, 4) starts as [0, 2) ends
+    profile = occupancy([(at(0), at(2)), (at(1), at(3)), (at(2), at(4))])
+
+    assert peak(profile, at(0), at(4)) == 2
+    assert peak(profile, at(0), at(1)) == 1
+    assert list(levels(profile, at(0), at(4))) == [
+        (at(0), at(1), 1),
+        (at(1), at(2), 2),
+        (at(2), at(3), 2),
+        (at(3), at(4), 1),
+    ]
+
+
+def test_capacity():
+    bookings = [booking(0, 2), booking(1, 3)]
+
+    assert has_conflict(bookings, at(1), at(2), capacity=2)
+    assert not has_conflict(bookings, at(2), at(3), capacity=2)
+    assert not has_conflict(bookings, at(1), at(2), capacity=3)
+
+
+def test_occupy_matches_rebuilt_profile():
+    intervals = [(at(0), at(2)), (at(1), at(3))]
+    profile = occupancy(intervals)
+
+    occupy(profile, at(1.5), at(4))
+
+    expected = occupancy([*intervals, (at(1.5), at(4))])
+    assert list(levels(profile, at(-1), at(5))) == list(
+        levels(expected, at(-1), at(5)),
+    )
+    assert peak(profile, at(0), at(5)) == 3
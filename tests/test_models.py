@@ -0,0 +1,36 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.infrastructure.database.models.shared import Base
+
+
+class ModelBase(Base):
+    # Own metadata, so the test table stays out of the application's schema
+    __abstract__ = True
+    metadata = sa.MetaData()
+
+
+class Item(ModelBase):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+
+
+def test_update_refreshes_loaded_instance():
+    engine = sa.create_engine("sqlite://")
+    ModelBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Item(id=1, name="old"))
+        session.commit()
+        loaded = session.get(Item, 1)
+        assert loaded.name == "old"
+
+        # What Base.update runs, on a session that already holds the row
+        updated = session.scalar(
+            Item._update_by_pk(("name",)),  # noqa: SLF001
+            {"p_name": "new", "p_pk": 1},
+        )
+
+        assert updated is loaded
+        assert loaded.name == "new"
@@ -0,0 +1,119 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.domain.services.bookings import (
+    BookingRejectReason,
+    RecurringBookingParams,
+    recurring_booking_service,
+    validate_period,
+)
+from app.domain.services.bookings.booking import MAX_BOOKING_DURATION_DAYS
+from app.domain.services.bookings.recurrence import MAX_COUNT, expand, parse_rule
+
+DTSTART = datetime(2026, 3, 2, 10, tzinfo=UTC)  # Monday
+HOUR = timedelta(hours=1)
+FAR = DTSTART + timedelta(days=MAX_BOOKING_DURATION_DAYS)
+
+
+def starts(rule: str, tz: str = "UTC", **kwargs) -> list[datetime]:
+    kwargs.setdefault("start_from", DTSTART)
+    kwargs.setdefault("before", FAR)
+    return [
+        start
+        for start, _ in expand(parse_rule(rule), DTSTART, HOUR, ZoneInfo(tz), **kwargs)
+    ]
+
+
+def test_count():
+    assert starts("FREQ=DAILY;COUNT=3") == [
+        DTSTART,
+        DTSTART + timedelta(days=1),
+        DTSTART + timedelta(days=2),
+    ]
+    assert len(starts("FREQ=WEEKLY;BYDAY=MO,WE,FR;COUNT=7")) == 7
+
+
+def test_count_is_taken_from_dtstart():
+    later = DTSTART + timedelta(days=2)
+
+    assert starts("FREQ=DAILY;COUNT=3", start_from=later) == [later]
+
+
+def test_until_is_inclusive():
+    rule = "FREQ=WEEKLY;INTERVAL=2;UNTIL=20260330T100000Z"
+
+    assert starts(rule) == [
+        DTSTART,
+        DTSTART + timedelta(weeks=2),
+        DTSTART + timedelta(weeks=4),
+    ]
+
+
+def test_open_rule_stops_at_bound():
+    occurrences = starts("FREQ=DAILY")
+
+    assert len(occurrences) == MAX_BOOKING_DURATION_DAYS
+    assert occurrences[-1] < FAR
+
+
+def test_wall_clock_kept_across_dst():
+    tz = ZoneInfo("Europe/Berlin")
+    dtstart = datetime(2026, 3, 27, 10, tzinfo=tz)
+    occurrences = expand(
+        parse_rule("FREQ=DAILY;COUNT=3"),
+        dtstart,
+        HOUR,
+        tz,
+        start_from=dtstart,
+        before=dtstart + timedelta(days=7),
+    )
+
+    assert [start.astimezone(tz).hour for start, _ in occurrences] == [10, 10, 10]
+
+
+@pytest.mark.parametrize(
+    ("rule", "error"),
+    [
+        ("FREQ=MONTHLY", "FREQ must be"),
+        ("FREQ=DAILY;BYDAY=MO", "BYDAY is supported only"),
+        ("FREQ=DAILY;COUNT=2;UNTIL=20260401T000000Z", "COUNT and UNTIL"),
+        (f"FREQ=DAILY;COUNT={MAX_COUNT + 1}", "COUNT must be between"),
+        ("FREQ=DAILY;INTERVAL=0", "INTERVAL must be positive"),
+        ("FREQ=WEEKLY;BYDAY=XX", "Invalid INTERVAL"),
+        ("FREQ=DAILY;BYMONTH=1", "Unsupported rule parts: BYMONTH"),
+    ],
+)
+def test_invalid_rules(rule, error):
+    with pytest.raises(ValueError, match=error):
+        parse_rule(rule)
+
+
+def test_period_bound():
+    now = datetime.now(UTC)
+    limit = now + timedelta(days=MAX_BOOKING_DURATION_DAYS)
+
+    assert validate_period(limit - HOUR, limit, now) is None
+    assert validate_period(limit, limit + HOUR, now) == BookingRejectReason.TOO_FAR
+
+
+def test_series_until_beyond_bound_is_rejected():
+    start = datetime.now(UTC).replace(microsecond=0) + timedelta(days=1)
+    until = start + timedelta(days=MAX_BOOKING_DURATION_DAYS + 1)
+    params = RecurringBookingParams(
+        user_id=uuid4(),
+        customer_id=uuid4(),
+        resource_id=1,
+        start_time=start,
+        end_time=start + HOUR,
+        rule=f"FREQ=WEEKLY;UNTIL={until:%Y%m%dT%H%M%SZ}",
+    )
+
+    # Rejected before the resource is read, so no session is needed
+    with pytest.raises(ValueError, match="UNTIL must be within"):
+        asyncio.run(
+            recurring_booking_service.create_recurring_booking(params, session=None),
+        )